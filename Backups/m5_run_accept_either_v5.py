@@ -1,16 +1,24 @@
 # m5_run_accept_either_v5.py
 #!/usr/bin/env python3
 from __future__ import annotations
-import argparse, json
+import argparse, json, re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+_MMAP_MIN_BYTES = 1 << 20  # below ~1 MiB a buffered read is as cheap as mapping the file
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]")
 
 def _norm(s: str) -> str:
-    return "".join(ch for ch in s.lower() if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", s.lower())
 
-def _pick_any(cols: List[str], patterns: List[str]) -> Optional[str]:
-    norms = {c: _norm(c) for c in cols}
+def _pick_any(norms: Dict[str, str], patterns: List[str]) -> Optional[str]:
+    """`norms` maps column -> _norm(column); build it once per column list."""
     for pat in patterns:
         t = _norm(pat)
         for c, n in norms.items():
@@ -18,14 +26,54 @@ def _pick_any(cols: List[str], patterns: List[str]) -> Optional[str]:
                 return c
     return None
 
-def _read_parquet(p: Path, label: str) -> pd.DataFrame:
+def _schema_names(p: Path, label: str) -> List[str]:
+    """Column names from the parquet footer only (no row groups are read)."""
+    if not p.exists():
+        raise FileNotFoundError(f"[{label}] Missing file: {p.name} in {p.parent}")
+    try:
+        names = pq.ParquetFile(p).schema_arrow.names
+    except Exception as e:
+        raise RuntimeError(f"[{label}] Failed to read schema of {p}: {e}") from e
+    # a pandas index written to parquet is restored as index, never as a column
+    return [str(n) for n in names if not str(n).startswith("__index_level_")]
+
+def _read_table(p: Path, label: str, columns: Optional[List[str]] = None) -> pa.Table:
     if not p.exists():
         raise FileNotFoundError(f"[{label}] Missing file: {p.name} in {p.parent}")
     try:
-        return pd.read_parquet(p)
+        # `columns` projects at the parquet level, so unused column chunks are never decoded.
+        # Large files are memory-mapped so a re-read (validator, then M5) reuses the page cache.
+        source = pa.memory_map(str(p), "r") if p.stat().st_size > _MMAP_MIN_BYTES else p
+        return pq.read_table(source, columns=columns)
     except Exception as e:
         raise RuntimeError(f"[{label}] Failed to read {p}: {e}") from e
 
+def _read_parquet(p: Path, label: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    # split_blocks/self_destruct keep peak RSS low on the Arrow -> pandas conversion
+    return _read_table(p, label, columns).to_pandas(split_blocks=True, self_destruct=True)
+
+def _num(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    """float64 view of a column; non-numeric columns get pandas' coerce semantics."""
+    if pa.types.is_floating(col.type) or pa.types.is_integer(col.type):
+        return col.cast(pa.float64())
+    return pa.chunked_array([pa.array(pd.to_numeric(col.to_pandas(), errors="coerce"), pa.float64())])
+
+def _month_key(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Month column as a join key in its own type; only integer months are widened (int32 vs int64)."""
+    return col.cast(pa.int64()) if pa.types.is_integer(col.type) else col
+
+def _drop_missing_keys(tbl: pa.Table) -> pa.Table:
+    # Acero's join never matches null keys; drop null / NaN months up front so both sides agree
+    key = tbl["Month_Index"]
+    mask = pc.is_valid(key)
+    if pa.types.is_floating(key.type):
+        mask = pc.and_kleene(mask, pc.invert(pc.is_nan(key)))
+    return tbl if pc.all(mask).as_py() else tbl.filter(mask)
+
+def _zero_missing(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    # null and NaN both count as 0 in CFO (matches the old fillna(0) behaviour)
+    return pc.if_else(pc.is_nan(col), 0.0, pc.fill_null(col, 0.0)).fill_null(0.0)
+
 def _discover_m2(out: Path, debug: Dict) -> Tuple[Path, Path]:
     pl_candidates = ["m2_pl_schedule.parquet", "m2_pl_statement.parquet"]
     wc_candidates = ["m2_working_capital_schedule.parquet", "m2_working_capital.parquet", "m2_nwc_schedule.parquet"]
@@ -40,19 +88,21 @@ def _discover_m2(out: Path, debug: Dict) -> Tuple[Path, Path]:
     return pl_path, wc_path
 
 def _map_columns(pl_cols: List[str], wc_cols: List[str]) -> Dict[str, str]:
-    month_col = _pick_any(pl_cols, ["Month_Index","MonthIndex","month_index","period_index","period"]) \
-             or _pick_any(wc_cols, ["Month_Index","MonthIndex","month_index","period_index","period"])
+    pl_norms = {c: _norm(c) for c in pl_cols}
+    wc_norms = {c: _norm(c) for c in wc_cols}
+    month_col = _pick_any(pl_norms, ["Month_Index","MonthIndex","month_index","period_index","period"]) \
+             or _pick_any(wc_norms, ["Month_Index","MonthIndex","month_index","period_index","period"])
     if month_col is None:
         raise KeyError("[M5] Could not locate a month/period index column in M2 artifacts.")
-    npat_col = _pick_any(pl_cols, ["NPAT","Net_Profit_After_Tax","Profit_After_Tax","Net_Income_After_Tax","NetIncomeAfterTax","PAT","Net_Profit"])
+    npat_col = _pick_any(pl_norms, ["NPAT","Net_Profit_After_Tax","Profit_After_Tax","Net_Income_After_Tax","NetIncomeAfterTax","PAT","Net_Profit"])
     if npat_col is None:
         raise KeyError("[M5] Could not locate Net Profit After Tax (NPAT) column in M2 P&L.")
-    da_col = _pick_any(pl_cols, ["Depreciation_and_Amortization","DepreciationAmortization","DandA","D_A","DA","Depreciation"])
+    da_col = _pick_any(pl_norms, ["Depreciation_and_Amortization","DepreciationAmortization","DandA","D_A","DA","Depreciation"])
     if da_col is None:
         raise KeyError("[M5] Could not locate Depreciation (or Depreciation & Amortization) column in M2 P&L.")
-    nwc_cf_col = _pick_any(wc_cols, ["Cash_Flow_from_NWC_Change","CashFlow_from_NWC_Change","CF_from_NWC_Change","Change_in_NWC_Cash_Flow","NWC_Cash_Flow_Change"])
+    nwc_cf_col = _pick_any(wc_norms, ["Cash_Flow_from_NWC_Change","CashFlow_from_NWC_Change","CF_from_NWC_Change","Change_in_NWC_Cash_Flow","NWC_Cash_Flow_Change"])
     if nwc_cf_col is None:
-        bal_col = _pick_any(wc_cols, ["NWC_Balance"])
+        bal_col = _pick_any(wc_norms, ["NWC_Balance"])
         if bal_col is None:
             raise KeyError("[M5] Could not locate NWC cash-flow column or NWC balance to derive ΔNWC.")
         nwc_cf_col = f"__derived_cf_from_{bal_col}"
@@ -63,9 +113,14 @@ def _derive_nwc_cf_if_needed(wc: pd.DataFrame, month_col: str, nwc_cf_col: str)
         bal_col = nwc_cf_col.replace("__derived_cf_from_", "")
         if bal_col not in wc.columns:
             raise KeyError(f"[M5] Internal error: expected balance column {bal_col} in WC schedule.")
-        wc = wc.sort_values(by=month_col).copy()
-        wc["__nwc_delta"] = wc[bal_col].diff().fillna(0.0)
-        wc["NWC_CF_DERIVED"] = -wc["__nwc_delta"]
+        if not wc[month_col].is_monotonic_increasing:  # M0 contract: usually already sorted
+            wc = wc.sort_values(by=month_col)
+        bal = wc[bal_col].to_numpy(dtype=np.float64)
+        delta = np.empty_like(bal)
+        delta[0:1] = 0.0
+        np.subtract(bal[1:], bal[:-1], out=delta[1:])
+        delta[np.isnan(delta)] = 0.0
+        wc["NWC_CF_DERIVED"] = -delta
     return wc
 
 def _write_json(p: Path, obj: Dict): p.write_text(json.dumps(obj, indent=2))
@@ -83,58 +138,69 @@ def main() -> int:
     debug = {"args": vars(args), "steps": []}
 
     pl_path, wc_path = _discover_m2(out, debug); debug["steps"].append("discover_m2")
-    pl = _read_parquet(pl_path, "M5/M2-PL")
-    wc = _read_parquet(wc_path, "M5/M2-WC")
-    debug["m2_pl_cols"] = list(map(str, pl.columns))
-    debug["m2_wc_cols"] = list(map(str, wc.columns))
+    debug["m2_pl_cols"] = _schema_names(pl_path, "M5/M2-PL")
+    debug["m2_wc_cols"] = _schema_names(wc_path, "M5/M2-WC")
 
     mapping = _map_columns(debug["m2_pl_cols"], debug["m2_wc_cols"])
     debug["mapping"] = mapping
-    _write_json(out / "m5_debug_dump.json", debug)
 
     if args.inspect_only:
+        _write_json(out / "m5_debug_dump.json", debug)
         print(f"[OK] Inspect-only: found PL= {pl_path.name}, WC= {wc_path.name}. Debug -> {out / 'm5_debug_dump.json'}")
         return 0
 
     month, npat, da, nwc_cf_col = mapping["month"], mapping["npat"], mapping["da"], mapping["nwc_cf"]
-    for col in [npat, da]:
-        if not pd.api.types.is_numeric_dtype(pl[col]): pl[col] = pd.to_numeric(pl[col], errors="coerce")
-    if nwc_cf_col in wc.columns:
-        if not pd.api.types.is_numeric_dtype(wc[nwc_cf_col]): wc[nwc_cf_col] = pd.to_numeric(wc[nwc_cf_col], errors="coerce")
+    wc_src_col = nwc_cf_col.replace("__derived_cf_from_", "")
+    # The whole statement stays an Arrow table: CFO runs in Arrow's vectorized kernels and the
+    # table is written straight back out, with pandas only touched for the smoke preview.
+    pl = _read_table(pl_path, "M5/M2-PL", [month, npat, da])
+    pl = pa.table({
+        "Month_Index": _month_key(pl[month]),
+        "NPAT_NAD_000": _num(pl[npat]),
+        "DandA_NAD_000": _num(pl[da]),
+    })
+    if nwc_cf_col == wc_src_col:
+        wc = _read_table(wc_path, "M5/M2-WC", [month, wc_src_col])
+        wc_month, wc_cf = wc[month], _num(wc[nwc_cf_col])
     else:
-        wc = _derive_nwc_cf_if_needed(wc, month, nwc_cf_col)
-
-    wc_cf_col_effective = nwc_cf_col if nwc_cf_col in wc.columns else "NWC_CF_DERIVED"
-    j = pd.merge(pl[[month, npat, da]].copy(), wc[[month, wc_cf_col_effective]].copy(), on=month, how="inner")
-
-    result = j.rename(columns={
-        month: "Month_Index",
-        npat: "NPAT_NAD_000",
-        da: "DandA_NAD_000",
-        wc_cf_col_effective: "NWC_CF_NAD_000",
-    }).copy()
-
-    result["CFO_NAD_000"] = result["NPAT_NAD_000"].fillna(0.0) + result["DandA_NAD_000"].fillna(0.0) + result["NWC_CF_NAD_000"].fillna(0.0)
+        # derived ΔNWC is a sorted diff; the rare fallback path keeps the numpy implementation
+        wcd = _derive_nwc_cf_if_needed(_read_parquet(wc_path, "M5/M2-WC", [month, wc_src_col]), month, nwc_cf_col)
+        wc_month, wc_cf = pa.chunked_array([pa.array(wcd[month])]), pa.chunked_array([pa.array(wcd["NWC_CF_DERIVED"], pa.float64())])
+    wc = pa.table({"Month_Index": _month_key(wc_month), "NWC_CF_NAD_000": wc_cf})
+    pl_month_type = pl["Month_Index"].type
+    if pl_month_type != wc["Month_Index"].type:
+        # e.g. integer months on one side, float on the other: compare as float64, as pd.merge did
+        pl, wc = (t.set_column(0, "Month_Index", _num(t["Month_Index"])) for t in (pl, wc))
+
+    # Acero's hash join does not promise an output order, so restore month order afterwards.
+    tbl = _drop_missing_keys(pl).join(_drop_missing_keys(wc), keys="Month_Index", join_type="inner").sort_by("Month_Index")
+    if tbl["Month_Index"].type != pl_month_type:
+        # matched keys equal the P&L months, so this cast is exact; pd.merge kept the left key dtype
+        tbl = tbl.set_column(0, "Month_Index", tbl["Month_Index"].cast(pl_month_type))
+    cfo = pc.add(pc.add(_zero_missing(tbl["NPAT_NAD_000"]), _zero_missing(tbl["DandA_NAD_000"])),
+                 _zero_missing(tbl["NWC_CF_NAD_000"]))
+    tbl = tbl.append_column("CFO_NAD_000", cfo)
 
     final_path = out / "m5_cash_flow_statement_final.parquet"
-    result.to_parquet(final_path, index=False)
+    pq.write_table(tbl, final_path)
 
     smoke = [
         "# M5 Smoke Report",
         "",
         f"- Inputs: {pl_path.name}, {wc_path.name}",
         f"- Currency: {args.currency} (values appear in *_NAD_000; i.e., thousands of NAD)",
-        f"- Rows: {len(result)}",
-        f"- Columns: {list(result.columns)}",
-        f"- Sum(CFO_NAD_000): {float(result['CFO_NAD_000'].sum()):,.3f}",
+        f"- Rows: {tbl.num_rows}",
+        f"- Columns: {tbl.column_names}",
+        f"- Sum(CFO_NAD_000): {float(pc.sum(cfo).as_py() or 0.0):,.3f}",
         "",
         "Top 5 rows:",
-        result.head().to_string(index=False),
+        # tab-separated preview: skips pandas' column-width layout pass
+        tbl.slice(0, 5).to_pandas().to_csv(sep="\t", index=False).rstrip("\n"),
     ]
     _write_smoke(out / "m5_smoke_report.md", smoke)
     debug["steps"].append("write_outputs")
     debug["m5_final_path"] = str(final_path)
-    debug["m5_cols"] = list(map(str, result.columns))
+    debug["m5_cols"] = tbl.column_names
     _write_json(out / "m5_debug_dump.json", debug)
 
     print(f"[OK] M5 cash flow computed -> {final_path.name}. Smoke -> {out / 'm5_smoke_report.md'}")
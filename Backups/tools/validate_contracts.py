@@ -1,13 +1,17 @@
 import argparse
+import fnmatch
 import json
+import os
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
-    import pandas as pd  # used only when we want to peek at a file's columns
+    import pyarrow.parquet as pq  # used only to peek at a file's footer (row count / columns)
 except Exception:
-    pd = None  # validator still works without pandas (it will skip column peeks)
+    pq = None  # validator still works without pyarrow (it will skip column peeks)
 
 OK = "[OK]"
 WARN = "[WARN]"
@@ -15,12 +19,46 @@ FAIL = "[FAIL]"
 
 # --------- Helper utilities ---------
 
+@lru_cache(maxsize=8)
+def _parquet_scan_cached(out_dir_str: str, dir_mtime_ns: int) -> Dict[str, Tuple[Path, os.stat_result]]:
+    with os.scandir(out_dir_str) as it:
+        return {e.name.lower(): (Path(e.path), e.stat()) for e in it if e.name.lower().endswith(".parquet")}
+
+def _parquet_scan(out_dir_str: str) -> Dict[str, Tuple[Path, os.stat_result]]:
+    """One directory scan per run: lower-cased *.parquet name -> (path, stat).
+    Keyed by the directory's mtime, so adding/removing artifacts triggers a rescan; main() also
+    clears the caches so files rewritten in place are re-stat'ed on every validation run."""
+    try:
+        st = os.stat(out_dir_str)
+    except OSError:
+        return {}
+    if not stat.S_ISDIR(st.st_mode):
+        return {}
+    return _parquet_scan_cached(out_dir_str, st.st_mtime_ns)
+
+def _clear_caches() -> None:
+    _parquet_scan_cached.cache_clear()
+    _open_pf_cached.cache_clear()
+
+def _parquet_entries(out_dir_str: str) -> Dict[str, Path]:
+    return {n: p for n, (p, _) in _parquet_scan(out_dir_str).items()}
+
+def _stat(p: Path) -> Optional[os.stat_result]:
+    """Stat from the directory scan when available; falls back to a real stat() call."""
+    hit = _parquet_scan(str(p.parent)).get(p.name.lower())
+    if hit is not None and hit[0] == p:
+        return hit[1]
+    try:
+        return p.stat()
+    except OSError:
+        return None
+
 def _glob_one(out_dir: Path, patterns: List[str]) -> List[Path]:
+    entries = _parquet_entries(str(out_dir))
     hits = []
     for pat in patterns:
-        hits.extend(out_dir.glob(pat))
-        hits.extend(out_dir.glob(pat.upper()))
-        hits.extend(out_dir.glob(pat.lower()))
+        # case-insensitive match against the cached listing (no extra directory syscalls)
+        hits.extend(entries[n] for n in fnmatch.filter(entries.keys(), pat.lower()))
     # de-dup while preserving order
     seen = set()
     uniq = []
@@ -30,24 +68,34 @@ def _glob_one(out_dir: Path, patterns: List[str]) -> List[Path]:
             seen.add(p.name)
     return uniq
 
-def _nonempty_parquet(p: Path) -> bool:
-    if not p.exists() or p.stat().st_size == 0:
+@lru_cache(maxsize=64)
+def _open_pf_cached(path_str: str, mtime_ns: int, size: int):
+    return pq.ParquetFile(path_str)
+
+def _open_pf(p: Path, st: Optional[os.stat_result] = None):
+    # keyed by path + mtime + size so the footer is parsed once per file version
+    st = st or _stat(p)
+    if st is None:
+        raise FileNotFoundError(p)
+    return _open_pf_cached(str(p), st.st_mtime_ns, st.st_size)
+
+def _nonempty_parquet(p: Path, st: Optional[os.stat_result] = None) -> bool:
+    st = st or _stat(p)  # size check uses the cached scan stat, no extra syscalls
+    if st is None or st.st_size == 0:
         return False
-    if pd is None:
+    if pq is None:
         return True  # can't peek, assume file present = pass size check
     try:
-        # read only first row to be safe/fast
-        df = pd.read_parquet(p, columns=None)
-        return len(df) > 0
+        # row count comes from the footer metadata; no row groups are read
+        return _open_pf(p, st).metadata.num_rows > 0
     except Exception:
         return False
 
 def _peek_columns(p: Path) -> List[str]:
-    if pd is None:
+    if pq is None:
         return []
     try:
-        df = pd.read_parquet(p)
-        return list(df.columns)
+        return list(_open_pf(p).schema_arrow.names)
     except Exception:
         return []
 
@@ -258,6 +306,7 @@ def main():
 
     out_dir = Path(args.out_dir).resolve()
     debug = {"out_dir": str(out_dir)}
+    _clear_caches()  # a fresh listing + footers for every run, even within one process
 
     all_ok = True
     all_ok &= validate_m2(out_dir, debug)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Shared helpers
+--------------
+Small building blocks that several stages need in exactly the same form. Stage-specific
+logic stays in each module's runner/engine.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def file_version(path: Path) -> Tuple[int, int, int]:
+    """
+    (mtime_ns, size, inode) of `path`, for keying per-process caches of parsed artifacts.
+    mtime alone can miss a rewrite that lands within the filesystem's timestamp granularity; an
+    in-place rewrite still changes the size, and a write-then-replace() changes the inode.
+    Raises FileNotFoundError for a missing file.
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def numeric_or_zero(s: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric(s, errors="coerce").fillna(0.0), without the copies when `s` is already numeric
+    (then only a column holding NaNs is filled).
+    """
+    if s.dtype.kind in "biuf":
+        return s.fillna(0.0) if s.hasnans else s
+    return pd.to_numeric(s, errors="coerce").fillna(0.0)
+
+
+def float64_or_zero(s: pd.Series) -> np.ndarray:
+    """
+    `numeric_or_zero(s)` as a fresh float64 array. Plain numpy columns take one copy with NaN -> 0
+    in place (inf is kept, as fillna does); object/nullable columns keep to_numeric's coerce.
+    """
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in "biuf":
+        arr = s.to_numpy(dtype=np.float64, copy=True)
+        np.copyto(arr, 0.0, where=np.isnan(arr))
+        return arr
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=np.float64, na_value=0.0)
+
+
+def dedup_headers(names: Iterable[str]) -> List[str]:
+    """
+    Repeated sheet headers renamed the way pd.read_excel does it: X, X.1, X.2, ... (a generated
+    name that is already taken gets a further suffix), so frames built from raw cells match a
+    read_excel export.
+    """
+    out = list(names)
+    counts: defaultdict = defaultdict(int)
+    for i, col in enumerate(out):
+        cur = counts[col]
+        while cur > 0:
+            counts[col] = cur + 1
+            col = f"{col}.{cur}"
+            cur = counts[col]
+        out[i] = col
+        counts[col] = cur + 1
+    return out
+
+
+def normalize_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make heterogeneous object columns parquet-safe:
+    - bytes/bytearray -> utf-8 strings
+    - object dtype -> pandas StringDtype()
+    Note: numeric/datetime columns remain unchanged.
+    """
+    out = df.copy()
+    for col in out.columns:
+        if pd.api.types.is_object_dtype(out[col].dtype):
+            # fast path: pure-str columns (the common case after read_excel) need no per-cell scan;
+            # infer_dtype walks the whole column in C, so a late bytes cell can't be missed
+            if pd.api.types.infer_dtype(out[col], skipna=True) in ("string", "empty"):
+                out[col] = out[col].astype("string")
+                continue
+            arr = out[col].to_numpy(dtype=object, copy=True)
+            is_bytes = np.fromiter((isinstance(x, (bytes, bytearray)) for x in arr), dtype=bool, count=len(arr))
+            if is_bytes.any():
+                # decode only the bytes cells; everything else is left untouched
+                arr[is_bytes] = [b.decode("utf-8", "ignore") for b in arr[is_bytes]]
+            out[col] = pd.array(arr, dtype="string")
+    return out
+
+
+def write_input_parquet(df: pd.DataFrame, tgt: Path) -> None:
+    """
+    Input Pack sheets are small (10^2-10^3 rows) and always read whole downstream,
+    so write them as a single row group without the pandas index.
+    """
+    df.to_parquet(tgt, index=False, compression="snappy", row_group_size=max(8192, len(df)))
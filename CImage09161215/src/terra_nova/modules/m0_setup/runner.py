@@ -10,22 +10,8 @@ from .engine import (
     create_calendar,                # builds calendar from Parameters
     create_opening_balance_sheet,   # builds opening cash from FX_Path
 )
-
-def _normalize_object_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Make heterogeneous object columns parquet-safe:
-    - bytes/bytearray -> utf-8 strings
-    - object dtype -> pandas StringDtype()
-    Note: numeric/datetime columns remain unchanged.
-    """
-    out = df.copy()
-    for col in out.columns:
-        if pd.api.types.is_object_dtype(out[col].dtype):
-            out[col] = out[col].map(
-                lambda x: x.decode("utf-8", "ignore") if isinstance(x, (bytes, bytearray)) else x
-            )
-            out[col] = out[col].astype("string")
-    return out
+# sheet normalisation/writer shared with M2's Working_Capital_Tax export
+from terra_nova.modules.common import normalize_object_columns, write_input_parquet
 
 def run_m0(input_pack: str, out_dir: str) -> dict:
     """
@@ -57,27 +43,27 @@ def run_m0(input_pack: str, out_dir: str) -> dict:
             fx.rename(columns={"Month": "Month_Index"}, inplace=True)
             fx = fx.astype({"Month_Index": "int64", "NAD_per_USD": "float64"})
             tgt = m0_inputs / "FX_Path.parquet"
-            fx.to_parquet(tgt)
+            write_input_parquet(fx, tgt)
             written["m0_inputs/FX_Path.parquet"] = len(fx)
         else:
             # Normalize object columns so pyarrow doesn't choke on mixed types
-            safe_df = _normalize_object_columns(df)
+            safe_df = normalize_object_columns(df)
             tgt = m0_inputs / f"{sheet_name}.parquet"
-            safe_df.to_parquet(tgt)
+            write_input_parquet(safe_df, tgt)
             written[f"m0_inputs/{sheet_name}.parquet"] = len(df)
 
     # 2) Calendar (Parameters -> m0_calendar.parquet)
     if "Parameters" in sheets and not sheets["Parameters"].empty:
         cal = create_calendar(sheets["Parameters"])
         cal_file = out_base / "m0_calendar.parquet"
-        cal.to_parquet(cal_file)
+        write_input_parquet(cal, cal_file)
         written["m0_calendar.parquet"] = len(cal)
 
     # 3) Opening Balance Sheet (FX_Path -> m0_opening_bs.parquet)
     if "FX_Path" in sheets and not sheets["FX_Path"].empty:
         obs = create_opening_balance_sheet(sheets["FX_Path"])
         obs_file = out_base / "m0_opening_bs.parquet"
-        obs.to_parquet(obs_file)
+        write_input_parquet(obs, obs_file)
         written["m0_opening_bs.parquet"] = len(obs)
 
     # 4) Smoke report
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Dict
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from .engine import (
     load_and_validate_input_pack,
@@ -18,10 +20,25 @@ from .engine import (
     _norm_objects_for_parquet,
 )
 
+# Shared writer options for the four monthly schedules. They are small and always
+# read whole downstream (never predicate-filtered), so page statistics are skipped.
+WRITE_OPTS = dict(compression="snappy", use_dictionary=True, write_statistics=False)
+
+
+def _write(df: pd.DataFrame, path: Path) -> None:
+    tbl = pa.Table.from_pandas(_norm_objects_for_parquet(df), preserve_index=False)
+    pq.write_table(tbl, path, **WRITE_OPTS)
+
+def _params_dict(sheets: Dict[str, pd.DataFrame]) -> Dict[str, object]:
+    """Parameters sheet as Key -> Value (first occurrence wins, like the old .loc[...].iloc[0])."""
+    p = sheets.get("Parameters")
+    if p is None or p.empty or not {"Key", "Value"}.issubset(p.columns):
+        return {}
+    return dict(zip(p["Key"].astype(str).iloc[::-1], p["Value"].iloc[::-1]))
+
 def _first_nonzero_month(df: pd.DataFrame, col: str) -> int | None:
-    s = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-    pos = s[s > 0].index
-    return int(df.loc[pos.min(), "Month_Index"]) if len(pos) else None
+    nz = pd.to_numeric(df[col], errors="coerce").to_numpy() > 0  # NaN compares False
+    return int(df["Month_Index"].iat[nz.argmax()]) if nz.any() else None
 
 
 def run_m1(
@@ -43,18 +60,13 @@ def run_m1(
     _ensure_dir(out)
 
     sheets = load_and_validate_input_pack(ip)  # validated per v10 contract
+    params = _params_dict(sheets)
     if months is None:
         # Try to read horizon from Parameters; default to 60.
-        months = 60
-        if "Parameters" in sheets and not sheets["Parameters"].empty:
-            p = sheets["Parameters"]
-            if {"Key", "Value"}.issubset(p.columns):
-                sel = p.loc[p["Key"] == "HORIZON_MONTHS", "Value"]
-                if not sel.empty:
-                    try:
-                        months = int(sel.iloc[0])
-                    except Exception:
-                        months = 60
+        try:
+            months = int(params.get("HORIZON_MONTHS", 60))
+        except Exception:
+            months = 60
 
     # Build tables
     rev_df = build_revenue_schedule(sheets, months)
@@ -64,16 +76,16 @@ def run_m1(
 
     # Write parquet (normalize objects for Arrow)
     wrote: Dict[str, int] = {}
-    (_norm_objects_for_parquet(rev_df)).to_parquet(out / "m1_revenue_schedule.parquet", index=False)
+    _write(rev_df, out / "m1_revenue_schedule.parquet")
     wrote["m1_revenue_schedule.parquet"] = len(rev_df)
 
-    (_norm_objects_for_parquet(opex_df)).to_parquet(out / "m1_opex_schedule.parquet", index=False)
+    _write(opex_df, out / "m1_opex_schedule.parquet")
     wrote["m1_opex_schedule.parquet"] = len(opex_df)
 
-    (_norm_objects_for_parquet(capex_df)).to_parquet(out / "m1_capex_schedule.parquet", index=False)
+    _write(capex_df, out / "m1_capex_schedule.parquet")
     wrote["m1_capex_schedule.parquet"] = len(capex_df)
 
-    (_norm_objects_for_parquet(dep_df)).to_parquet(out / "m1_depreciation_schedule.parquet", index=False)
+    _write(dep_df, out / "m1_depreciation_schedule.parquet")
     wrote["m1_depreciation_schedule.parquet"] = len(dep_df)
 
     # Smoke report (keeps your existing pattern)
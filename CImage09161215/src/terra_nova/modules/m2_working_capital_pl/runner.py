@@ -18,11 +18,15 @@ Column names are kept backward‑compatible with M5/M6/M7.5B expectations.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+
+from terra_nova.modules.common import dedup_headers, normalize_object_columns, write_input_parquet
 
 
 # ---------- helpers ----------------------------------------------------------
@@ -30,29 +34,40 @@ import pandas as pd
 def _log(msg: str) -> None:
     print(f"[M2]{msg}")
 
-def _read_parquet_safe(p: Path, what: str) -> pd.DataFrame:
+def _read_parquet_safe(p: Path, what: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    `columns` is a projection hint: only those column chunks are decoded. If any of them
+    is absent from the file schema, every column is read so callers' fallbacks still work.
+    """
     if not p.exists():
         raise FileNotFoundError(f"[M2][FAIL] Missing {what}: {p}")
-    df = pd.read_parquet(p)
-    if df.empty:
+    pf = pq.ParquetFile(p)  # footer only: row count + schema without decoding any data
+    if pf.metadata.num_rows == 0:
+        raise ValueError(f"[M2][FAIL] Empty {what}: {p}")
+    if columns is not None and not set(columns).issubset(pf.schema_arrow.names):
+        columns = None
+    df = pf.read(columns=columns, use_pandas_metadata=True).to_pandas()
+    if df.empty:  # e.g. rows present but no columns
         raise ValueError(f"[M2][FAIL] Empty {what}: {p}")
     return df
 
-def _to_py(obj):
-    """Recursively convert numpy/pandas scalars to built‑ins (JSON‑safe)."""
-    if isinstance(obj, (np.integer,)):
-        return int(obj)
-    if isinstance(obj, (np.floating,)):
-        return float(obj)
-    if isinstance(obj, (np.bool_,)):
-        return bool(obj)
-    if isinstance(obj, (pd.Timestamp,)):
-        return obj.isoformat()
-    if isinstance(obj, dict):
-        return {k: _to_py(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_to_py(v) for v in obj]
-    return obj
+def _sum_by_month(df: pd.DataFrame, month_col: str, value_col: str) -> pd.Series:
+    """
+    Per-month sum of `value_col`, indexed by month. Month_Index is a small dense non-negative
+    integer, so np.bincount does it in one C pass with no hashing; anything else (negative,
+    non-integer keys, NaNs) goes through the regular groupby. float32 values are summed (and
+    returned) as float64 on both paths.
+    """
+    keys, vals = df[month_col], df[value_col]
+    if vals.dtype == np.float32:
+        vals = vals.astype(np.float64)
+    if (pd.api.types.is_integer_dtype(keys.dtype) and len(keys) and keys.min() >= 0
+            and pd.api.types.is_numeric_dtype(vals.dtype) and not vals.isna().any()):
+        mi = keys.to_numpy(dtype=np.intp)
+        sums = np.bincount(mi, weights=vals.to_numpy(dtype=np.float64))
+        uniq = np.flatnonzero(np.bincount(mi))
+        return pd.Series(sums[uniq], index=pd.Index(uniq, dtype=keys.dtype, name=month_col), name=value_col)
+    return vals.groupby(keys).sum()
 
 def _load_policies_from_input_pack(ip_path: Path) -> Tuple[float, float, float, float, str]:
     """
@@ -62,114 +77,153 @@ def _load_policies_from_input_pack(ip_path: Path) -> Tuple[float, float, float,
     if not ip_path or not ip_path.exists():
         # defaults if pack is not supplied
         return 21.0, 20.0, 30.0, 0.60, "defaults"
-
-    xls = pd.ExcelFile(ip_path)
-    if "Working_Capital_Tax" not in xls.sheet_names:
+    # repeated scenario runs against the same pack skip the workbook entirely
+    return _load_policies_cached(str(ip_path), ip_path.stat().st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _read_wct_sheet(ip_path: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Tuple[tuple, ...]] | None:
+    """(header, rows) of Working_Capital_Tax, or None if the pack has no such sheet."""
+    import openpyxl
+
+    # read-only + values-only streams just this one sheet's XML instead of parsing the workbook
+    wb = openpyxl.load_workbook(ip_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        if "Working_Capital_Tax" not in wb.sheetnames:
+            return None
+        rows = wb["Working_Capital_Tax"].iter_rows(values_only=True)
+        header = tuple(dedup_headers(f"Unnamed: {i}" if c is None else str(c) for i, c in enumerate(next(rows, ()))))
+        body = tuple(r for r in rows if any(v is not None for v in r))
+    finally:
+        wb.close()
+    return header, body
+
+@lru_cache(maxsize=8)
+def _load_policies_cached(ip_path: str, mtime_ns: int) -> Tuple[float, float, float, float, str]:
+    sheet = _read_wct_sheet(ip_path, mtime_ns)
+    if sheet is None:
         return 21.0, 20.0, 30.0, 0.60, "defaults(no Working_Capital_Tax)"
-
-    df = pd.read_excel(ip_path, sheet_name="Working_Capital_Tax")
+    header, rows = sheet
     # Flexible header matching
-    cols = {c.strip().lower().replace(" ", "_"): c for c in df.columns}
+    cols = {c.strip().lower().replace(" ", "_"): i for i, c in enumerate(header)}
+
     # Accept common variants
-    def _pick(*names) -> str | None:
+    def _pick(*names) -> int | None:
         for nm in names:
             key = nm.lower().replace(" ", "_")
             if key in cols:
                 return cols[key]
         return None
 
-    c_ar   = _pick("AR_Days", "Accounts Receivable Days", "Receivables_Days")
-    c_inv  = _pick("Inventory_Days", "INV_Days")
-    c_ap   = _pick("AP_Days", "Accounts Payable Days", "Payables_Days")
-    c_cogs = _pick("COGS_Percent", "COGS_%", "COGS_pct")
-
-    # If the sheet uses a single row of key/values, take first non‑NA
-    def _first_val(col, default):
-        if col is None or col not in df.columns:
-            return default
-        v = df[col].dropna()
-        return float(v.iloc[0]) if not v.empty else default
-
-    ar_days  = _first_val(c_ar, 21.0)
-    inv_days = _first_val(c_inv, 20.0)
-    ap_days  = _first_val(c_ap, 30.0)
-    cogs     = _first_val(c_cogs, 60.0)
+    picks = {
+        "ar": _pick("AR_Days", "Accounts Receivable Days", "Receivables_Days"),
+        "inv": _pick("Inventory_Days", "INV_Days"),
+        "ap": _pick("AP_Days", "Accounts Payable Days", "Payables_Days"),
+        "cogs": _pick("COGS_Percent", "COGS_%", "COGS_pct"),
+    }
+    # If the sheet uses a single row of key/values, take first non‑NA (usually row 2)
+    found: Dict[str, float] = {}
+    wanted = {k: i for k, i in picks.items() if i is not None}
+    for row in rows:
+        if len(found) == len(wanted):
+            break
+        for k, i in wanted.items():
+            if k not in found and i < len(row) and row[i] is not None and row[i] != "":
+                found[k] = float(row[i])
+
+    ar_days  = found.get("ar", 21.0)
+    inv_days = found.get("inv", 20.0)
+    ap_days  = found.get("ap", 30.0)
+    cogs     = found.get("cogs", 60.0)
 
     # Normalize COGS to 0–1
     cogs_ratio = cogs / 100.0 if cogs > 1.0 else cogs
 
     return float(ar_days), float(inv_days), float(ap_days), float(cogs_ratio), "Working_Capital_Tax"
 
-# ---------- core -------------------------------------------------------------
+def _materialize_wct_parquet(ip_path: Path | None, out: Path) -> bool:
+    """
+    Write m0_inputs/Working_Capital_Tax.parquet from the sheet M2 already parsed, unless M0
+    (or an earlier M2 run) left a copy at least as new as the workbook. Lets M4 pick up the
+    tax rate without another Excel parse when M0 was skipped. Returns True if written.
+    """
+    if not ip_path or not ip_path.exists():
+        return False
+    tgt = out / "m0_inputs" / "Working_Capital_Tax.parquet"
+    ip_mtime = ip_path.stat().st_mtime_ns
+    if tgt.exists() and tgt.stat().st_mtime_ns >= ip_mtime:
+        return False
+    sheet = _read_wct_sheet(str(ip_path), ip_mtime)
+    if sheet is None:
+        return False
+    # same header dedup, normalisation and writer as M0, so the file is interchangeable with an M0 export
+    header, rows = sheet
+    tgt.parent.mkdir(parents=True, exist_ok=True)
+    write_input_parquet(normalize_object_columns(pd.DataFrame(list(rows), columns=list(header))), tgt)
+    return True
 
-def run_m2(outputs: str | Path,
-           currency: str = "NAD",
-           *,
-           strict: bool = True,
-           diagnostic: bool = False,
-           input_pack: str | Path | None = None) -> None:
-    out = Path(outputs)
-    out.mkdir(parents=True, exist_ok=True)
+# ---------- core -------------------------------------------------------------
 
-    _log(f"[INFO] Starting M2 in: {out.resolve()}")
+def compute_m2(rev: pd.DataFrame,
+               dep: pd.DataFrame | None,
+               policies: Tuple[float, float, float, float]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Pure M2 core (no I/O): M1 revenue (+ optional M1 depreciation) and (AR, INV, AP days,
+    COGS ratio) -> (working-capital schedule, PL stub). `run_m2` and the in-memory
+    M2→M4 pipeline both call this.
+    """
+    ar_days, inv_days, ap_days, cogs_ratio = policies
 
-    # 1) Revenue from M1
-    m1_rev_p = out / "m1_revenue_schedule.parquet"
-    rev = _read_parquet_safe(m1_rev_p, "M1 revenue")
     # Expect Month_Index + per‑crop revenue columns and 'Monthly_Revenue_NAD_000'
     month_col = "Month_Index" if "Month_Index" in rev.columns else [c for c in rev.columns if "month" in c.lower()][0]
     if "Monthly_Revenue_NAD_000" not in rev.columns:
         # Fallback – sum *_Revenue_NAD_000
-        money_cols = [c for c in rev.columns if c.endswith("_NAD_000")]
-        rev["Monthly_Revenue_NAD_000"] = rev[money_cols].sum(axis=1)
-    s_rev = rev.groupby(month_col, as_index=True)["Monthly_Revenue_NAD_000"].sum()
-
-    _log(f"[OK]  Loaded M1 revenue ({len(rev)} rows).")
+        mask = rev.columns.astype(str).str.endswith("_NAD_000")
+        # one float64 block, NaN as 0 (same as the skipna row sum)
+        rev = rev.assign(Monthly_Revenue_NAD_000=rev.loc[:, mask].to_numpy(dtype=np.float64, na_value=0.0).sum(axis=1))
+    s_rev = _sum_by_month(rev, month_col, "Monthly_Revenue_NAD_000")
 
-    # 2) Policies from Input Pack (if provided)
-    ip_path = Path(input_pack) if input_pack else None
-    ar_days, inv_days, ap_days, cogs_ratio, source_note = _load_policies_from_input_pack(ip_path)
-    _log(f"[OK]  Policies (source={source_note}) -> AR={ar_days:.1f}d, INV={inv_days:.1f}d, AP={ap_days:.1f}d, COGS%={cogs_ratio*100:.2f}%.")
-
-    # 3) Working capital balances
+    # Working capital balances
     #    AR = Revenue * AR_days/30
     #    COGS = Revenue * cogs_ratio
     #    INV = COGS * INV_days/30
     #    AP = COGS * AP_days/30
     #    NWC = AR + INV - AP
     #    CF from ΔNWC = -(NWC_t - NWC_{t-1})
-    cogs = s_rev * cogs_ratio
-    ar   = s_rev * (ar_days / 30.0)
-    inv  = cogs  * (inv_days / 30.0)
-    ap   = cogs  * (ap_days / 30.0)
-    nwc  = ar + inv - ap
-    dlt  = nwc.diff().fillna(nwc)  # first month delta = level
-    cf_nwc = -dlt
+    #    Plain ndarray arithmetic: no per-op index alignment or intermediate Series.
+    #    COGS is not emitted, so it is folded into the INV/AP multipliers: one scalar-times-vector each.
+    k_ar  = ar_days / 30.0
+    k_inv = cogs_ratio * inv_days / 30.0
+    k_ap  = cogs_ratio * ap_days / 30.0
+    r    = s_rev.to_numpy(dtype=np.float64, copy=False)
+    ar   = r * k_ar
+    inv  = r * k_inv
+    ap   = r * k_ap
+    nwc  = ar + inv
+    nwc -= ap
+    dlt  = np.empty_like(nwc)
+    dlt[:1] = nwc[:1]  # first month delta = level
+    np.subtract(nwc[1:], nwc[:-1], out=dlt[1:])
+    np.negative(dlt, out=dlt)  # dlt now holds the CF from ΔNWC
 
     wc = pd.DataFrame({
         "Month_Index": s_rev.index.astype(int),
-        "AR_Balance_NAD_000": ar.values,
-        "Inventory_Balance_NAD_000": inv.values,
-        "AP_Balance_NAD_000": ap.values,
-        "NWC_Balance_NAD_000": nwc.values,
-        "Cash_Flow_from_NWC_Change_NAD_000": cf_nwc.values,
+        "AR_Balance_NAD_000": ar,
+        "Inventory_Balance_NAD_000": inv,
+        "AP_Balance_NAD_000": ap,
+        "NWC_Balance_NAD_000": nwc,
+        "Cash_Flow_from_NWC_Change_NAD_000": dlt,
     })
 
-    (out / "m2_working_capital_schedule.parquet").write_bytes(wc.to_parquet(index=False))
-    _log("[OK]  Emitted: m2_working_capital_schedule.parquet")
-
-    # 4) Tiny PL stub to keep M5 happy (names used by M5)
+    # Tiny PL stub to keep M5 happy (names used by M5)
     #    Depreciation: if M1 depreciation schedule exists, use it; otherwise zero.
-    dep_p = out / "m1_depreciation_schedule.parquet"
-    if dep_p.exists():
-        dep = pd.read_parquet(dep_p)
+    if dep is not None:
         dep_m = "Month_Index" if "Month_Index" in dep.columns else [c for c in dep.columns if "month" in c.lower()][0]
         dep_col = "Monthly_Depreciation_NAD_000"
         if dep_col not in dep.columns:
             # best effort: any *_Depreciation_NAD_000
             cand = [c for c in dep.columns if "depreciation" in c.lower() and c.endswith("_NAD_000")]
             dep_col = cand[0] if cand else dep.columns[-1]
-        s_dep = dep.groupby(dep_m)[dep_col].sum().reindex(s_rev.index, fill_value=0.0)
+        s_dep = _sum_by_month(dep, dep_m, dep_col).reindex(s_rev.index, fill_value=0.0)
     else:
         s_dep = pd.Series(0.0, index=s_rev.index)
 
@@ -178,11 +232,26 @@ def run_m2(outputs: str | Path,
         "NPAT_NAD_000": 0.0,                      # placeholder
         "Depreciation_NAD_000": s_dep.values,    # used by M5
     })
-    (out / "m2_profit_and_loss_stub.parquet").write_bytes(pl_stub.to_parquet(index=False))
+    return wc, pl_stub
+
+def write_m2(out: Path,
+             wc: pd.DataFrame,
+             pl_stub: pd.DataFrame,
+             policies: Tuple[float, float, float, float, str],
+             *,
+             diagnostic: bool = False) -> None:
+    """Emit the M2 artifacts (and debug/smoke when `diagnostic`) for frames from `compute_m2`."""
+    ar_days, inv_days, ap_days, cogs_ratio, source_note = policies
+
+    wc.to_parquet(out / "m2_working_capital_schedule.parquet", index=False, engine="pyarrow", compression="snappy")
+    _log("[OK]  Emitted: m2_working_capital_schedule.parquet")
+    pl_stub.to_parquet(out / "m2_profit_and_loss_stub.parquet", index=False, engine="pyarrow", compression="snappy")
     _log("[OK]  Emitted: m2_profit_and_loss_stub.parquet")
 
-    # 5) Diagnostics
     if diagnostic:
+        # first 12 months as plain Python scalars: shared by the JSON dump and the smoke report
+        first12 = dict(zip(wc["Month_Index"].iloc[:12].tolist(),
+                           wc["Cash_Flow_from_NWC_Change_NAD_000"].iloc[:12].tolist()))
         dbg_out: Dict[str, object] = {
             "policies": {
                 "source": source_note,
@@ -191,21 +260,57 @@ def run_m2(outputs: str | Path,
                 "AP_days": ap_days,
                 "COGS_ratio": cogs_ratio,
             },
-            "first_12_nwc_cf": wc.set_index("Month_Index")["Cash_Flow_from_NWC_Change_NAD_000"].head(12).to_dict(),
+            "first_12_nwc_cf": first12,
         }
-        (out / "m2_debug_dump.json").write_text(json.dumps(_to_py(dbg_out), indent=2), encoding="utf-8")
+        # everything above is already a builtin (policies are floats, first12 from .tolist())
+        (out / "m2_debug_dump.json").write_text(json.dumps(dbg_out, indent=2), encoding="utf-8")
         smoke = []
         smoke.append("# M2 Smoke")
-        smoke.append(f"- months: {int(s_rev.index.min())}..{int(s_rev.index.max())}")
+        smoke.append(f"- months: {int(wc['Month_Index'].min())}..{int(wc['Month_Index'].max())}")
         smoke.append(f"- policies: AR={ar_days:.1f}d, INV={inv_days:.1f}d, AP={ap_days:.1f}d, COGS%={cogs_ratio*100:.2f}%")
         smoke.append("")
         smoke.append("**First 12 months ΔNWC cash flow (NAD '000):**")
-        s12 = wc.set_index("Month_Index")["Cash_Flow_from_NWC_Change_NAD_000"].head(12)
-        smoke.append(s12.to_string())
+        smoke.append("\n".join(f"{m:>3} {v:,.3f}" for m, v in first12.items()))
         (out / "m2_smoke_report.md").write_text("\n".join(smoke), encoding="utf-8")
 
     _log("[OK]  Debug/Smoke written.")
 
+def load_m2_inputs(out: Path, input_pack: str | Path | None = None):
+    """
+    Read everything M2 consumes: (M1 revenue, M1 depreciation or None, policies incl. source).
+    Also materialises m0_inputs/Working_Capital_Tax.parquet for M4 when needed.
+    """
+    # 1) Revenue from M1
+    m1_rev_p = out / "m1_revenue_schedule.parquet"
+    rev = _read_parquet_safe(m1_rev_p, "M1 revenue", columns=["Month_Index", "Monthly_Revenue_NAD_000"])
+    _log(f"[OK]  Loaded M1 revenue ({len(rev)} rows).")
+
+    # 2) Policies from Input Pack (if provided)
+    ip_path = Path(input_pack) if input_pack else None
+    policies = _load_policies_from_input_pack(ip_path)
+    ar_days, inv_days, ap_days, cogs_ratio, source_note = policies
+    _log(f"[OK]  Policies (source={source_note}) -> AR={ar_days:.1f}d, INV={inv_days:.1f}d, AP={ap_days:.1f}d, COGS%={cogs_ratio*100:.2f}%.")
+    if _materialize_wct_parquet(ip_path, out):
+        _log("[OK]  Cached Working_Capital_Tax -> m0_inputs/Working_Capital_Tax.parquet")
+
+    dep_p = out / "m1_depreciation_schedule.parquet"
+    dep = pd.read_parquet(dep_p) if dep_p.exists() else None
+    return rev, dep, policies
+
+def run_m2(outputs: str | Path,
+           currency: str = "NAD",
+           *,
+           strict: bool = True,
+           diagnostic: bool = False,
+           input_pack: str | Path | None = None) -> None:
+    out = Path(outputs)
+    out.mkdir(parents=True, exist_ok=True)
+
+    _log(f"[INFO] Starting M2 in: {out.resolve()}")
+    rev, dep, policies = load_m2_inputs(out, input_pack)
+    wc, pl_stub = compute_m2(rev, dep, policies[:4])
+    write_m2(out, wc, pl_stub, policies, diagnostic=diagnostic)
+
 
 if __name__ == "__main__":
     run_m2("./outputs", "NAD", strict=True, diagnostic=True)
@@ -1,15 +1,27 @@
 import json
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
+
+from terra_nova.modules.common import numeric_or_zero
+
+try:
+    from numba import njit  # optional accelerator for the revolver recurrence
+except Exception:
+    njit = None
 
 # ---- utilities --------------------------------------------------------------
 
-def _read_parquet_maybe(path: Path, required: bool = True) -> pd.DataFrame:
+def _read_parquet_maybe(path: Path, required: bool = True, columns: list | None = None) -> pd.DataFrame:
     if path.exists():
-        return pd.read_parquet(path)
+        # project to `columns` only when the file has all of them; otherwise keep the full read
+        if columns is not None and not set(columns).issubset(pq.ParquetFile(path).schema_arrow.names):
+            columns = None
+        return pd.read_parquet(path, columns=columns)
     if required:
         raise FileNotFoundError(f"Required file missing: {path}")
     # not required -> empty df
@@ -23,8 +35,12 @@ def _detect_capex(df: pd.DataFrame) -> pd.Series:
     cols = [c for c in df.columns if c.lower() != "month_index"]
     capex_like = [c for c in cols if ("capex" in c.lower()) or ("capital" in c.lower())]
     if capex_like:
-        s = df[capex_like].sum(axis=1, numeric_only=True)
-        return pd.to_numeric(s, errors="coerce").fillna(0.0)
+        # numeric_only semantics: non-numeric candidates are ignored, NaN counts as 0
+        num = [c for c in capex_like if pd.api.types.is_numeric_dtype(df[c].dtype)]
+        if len(num) == 1:  # the common case: one CAPEX column, no row reduction needed
+            return df[num[0]].astype(np.float64).fillna(0.0)
+        arr = df[num].to_numpy(dtype=np.float64, na_value=0.0)
+        return pd.Series(arr.sum(axis=1), index=df.index)
     # fallback: all zeros
     n = len(df)
     return pd.Series(np.zeros(n), name="CAPEX_NAD_000")
@@ -36,24 +52,23 @@ def _get_monthly_rate_from_finance_stack(fin_stack: pd.DataFrame) -> float:
     """
     if fin_stack is None or fin_stack.empty:
         return 0.12 / 12.0
-    df = fin_stack.copy()
-    # Normalize column names
-    df.columns = [str(c) for c in df.columns]
-    lowcols = {c.lower(): c for c in df.columns}
+    # Column positions are resolved once; the sheet is then walked as plain row tuples
+    # (no .str accessor Series, no per-cell .iloc).
+    cols = [str(c) for c in fin_stack.columns]
+    pos = {c: i for i, c in reversed(list(enumerate(cols)))}  # first occurrence wins
     # Try to find a row that looks like "Revolver"
-    name_col = None
-    for candidate in ["Instrument", "Name", "Facility", "Line", "Type", "Parameter"]:
-        if candidate in df.columns:
-            name_col = candidate
-            break
-    rate_candidates = [c for c in df.columns if "apr" in c.lower() or "rate" in c.lower()]
-    if name_col and rate_candidates:
-        # Prefer rows that mention 'revolver'
-        revolver_rows = df[df[name_col].astype(str).str.lower().str.contains("revolver", na=False)]
-        if not revolver_rows.empty:
-            for rc in rate_candidates:
+    name_idx = next((pos[c] for c in ["Instrument", "Name", "Facility", "Line", "Type", "Parameter"] if c in pos), None)
+    rate_idx = [i for i, c in enumerate(cols) if "apr" in c.lower() or "rate" in c.lower()]
+    param_idx, value_idx = pos.get("Parameter"), pos.get("Value")
+    rows = list(fin_stack.itertuples(index=False, name=None))
+
+    if name_idx is not None and rate_idx:
+        # Prefer the first row that mentions 'revolver'
+        rev_row = next((r for r in rows if "revolver" in str(r[name_idx]).lower()), None)
+        if rev_row is not None:
+            for i in rate_idx:
                 try:
-                    val = pd.to_numeric(revolver_rows.iloc[0][rc])
+                    val = pd.to_numeric(rev_row[i])
                     if math.isfinite(val) and val > 0 and val < 1.5:  # treat as decimal APR if 0<val<1.5
                         return float(val) / 12.0
                     if math.isfinite(val) and val > 1.5:  # maybe 12 for 12% APR
@@ -61,22 +76,52 @@ def _get_monthly_rate_from_finance_stack(fin_stack: pd.DataFrame) -> float:
                 except Exception:
                     pass
     # Also try generic parameter/value shape: parameter=Revolver_APR, value=0.12 or 12
-    if set(["Parameter", "Value"]).issubset(df.columns):
-        row = df[df["Parameter"].astype(str).str.lower().str.contains("revolver") & 
-                 df["Parameter"].astype(str).str.lower().str.contains("apr")]
-        if not row.empty:
-            v = str(row.iloc[0]["Value"])
-            try:
-                fl = float(v)
-                if fl > 1.5:
-                    return fl / 100.0 / 12.0
-                if fl > 0:
-                    return fl / 12.0
-            except Exception:
-                pass
+    if param_idx is not None and value_idx is not None:
+        for r in rows:
+            p = str(r[param_idx]).lower()
+            if "revolver" in p and "apr" in p:
+                try:
+                    fl = float(str(r[value_idx]))
+                    if fl > 1.5:
+                        return fl / 100.0 / 12.0
+                    if fl > 0:
+                        return fl / 12.0
+                except Exception:
+                    pass
+                break  # only the first matching row is considered
     # fallback
     return 0.12 / 12.0
 
+def _revolver_kernel_py(capex: np.ndarray, cfo: np.ndarray, rate: float, n: int):
+    """
+    Serial revolver recurrence (closing balance feeds next opening balance).
+    Returns (open, draw, repay, close, interest) arrays of length n.
+    """
+    open_ = np.empty(n)
+    draw = np.empty(n)
+    repay = np.empty(n)
+    close = np.empty(n)
+    interest = np.empty(n)
+    bal = 0.0
+    for i in range(n):
+        intr = bal * rate
+        # Need to cover CAPEX minus CFO; interest adds to the cash need
+        need = capex[i] - cfo[i] + intr
+        d = need if need > 0.0 else 0.0
+        rp = 0.0
+        if need < 0.0:
+            rp = -need if -need < bal else bal
+        open_[i] = bal
+        draw[i] = d
+        repay[i] = rp
+        interest[i] = intr
+        bal = bal + d - rp
+        close[i] = bal
+    return open_, draw, repay, close, interest
+
+# numba is not a hard dependency; without it the same loop runs on plain float64 arrays
+_revolver_kernel = njit(cache=True)(_revolver_kernel_py) if njit is not None else _revolver_kernel_py
+
 def _safe_num(s):
     try:
         return float(s)
@@ -85,69 +130,74 @@ def _safe_num(s):
 
 # ---- core -------------------------------------------------------------------
 
-def run_m3(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
+def load_m3_inputs(out_path: Path, *, with_m2: bool = True):
     """
-    Rebuilt M3 that:
-      * reads M0/M1/M2 artifacts from `out_dir`,
-      * computes a simple revolver schedule to cover (CAPEX - CFO_approx),
-      * emits the legacy columns used downstream.
-    Artifacts written:
-      - m3_revolver_schedule.parquet
-      - m3_finance_index.parquet
-      - m3_insurance_schedule.parquet (placeholder zeros)
-      - m3_smoke_report.md
-    Returns a dict with artifact paths and row counts.
+    (calendar, M1 capex, M2 WC, M2 PL stub, Finance_Stack) as M3 reads them from `out_path`.
+    `with_m2=False` skips the M2 files (returned as None) for callers that hold them in memory.
     """
-    out_path = Path(out_dir)
-    out_path.mkdir(parents=True, exist_ok=True)
-
     # Inputs produced by M0/M1/M2
     cal = _read_parquet_maybe(out_path / "m0_calendar.parquet", required=True)
     m1_capex = _read_parquet_maybe(out_path / "m1_capex_schedule.parquet", required=False)
-    wc = _read_parquet_maybe(out_path / "m2_working_capital_schedule.parquet", required=True)
-    pl = _read_parquet_maybe(out_path / "m2_profit_and_loss_stub.parquet", required=True)
+    wc = pl = None
+    if with_m2:
+        wc = _read_parquet_maybe(out_path / "m2_working_capital_schedule.parquet", required=True,
+                                 columns=["Month_Index", "Cash_Flow_from_NWC_Change_NAD_000"])
+        pl = _read_parquet_maybe(out_path / "m2_profit_and_loss_stub.parquet", required=True,
+                                 columns=["Month_Index", "NPAT_NAD_000", "Depreciation_NAD_000"])
     fin_stack = None
     try:
         fin_stack = _read_parquet_maybe(out_path / "m0_inputs" / "Finance_Stack.parquet", required=False)
     except Exception:
         fin_stack = pd.DataFrame()
+    return cal, m1_capex, wc, pl, fin_stack
 
+def compute_m3(cal: pd.DataFrame,
+               m1_capex: pd.DataFrame,
+               wc: pd.DataFrame,
+               pl: pd.DataFrame,
+               fin_stack: pd.DataFrame | None):
+    """
+    Pure M3 core (no I/O). Returns (revolver schedule, finance index, insurance placeholder,
+    monthly revolver rate). `wc`/`pl` may be the M2 frames straight from `compute_m2`.
+    """
     # Harmonize calendar / month index
     if "Month_Index" not in cal.columns:
         raise ValueError("Calendar missing Month_Index")
-    months = cal["Month_Index"].astype(int).tolist()
+    # kept as an int64 ndarray end to end (reindex keys and output column alike)
+    months = cal["Month_Index"].to_numpy(dtype=np.int64)
     n = len(months)
+    zeros = pd.Series(np.zeros(n))
 
     # CFO approx = NPAT + Depreciation + NWC CF
-    npat = pd.to_numeric(pl.get("NPAT_NAD_000", pd.Series([0]*n)), errors="coerce").fillna(0.0)
-    dep = pd.to_numeric(pl.get("Depreciation_NAD_000", pd.Series([0]*n)), errors="coerce").fillna(0.0)
-    nwc_cf = pd.to_numeric(wc.get("Cash_Flow_from_NWC_Change_NAD_000", pd.Series([0]*n)), errors="coerce").fillna(0.0)
+    npat = numeric_or_zero(pl.get("NPAT_NAD_000", zeros))
+    dep = numeric_or_zero(pl.get("Depreciation_NAD_000", zeros))
+    nwc_cf = numeric_or_zero(wc.get("Cash_Flow_from_NWC_Change_NAD_000", zeros))
     # If lengths differ, align by Month_Index
     def _align_by_month(df, colname):
-        if "Month_Index" in df.columns and colname in df.columns:
-            tmp = df[["Month_Index", colname]].copy()
-            tmp = tmp.set_index("Month_Index").reindex(months).fillna(0.0)
-            return pd.to_numeric(tmp[colname], errors="coerce").fillna(0.0).reset_index(drop=True)
+        if "Month_Index" in df.columns and colname in df.columns and len(df):
+            # positional gather: months absent from df (locs == -1) and non-numeric cells -> 0
+            locs = pd.Index(df["Month_Index"].to_numpy()).get_indexer(months)
+            vals = numeric_or_zero(df[colname]).to_numpy(dtype=np.float64)
+            out = np.where(locs >= 0, vals[np.maximum(locs, 0)], 0.0)
+            return pd.Series(np.nan_to_num(out, nan=0.0))
         return pd.Series(np.zeros(n))
     if len(npat) != n:
-        npat = _align_by_month(pl.rename(columns={"Month_Index":"Month_Index"}), "NPAT_NAD_000")
+        npat = _align_by_month(pl, "NPAT_NAD_000")
     if len(dep) != n:
-        dep  = _align_by_month(pl.rename(columns={"Month_Index":"Month_Index"}), "Depreciation_NAD_000")
+        dep  = _align_by_month(pl, "Depreciation_NAD_000")
     if len(nwc_cf) != n:
-        nwc_cf = _align_by_month(wc.rename(columns={"Month_Index":"Month_Index"}), "Cash_Flow_from_NWC_Change_NAD_000")
+        nwc_cf = _align_by_month(wc, "Cash_Flow_from_NWC_Change_NAD_000")
 
     cfo_approx = npat + dep + nwc_cf
 
     # CAPEX detection
-    capex = pd.Series(np.zeros(n))
+    capex = zeros
     if not m1_capex.empty:
         if "Month_Index" in m1_capex.columns and len(m1_capex) != n:
-            # align by month if lens mismatch
-            tmp = m1_capex.copy()
-            cap = _detect_capex(tmp)
-            tmp = pd.DataFrame({"Month_Index": tmp["Month_Index"], "CAPEX": cap})
-            tmp = tmp.set_index("Month_Index").reindex(months).fillna(0.0)
-            capex = pd.to_numeric(tmp["CAPEX"], errors="coerce").fillna(0.0).reset_index(drop=True)
+            # align by month if lens mismatch (_detect_capex only reads, so no defensive copy)
+            tmp = pd.DataFrame({"Month_Index": m1_capex["Month_Index"].to_numpy(),
+                                "CAPEX": _detect_capex(m1_capex).to_numpy()}, copy=False)
+            capex = _align_by_month(tmp, "CAPEX")
         else:
             capex = _detect_capex(m1_capex)
             if len(capex) != n:
@@ -158,28 +208,20 @@ def run_m3(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
     monthly_rate = _get_monthly_rate_from_finance_stack(fin_stack)
 
     # Build revolver schedule
-    records = []
-    balance_open = 0.0
-    for i, m in enumerate(months):
-        interest = balance_open * monthly_rate
-        # Need to cover CAPEX minus CFO; interest adds to the cash need
-        need = float(capex.iloc[i]) - float(cfo_approx.iloc[i]) + interest
-        draw = max(0.0, need)
-        repay = 0.0
-        if need < 0.0:
-            repay = min(balance_open, -need)
-        balance_close = balance_open + draw - repay
-        records.append({
-            "Month_Index": int(m),
-            "Revolver_Open_Balance_NAD_000": float(balance_open),
-            "Revolver_Draw_NAD_000": float(draw),
-            "Revolver_Repayment_NAD_000": float(repay),
-            "Revolver_Close_Balance_NAD_000": float(balance_close),
-            "Revolver_Interest_Expense_NAD_000": float(interest),
-        })
-        balance_open = balance_close
-
-    rev = pd.DataFrame.from_records(records)
+    open_a, draw_a, repay_a, close_a, intr_a = _revolver_kernel(
+        np.ascontiguousarray(capex.to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(cfo_approx.to_numpy(dtype=np.float64)),
+        float(monthly_rate),
+        n,
+    )
+    rev = pd.DataFrame({
+        "Month_Index": months,
+        "Revolver_Open_Balance_NAD_000": open_a,
+        "Revolver_Draw_NAD_000": draw_a,
+        "Revolver_Repayment_NAD_000": repay_a,
+        "Revolver_Close_Balance_NAD_000": close_a,
+        "Revolver_Interest_Expense_NAD_000": intr_a,
+    })
 
     # Finance index (metadata)
     fin_index = pd.DataFrame({
@@ -190,19 +232,25 @@ def run_m3(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
     # Insurance schedule placeholder (keeps downstream happy if referenced)
     ins = pd.DataFrame({
         "Month_Index": months,
-        "Insurance_Expense_NAD_000": [0.0] * n
+        "Insurance_Expense_NAD_000": np.zeros(n),
     })
 
-    # Write artifacts
-    out_files = {}
-    def _w(df: pd.DataFrame, name: str):
-        p = out_path / name
-        df.to_parquet(p, index=False)
-        out_files[name] = len(df)
+    return rev, fin_index, ins, monthly_rate
 
-    _w(rev, "m3_revolver_schedule.parquet")
-    _w(fin_index, "m3_finance_index.parquet")
-    _w(ins, "m3_insurance_schedule.parquet")
+def write_m3(out_path: Path, rev: pd.DataFrame, fin_index: pd.DataFrame, ins: pd.DataFrame,
+             monthly_rate: float) -> dict:
+    """Emit the M3 artifacts + smoke report for frames from `compute_m3`."""
+    # Write artifacts (independent files, written concurrently)
+    frames = {
+        "m3_revolver_schedule.parquet": rev,
+        "m3_finance_index.parquet": fin_index,
+        "m3_insurance_schedule.parquet": ins,
+    }
+    with ThreadPoolExecutor(max_workers=len(frames)) as ex:
+        futs = [ex.submit(df.to_parquet, out_path / name, index=False) for name, df in frames.items()]
+        for f in futs:
+            f.result()
+    out_files = {name: len(df) for name, df in frames.items()}
 
     # Smoke report
     smoke = {
@@ -223,3 +271,22 @@ def run_m3(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
     print("[M3][OK] Emitted:", json.dumps(out_files))
     return out_files
 
+def run_m3(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
+    """
+    Rebuilt M3 that:
+      * reads M0/M1/M2 artifacts from `out_dir`,
+      * computes a simple revolver schedule to cover (CAPEX - CFO_approx),
+      * emits the legacy columns used downstream.
+    Artifacts written:
+      - m3_revolver_schedule.parquet
+      - m3_finance_index.parquet
+      - m3_insurance_schedule.parquet (placeholder zeros)
+      - m3_smoke_report.md
+    Returns a dict with artifact paths and row counts.
+    """
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    cal, m1_capex, wc, pl, fin_stack = load_m3_inputs(out_path)
+    rev, fin_index, ins, monthly_rate = compute_m3(cal, m1_capex, wc, pl, fin_stack)
+    return write_m3(out_path, rev, fin_index, ins, monthly_rate)
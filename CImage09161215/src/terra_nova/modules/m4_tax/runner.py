@@ -1,8 +1,11 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
 
+from terra_nova.modules.common import numeric_or_zero
+
 def _read_parquet(path: Path, required=True) -> pd.DataFrame:
     if path.exists():
         return pd.read_parquet(path)
@@ -31,40 +34,35 @@ def _tax_rate_from_wct(df: pd.DataFrame) -> float:
                 pass
     return 0.30
 
-def run_m4(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
+def compute_m4(cal: pd.DataFrame, pl: pd.DataFrame, wct: pd.DataFrame | None):
     """
-    Minimal accrual+cash tax schedule compatible with downstream M5.
-    Uses NPAT from M2 stub and a tax rate from Working_Capital_Tax (fallback 30%).
-    Tax paid same-period to keep payable flat at zero (deterministic).
-    Emits:
-      - m4_tax_schedule.parquet
-      - m4_tax_summary.parquet
-      - m4_smoke_report.md
+    Pure M4 core (no I/O): calendar + M2 PL stub (+ Working_Capital_Tax) ->
+    (tax schedule, tax summary, rate). `pl` may be the M2 frame straight from `compute_m2`.
     """
-    out = Path(out_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    cal = _read_parquet(out / "m0_calendar.parquet", required=True)
-    pl = _read_parquet(out / "m2_profit_and_loss_stub.parquet", required=True)
-    wct = _read_parquet(out / "m0_inputs" / "Working_Capital_Tax.parquet", required=False)
-
     rate = _tax_rate_from_wct(wct)
     months = cal["Month_Index"].astype(int).tolist()
     n = len(months)
 
     # Align NPAT to calendar
     def _align(df, cname):
-        if "Month_Index" in df.columns and cname in df.columns:
-            tmp = df[["Month_Index", cname]].copy().set_index("Month_Index").reindex(months).fillna(0.0)
-            return pd.to_numeric(tmp[cname], errors="coerce").fillna(0.0).reset_index(drop=True)
+        if "Month_Index" in df.columns and cname in df.columns and len(df):
+            # positional gather: months absent from df (locs == -1) and non-numeric cells -> 0
+            locs = pd.Index(df["Month_Index"].to_numpy()).get_indexer(months)
+            vals = numeric_or_zero(df[cname]).to_numpy(dtype=np.float64)
+            out = np.where(locs >= 0, vals[np.maximum(locs, 0)], 0.0)
+            return pd.Series(np.nan_to_num(out, nan=0.0))
         return pd.Series(np.zeros(n))
 
     npat = _align(pl, "NPAT_NAD_000")
 
     # Simple taxable income approximation:
     # If NPAT>0, approximate PBT = NPAT / (1-rate), else 0
-    taxable = np.where(npat > 0, npat / max(rate and 1-rate or 0.70, 0.000001), 0.0)
+    denom = max((1.0 - rate) if rate and (1.0 - rate) else 0.70, 0.000001)
+    npat_arr = npat.to_numpy(dtype=np.float64)
+    taxable = np.zeros_like(npat_arr)
+    np.divide(npat_arr, denom, out=taxable, where=npat_arr > 0)  # loss months stay 0, no wasted divides
     tax_exp = taxable * rate
-    tax_paid = tax_exp.copy()  # same period cash tax for now (keeps payable=0)
+    tax_paid = tax_exp  # same period cash tax for now (keeps payable=0); never mutated
     tax_payable_end = np.zeros(n)
 
     tax = pd.DataFrame({
@@ -82,15 +80,51 @@ def run_m4(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
         "Value": [rate, n, float(tax_exp.sum()), float(tax_paid.sum())]
     })
 
-    tax.to_parquet(out / "m4_tax_schedule.parquet", index=False)
-    summ.to_parquet(out / "m4_tax_summary.parquet", index=False)
+    return tax, summ, rate
+
+def write_m4(out: Path, tax: pd.DataFrame, summ: pd.DataFrame, rate: float) -> dict:
+    """Emit the M4 artifacts + smoke report for frames from `compute_m4`."""
+    tax_exp = tax["Tax_Expense_NAD_000"].to_numpy()
+    tax_paid = tax["Tax_Paid_NAD_000"].to_numpy()
+    # both writes release the GIL inside pyarrow, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futs = [ex.submit(tax.to_parquet, out / "m4_tax_schedule.parquet", index=False),
+                ex.submit(summ.to_parquet, out / "m4_tax_summary.parquet", index=False)]
+        for f in futs:
+            f.result()
     (out / "m4_smoke_report.md").write_text(
         "# M4 Smoke Report\n\n"
         f"- Tax rate used: {rate:.6f}\n"
-        f"- Months: {n}\n"
+        f"- Months: {len(tax)}\n"
         f"- Total Expense: {tax_exp.sum():.3f}\n"
         f"- Total Paid: {tax_paid.sum():.3f}\n",
         encoding="utf-8"
     )
     print("[M4][OK] Emitted m4_tax_schedule.parquet, m4_tax_summary.parquet")
-    return {"rows": len(tax)}
\ No newline at end of file
+    return {"rows": len(tax)}
+
+def load_m4_inputs(out: Path, *, with_m2: bool = True):
+    """
+    (calendar, M2 PL stub, Working_Capital_Tax or empty) as M4 reads them from `out`.
+    `with_m2=False` skips the M2 file (returned as None) for callers that hold it in memory.
+    """
+    cal = _read_parquet(out / "m0_calendar.parquet", required=True)
+    pl = _read_parquet(out / "m2_profit_and_loss_stub.parquet", required=True) if with_m2 else None
+    wct = _read_parquet(out / "m0_inputs" / "Working_Capital_Tax.parquet", required=False)
+    return cal, pl, wct
+
+def run_m4(input_xlsx: str, out_dir: str, currency: str = "NAD") -> dict:
+    """
+    Minimal accrual+cash tax schedule compatible with downstream M5.
+    Uses NPAT from M2 stub and a tax rate from Working_Capital_Tax (fallback 30%).
+    Tax paid same-period to keep payable flat at zero (deterministic).
+    Emits:
+      - m4_tax_schedule.parquet
+      - m4_tax_summary.parquet
+      - m4_smoke_report.md
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    cal, pl, wct = load_m4_inputs(out)
+    tax, summ, rate = compute_m4(cal, pl, wct)
+    return write_m4(out, tax, summ, rate)
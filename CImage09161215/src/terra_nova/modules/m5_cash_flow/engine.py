@@ -19,13 +19,20 @@ Outputs
 All amounts in NAD '000.
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any, Optional
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 import re
 
+from terra_nova.modules.common import file_version, float64_or_zero
+
 # ---------- utilities ----------
 
 def _print(msg: str) -> None:
@@ -43,59 +50,175 @@ def _ok(msg: str) -> None:
 def _info(msg: str) -> None:
     _print(f"[M5][INFO] {msg}")
 
-def _read_parquet(path: Path) -> pd.DataFrame:
-    # We rely on the caller (loaders) to handle FileNotFoundError based on 'strict' mode if the file is optional.
+def _read_table(path: Path, columns: Optional[List[str]] = None, filters=None):
+    # Projection pushdown: only the requested column chunks are fetched and decoded;
+    # pre_buffer coalesces the adjacent ranges into fewer reads. `filters` prunes row groups
+    # by their min/max statistics (and drops non-matching rows).
+    kw = dict(columns=list(dict.fromkeys(columns)) if columns is not None else None,
+              filters=[tuple(f) for f in filters] if filters else None,
+              pre_buffer=True, use_threads=True, use_pandas_metadata=True)
+    try:
+        # local files are memory-mapped: pages come straight from the page cache, no read() copies
+        return pq.read_table(str(path), memory_map=True, **kw)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # filesystem without mmap support -> plain buffered read
+        return pq.read_table(path, **kw)
+
+@lru_cache(maxsize=32)
+def _cached_read_parquet(path_str: str, version: Tuple[int, int, int], columns: Optional[Tuple[str, ...]],
+                         filters=None) -> pd.DataFrame:
+    # keyed by path + file_version: decoded once per process (runner + validator re-runs). Failures are not cached.
+    path = Path(path_str)
     try:
-        return pd.read_parquet(path)
+        # split_blocks: one block per column, so null-free numeric columns wrap the Arrow buffers
+        # zero-copy instead of being consolidated into a fresh 2-D block; self_destruct frees
+        # each Arrow column as soon as it is converted.
+        return _read_table(path, columns, filters).to_pandas(split_blocks=True, self_destruct=True)
     except FileNotFoundError:
         raise # Re-raise FileNotFoundError
     except Exception as e:
         try:
             # engine auto fallback
-            return pd.read_parquet(path, engine="pyarrow")
+            df = pd.read_parquet(path, engine="pyarrow", filters=[tuple(f) for f in filters] if filters else None)
+            return df if columns is None else df[list(dict.fromkeys(columns))]
         except Exception as e2:
             _fail(f"Failed to read parquet file {path}. Errors: {e}, {e2}")
 
+def _read_parquet(path: Path, columns: Optional[List[str]] = None, filters=None) -> pd.DataFrame:
+    # We rely on the caller (loaders) to handle FileNotFoundError based on 'strict' mode if the file is optional.
+    # file_version raises FileNotFoundError for a missing artifact
+    df = _cached_read_parquet(str(path), file_version(path), tuple(columns) if columns is not None else None,
+                              tuple(tuple(f) for f in filters) if filters else None)
+    # callers rename / assign columns on their frame; a shallow copy keeps the cached one intact
+    return df.copy(deep=False)
+
+def _first_num0(s: pd.Series) -> float:
+    """float of the first cell (non-numeric/missing -> 0.0) without coercing the whole column."""
+    try:
+        val = float(s.iloc[0])
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if val != val else val  # NaN -> 0.0, as fillna did
+
+def _median_is_positive(a: np.ndarray) -> bool:
+    """`np.median(a) > 0` from sign counts (O(n), no sort/partition). `a` must be NaN-free."""
+    n = a.size
+    if n == 0:
+        return False
+    pos_mask = a > 0
+    n_nonpos = n - int(np.count_nonzero(pos_mask))
+    lo, hi = (n - 1) // 2, n // 2  # middle positions in sorted order; positives fill [n_nonpos, n)
+    if lo >= n_nonpos:
+        return True   # both middle elements positive
+    if hi < n_nonpos:
+        return False  # both middle elements <= 0
+    # even n straddling zero: median = (largest non-positive + smallest positive) / 2
+    return float(a[~pos_mask].max()) + float(a[pos_mask].min()) > 0
+
+def _parquet_columns(path: Path) -> List[str]:
+    """Column names from the parquet footer (no data pages read). [] for a zero-row file."""
+    try:
+        pf = pq.ParquetFile(path)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        _fail(f"Failed to read parquet schema {path}. Error: {e}")
+    if pf.metadata.num_rows == 0:
+        return []  # mirrors df.empty, so _resolve_col reports it the same way
+    # a pandas index written to parquet is restored as index, never as a column
+    return [n for n in pf.schema_arrow.names if not str(n).startswith("__index_level_")]
+
+def _month_bounds(path: Path, mcol: str) -> Optional[Tuple[Any, Any]]:
+    """(min, max) of `mcol` from the row-group statistics in the footer; None when not recorded."""
+    try:
+        md = pq.ParquetFile(path).metadata
+    except Exception:
+        return None
+    idx = next((j for j in range(md.num_columns) if md.schema.column(j).path == mcol), None)
+    if idx is None or md.num_row_groups == 0:
+        return None
+    lo = hi = None
+    for i in range(md.num_row_groups):
+        st = md.row_group(i).column(idx).statistics
+        if st is None or not st.has_min_max:
+            return None
+        lo = st.min if lo is None else min(lo, st.min)
+        hi = st.max if hi is None else max(hi, st.max)
+    return lo, hi
+
+def _month_filters(mcol: str, months: Optional[Tuple[Any, Any]]):
+    # rows outside the P&L horizon never reach the spine, so they need not be read at all
+    if months is None:
+        return None
+    return [(mcol, ">=", months[0]), (mcol, "<=", months[1])]
+
 # Robust resolver (Enhanced from previous patch)
+_NORM_RE = re.compile(r'[^a-z0-9]')
+_NORM_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if not c.isalnum()))
+# Prefix drift tolerance (common prefixes seen in the pipeline)
+_PREFIX_RE = re.compile(r'^(revolver_|debt_|capex_|monthly_|tax_)', re.I)
+
+@lru_cache(maxsize=512)
 def _norm_key(s: str) -> str:
     """lowercase + strip non-alphanum to tolerate minor header drift."""
-    return re.sub(r'[^a-z0-9]', '', str(s).lower())
+    low = str(s).lower()
+    # str.translate covers plain ASCII headers; the regex also strips non-ASCII characters
+    return low.translate(_NORM_TABLE) if low.isascii() else _NORM_RE.sub('', low)
+
+@lru_cache(maxsize=64)
+def _candidate_keys(candidates: Tuple) -> Tuple[Tuple[str, ...], Tuple[str, ...], frozenset]:
+    """Lower-cased, normalized and de-prefixed keys of a synonym list, computed once per list."""
+    lower = tuple(str(c).lower() for c in candidates)
+    norm = tuple(_norm_key(c) for c in candidates)
+    base_norm = frozenset(_norm_key(_PREFIX_RE.sub('', c)) for c in candidates if isinstance(c, str))
+    return lower, norm, base_norm
 
 def _resolve_col(df, candidates, *, required=True, ctx=""):
-    """Robust column resolver: case-insensitive, underscore/spacing/prefix tolerant."""
-    if df is None or df.empty:
+    """Robust column resolver: case-insensitive, underscore/spacing/prefix tolerant.
+
+    `df` may be a DataFrame or a plain list of column names (e.g. from `_parquet_columns`).
+    """
+    if isinstance(df, pd.DataFrame):
+        cols = [] if df.empty else list(df.columns)
+    else:
+        cols = list(df) if df is not None else []
+    if not cols:
         if required:
             _fail(f"Cannot resolve {ctx} because input DataFrame is empty or None.")
         return None
 
-    cols = list(df.columns)
+    # Lookup tables are built in one pass over the columns; each match tier below is then
+    # O(1) per candidate. Later duplicates win, as before.
+    exact = set()
+    lower = {}
+    norm = {}
+    for c in cols:
+        exact.add(c)
+        lower[str(c).lower()] = c
+        norm[_norm_key(c)] = c
+
+    # the synonym lists are module constants, so their keys come from the cache
+    cand_lower, cand_norm, base_cands_norm = _candidate_keys(tuple(candidates))
+
     # Exact match
     for c in candidates:
-        if c in df.columns:
+        if c in exact:
             return c
     # Case-insensitive exact
-    lower = {str(c).lower(): c for c in cols}
-    for c in candidates:
-        if str(c).lower() in lower:
-            return lower[str(c).lower()]
+    for key in cand_lower:
+        if key in lower:
+            return lower[key]
     # Normalized
-    norm = {_norm_key(c): c for c in cols}
-    for c in candidates:
-        key = _norm_key(c)
+    for key in cand_norm:
         if key in norm:
             return norm[key]
             
-    # Prefix drift tolerance (common prefixes seen in the pipeline)
-    str_candidates = [c for c in candidates if isinstance(c, str)]
-    prefix_regex = r'^(revolver_|debt_|capex_|monthly_|tax_)'
-    base_cands = [re.sub(prefix_regex, '', c, flags=re.I) for c in str_candidates]
-    base_cands_norm = {_norm_key(x) for x in base_cands}
-    
+    # Prefix drift tolerance: first column (in column order) whose de-prefixed key matches
     for c in cols:
-        if isinstance(c, str):
-            c_base = re.sub(prefix_regex, '', c, flags=re.I)
-            if _norm_key(c_base) in base_cands_norm:
-                return c
+        if isinstance(c, str) and _norm_key(_PREFIX_RE.sub('', c)) in base_cands_norm:
+            return c
                 
     if required:
         _fail(f"Missing any of {candidates} (ctx={ctx}). Available={cols[:35]}")
@@ -172,24 +295,39 @@ M0_WIDE_VALUE_SYNS = ["Value_NAD_000","Value_NAD","Value"]
 # ---------- loaders ----------
 
 # UPDATED: Use _resolve_col.
-def _load_m2_pl(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def _m2_pl_path(outputs: Path) -> Optional[Path]:
     # Search for both common names seen in the pipeline logs
     p1 = outputs / "m2_pl_schedule.parquet"
     p2 = outputs / "m2_profit_and_loss_stub.parquet" 
-    
-    path = p1 if p1.exists() else (p2 if p2.exists() else None)
+    return p1 if p1.exists() else (p2 if p2.exists() else None)
+
+def _m2_pl_horizon(outputs: Path) -> Optional[Tuple[Any, Any]]:
+    """P&L spine's (first, last) month from footer statistics, so the other loaders can prune early."""
+    path = _m2_pl_path(outputs)
+    if path is None:
+        return None
+    try:
+        mcol = _resolve_col(_parquet_columns(path), MONTH_SYNS, required=False)
+    except Exception:
+        return None  # _load_m2_pl reports the problem
+    return _month_bounds(path, mcol) if mcol else None
+
+def _load_m2_pl(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    path = _m2_pl_path(outputs)
     if path is None:
         # This file is fundamental; we fail if missing.
         _fail("M2 P&L schedule not found (looked for m2_pl_schedule.parquet, m2_profit_and_loss_stub.parquet)")
 
-    df = _read_parquet(path)
+    cols = _parquet_columns(path)
     
-    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx="Month_Index (M2)")
-    npat = _resolve_col(df, NPAT_SYNS, required=True, ctx="NPAT (M2)")
-    da   = _resolve_col(df, DA_SYNS,   required=True, ctx="DA (M2)")
+    mcol = _resolve_col(cols, MONTH_SYNS, required=True, ctx="Month_Index (M2)")
+    npat = _resolve_col(cols, NPAT_SYNS, required=True, ctx="NPAT (M2)")
+    da   = _resolve_col(cols, DA_SYNS,   required=True, ctx="DA (M2)")
     
     keep = [mcol, npat, da]
-    base = df[keep].copy()
+    base = _read_parquet(path, keep)
+    if len(set(keep)) < len(keep):
+        base = base[keep]  # one source column serving two roles: materialize both
     
     rename_map = {mcol:"Month_Index", npat:"NPAT_NAD_000", da:"DA_NAD_000"}
         
@@ -198,28 +336,28 @@ def _load_m2_pl(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     return base, {"pl_path": str(path), "npat_col": npat, "da_col": da}
 
 # UPDATED: Use _resolve_col
-def _load_m2_wc(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def _load_m2_wc(outputs: Path, months: Optional[Tuple[Any, Any]] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m2_working_capital_schedule.parquet"
     try:
-        df = _read_parquet(path)
+        cols = _parquet_columns(path)
     except FileNotFoundError:
         # This file is fundamental; we fail if missing.
         _fail(f"Required artifact not found: {path}")
 
-    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx="Month_Index (M2 WC)")
-    ncc  = _resolve_col(df, NWC_CF_SYNS, required=True, ctx="NWC_CF (M2 WC)")
+    mcol = _resolve_col(cols, MONTH_SYNS, required=True, ctx="Month_Index (M2 WC)")
+    ncc  = _resolve_col(cols, NWC_CF_SYNS, required=True, ctx="NWC_CF (M2 WC)")
     
-    wc = df[[mcol, ncc]].copy()
+    wc = _read_parquet(path, [mcol, ncc], _month_filters(mcol, months))
     wc.rename(columns={mcol:"Month_Index", ncc:"NWC_CF_NAD_000"}, inplace=True)
     _ok(f"M2 WC columns -> month='Month_Index', NWC_CF='{ncc}'")
     return wc, {"wc_path": str(path), "nwc_cf_col": ncc}
 
 # NEW: Loader for M4 Tax Paid
-def _load_m4_tax(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def _load_m4_tax(outputs: Path, strict: bool, months: Optional[Tuple[Any, Any]] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m4_tax_schedule.parquet"
 
     try:
-        df = _read_parquet(path)
+        cols = _parquet_columns(path)
     except FileNotFoundError:
         msg = "M4 tax schedule not found (m4_tax_schedule.parquet)."
         if strict:
@@ -228,10 +366,10 @@ def _load_m4_tax(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
         # Return empty DF, handled during merge in assembler
         return pd.DataFrame(columns=["Month_Index", "Tax_Paid_NAD_000"]), {"source": None, "reason": msg}
 
-    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx="Month_Index (M4)")
-    tcol = _resolve_col(df, TAX_PAID_SYNS, required=True, ctx="Tax_Paid (M4)")
+    mcol = _resolve_col(cols, MONTH_SYNS, required=True, ctx="Month_Index (M4)")
+    tcol = _resolve_col(cols, TAX_PAID_SYNS, required=True, ctx="Tax_Paid (M4)")
     
-    tax = df[[mcol, tcol]].copy()
+    tax = _read_parquet(path, [mcol, tcol], _month_filters(mcol, months))
     tax.rename(columns={mcol:"Month_Index", tcol:"Tax_Paid_NAD_000"}, inplace=True)
     _ok(f"M4 Tax columns -> month='Month_Index', Tax_Paid='{tcol}'")
     return tax, {"tax_path": str(path), "tax_paid_col": tcol}
@@ -241,7 +379,7 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
     path = outputs / "m1_capex_schedule.parquet"
 
     try:
-        df = _read_parquet(path)
+        cols = _parquet_columns(path)
     except FileNotFoundError:
         msg = "M1 CAPEX schedule not found (m1_capex_schedule.parquet)."
         if strict:
@@ -250,9 +388,9 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
         # Return empty DF, handled during merge
         return pd.DataFrame(columns=["Month_Index", "CFI_NAD_000"]), {"source": None, "reason": msg}
     
-    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx="Month_Index (M1)")
+    mcol = _resolve_col(cols, MONTH_SYNS, required=True, ctx="Month_Index (M1)")
     # Use the robust resolver to find the CFI/CAPEX column.
-    cfi_col = _resolve_col(df, CFI_SYNS, required=False, ctx="CFI/CAPEX (M1)")
+    cfi_col = _resolve_col(cols, CFI_SYNS, required=False, ctx="CFI/CAPEX (M1)")
     
     if cfi_col is None:
         if strict:
@@ -260,17 +398,20 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
         else:
             _warn("CFI column not resolved; defaulting to zeros.")
             # Ensure Month_Index is correctly sourced from the file if present
-            return pd.DataFrame({"Month_Index": df[mcol], "CFI_NAD_000": 0.0}), {"cfi_col": None, "sign_flipped": False, "path": str(path)}
+            return pd.DataFrame({"Month_Index": _read_parquet(path, [mcol])[mcol], "CFI_NAD_000": 0.0}), {"cfi_col": None, "sign_flipped": False, "path": str(path)}
 
-    cfi = df[[mcol, cfi_col]].copy()
+    cfi = _read_parquet(path, [mcol, cfi_col])
     cfi.rename(columns={mcol:"Month_Index", cfi_col:"CFI_NAD_000"}, inplace=True)
     
     # Ensure outflow negative (sign flip logic remains the same)
     # Ensure numeric before median calculation
-    cfi_series = pd.to_numeric(cfi["CFI_NAD_000"], errors='coerce').fillna(0.0)
-    med = float(np.nanmedian(cfi_series.values))
+    cfi_series = cfi["CFI_NAD_000"]
+    if not pd.api.types.is_numeric_dtype(cfi_series.dtype):
+        cfi_series = pd.to_numeric(cfi_series, errors='coerce')
+    if cfi_series.hasnans:
+        cfi_series = cfi_series.fillna(0.0)  # clean numeric schedules skip both copies
     flipped = False
-    if med > 0:
+    if _median_is_positive(cfi_series.to_numpy()):
         cfi["CFI_NAD_000"] = -cfi_series # Apply negation to the numeric series
         flipped = True
         _warn(f"Detected mostly positive CAPEX cash ('{cfi_col}') – flipping sign to outflow negative.")
@@ -281,7 +422,7 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
     return cfi, {"cfi_col": cfi_col, "sign_flipped": flipped, "path": str(path)}
 
 # UPDATED: Return CFF DataFrame, Interest DataFrame, and Meta Dict.
-def _load_m3_revolver(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
+def _load_m3_revolver(outputs: Path, strict: bool, months: Optional[Tuple[Any, Any]] = None) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
     # File loading with fallback
     p1 = outputs / "m3_revolver_schedule.parquet"
     p2 = outputs / "m3_financing_schedule.parquet"
@@ -298,68 +439,45 @@ def _load_m3_revolver(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, pd.Dat
                pd.DataFrame(columns=["Month_Index", "Interest_Paid_NAD_000"]), \
                {"source": None, "reason": msg}
 
-    df = _read_parquet(path)
+    cols = _parquet_columns(path)
     src = str(path)
 
     # Resolve columns
     try:
-        mcol = _resolve_col(df, REV_MONTH_SYNS, required=True, ctx="Month_Index (M3)")
-        dcol = _resolve_col(df, REV_DRAW_SYNS,  required=True, ctx="revolver_draw (M3)")
-        rcol = _resolve_col(df, REV_REPAY_SYNS, required=True, ctx="revolver_repay (M3)")
+        mcol = _resolve_col(cols, REV_MONTH_SYNS, required=True, ctx="Month_Index (M3)")
+        dcol = _resolve_col(cols, REV_DRAW_SYNS,  required=True, ctx="revolver_draw (M3)")
+        rcol = _resolve_col(cols, REV_REPAY_SYNS, required=True, ctx="revolver_repay (M3)")
     except RuntimeError:
-        preview = list(df.columns)[:35]
+        preview = cols[:35]
         _fail(f"Cannot resolve revolver draw/repay columns. Tried draws={REV_DRAW_SYNS}, repay={REV_REPAY_SYNS}. Available (first 35): {preview}")
 
     # Optional columns
-    fcol = _resolve_col(df, REV_FEES_SYNS, required=False, ctx="revolver_fees (M3)")
-    icol = _resolve_col(df, REV_INT_SYNS,   required=False, ctx="revolver_interest (M3)")
+    fcol = _resolve_col(cols, REV_FEES_SYNS, required=False, ctx="revolver_fees (M3)")
+    icol = _resolve_col(cols, REV_INT_SYNS,   required=False, ctx="revolver_interest (M3)")
+    df = _read_parquet(path, [c for c in (mcol, dcol, rcol, fcol, icol) if c is not None], _month_filters(mcol, months))
 
     _ok(f"M3 revolver mapping -> draw='{dcol}', repay='{rcol}', "
         f"fees='{fcol or 'N/A'}', interest='{icol or 'N/A'}' (source={src})")
 
     # Calculate CFF (logic retained from original)
-    # We operate on copies to avoid modifying the source dataframe view.
-    cff = df[[mcol]].copy()
-    cff.rename(columns={mcol:"Month_Index"}, inplace=True)
-    cff["CFF_NAD_000"] = 0.0
-    
-    # Draws (+), repayments (−). Use join based on index (which aligns with df here).
-    cff = cff.join(df[[dcol]].rename(columns={dcol:"_draw"}), rsuffix='_m3d')
-    cff = cff.join(df[[rcol]].rename(columns={rcol:"_repay"}), rsuffix='_m3r')
-    
-    cff["_draw"]  = pd.to_numeric(cff["_draw"], errors="coerce").fillna(0.0)
-    cff["_repay"] = pd.to_numeric(cff["_repay"], errors="coerce").fillna(0.0)
-    # Assuming repayments are positive values that reduce cash flow
-    cff["CFF_NAD_000"] = cff["_draw"] - cff["_repay"]
+    # All columns come from the same frame, so rows are already aligned: plain array arithmetic.
+    # Draws (+), repayments (−). Assuming repayments are positive values that reduce cash flow
+    cff_arr = float64_or_zero(df[dcol]) - float64_or_zero(df[rcol])
     
     # Fees (−)
     fee_used = False
     if fcol is not None:
-        cff = cff.join(df[[fcol]].rename(columns={fcol:"_fees"}), rsuffix='_m3f')
-        cff["_fees"] = pd.to_numeric(cff["_fees"], errors="coerce").fillna(0.0)
         # Assuming fees are positive values that reduce cash flow
-        cff["CFF_NAD_000"] = cff["CFF_NAD_000"] - cff["_fees"]
+        cff_arr -= float64_or_zero(df[fcol])
         fee_used = True
 
     _ok("CFF derived from M3 revolver schedule (draws − repayments − fees).")
-    cff = cff[["Month_Index","CFF_NAD_000"]]
+    cff = pd.DataFrame({"Month_Index": df[mcol].to_numpy(), "CFF_NAD_000": cff_arr})
 
     # Extract Interest Paid DataFrame
-    # Initialize with zeros aligned to the schedule's months
-    interest_df = pd.DataFrame({"Month_Index": df[mcol], "Interest_Paid_NAD_000": 0.0})
-    
-    if icol is not None:
-        # If interest column exists, extract it
-        interest_data = df[[mcol, icol]].copy()
-        interest_data.rename(columns={mcol:"Month_Index", icol:"_interest_val"}, inplace=True)
-        interest_data["_interest_val"] = pd.to_numeric(interest_data["_interest_val"], errors="coerce").fillna(0.0)
-        
-        # Merge back to overwrite the zeros with actual data where available
-        # We use an outer merge on Month_Index and combine the columns
-        interest_df = interest_df.merge(interest_data, on="Month_Index", how="outer")
-        # If _interest_val exists (not NaN), use it, otherwise use the existing Interest_Paid_NAD_000 (which was initialized to 0.0)
-        interest_df["Interest_Paid_NAD_000"] = interest_df["_interest_val"].fillna(interest_df["Interest_Paid_NAD_000"])
-        interest_df = interest_df[["Month_Index", "Interest_Paid_NAD_000"]]
+    # Same rows as the schedule; zeros when no interest column resolved (or a cell is non-numeric)
+    interest_arr = float64_or_zero(df[icol]) if icol is not None else np.zeros(len(df), dtype=np.float64)
+    interest_df = pd.DataFrame({"Month_Index": df[mcol].to_numpy(), "Interest_Paid_NAD_000": interest_arr})
 
     meta = {"rev_path": src, "source": src, "month_col": mcol, "draw_col": dcol, "repay_col": rcol, "fee_col": fcol, "interest_col": icol, "fees_included_in_cff": fee_used}
     
@@ -396,13 +514,13 @@ def _load_opening_cash(outputs: Path, base_months: pd.Series, strict: bool) -> T
             m0 = int(min(base_months.min(), df[mcol].min()))
             row = df[df[mcol] == m0]
             if not row.empty:
-                val = float(pd.to_numeric(row[cash_col], errors="coerce").fillna(0.0).iloc[0])
+                val = _first_num0(row[cash_col])
             else:
                 # pick first value if specific month not found
-                val = float(pd.to_numeric(df[cash_col], errors="coerce").fillna(0.0).iloc[0])
+                val = _first_num0(df[cash_col])
         else:
             # take first row if no month index
-            val = float(pd.to_numeric(df[cash_col], errors="coerce").fillna(0.0).iloc[0])
+            val = _first_num0(df[cash_col])
         _ok(f"Opening cash source: M0:{cash_col}@{str(path.name)} -> {val:,.2f} (NAD '000)")
         return val, {"source": f"M0:{cash_col}", "path": str(path), "policy_default_zero": False}
 
@@ -413,10 +531,12 @@ def _load_opening_cash(outputs: Path, base_months: pd.Series, strict: bool) -> T
     if line_col and val_col:
         # normalize names using _norm_key
         targets = [_norm_key(c) for c in CASH_OPEN_SYNS]
-        df["_key"] = df[line_col].astype(str).map(_norm_key)
-        row = df[df["_key"].isin(targets)]
+        # same normalization as _norm_key, but in Arrow's vectorized string kernels (no per-row callback)
+        keys = pc.replace_substring_regex(pc.utf8_lower(pa.array(df[line_col].astype(str), pa.string())),
+                                          pattern='[^a-z0-9]', replacement='')
+        row = df[pc.is_in(keys, value_set=pa.array(targets, pa.string())).to_numpy(zero_copy_only=False)]
         if not row.empty:
-            val = float(pd.to_numeric(row[val_col], errors="coerce").fillna(0.0).iloc[0])
+            val = _first_num0(row[val_col])
             _ok(f"Opening cash source: M0:{line_col}='{row[line_col].iloc[0]}' -> {val:,.2f} (NAD '000)")
             return val, {"source": f"M0:{line_col} match", "path": str(path), "policy_default_zero": False}
 
@@ -435,29 +555,50 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
     outputs = Path(outputs_dir)
     
     # 1. Load all components
-    # M2 P&L (NPAT, DA)
-    base, pl_m = _load_m2_pl(outputs)
-    # M2 WC (NWC_CF)
-    wc_df, wc_m = _load_m2_wc(outputs)
-    # M1 CFI (CAPEX)
-    cfi_df, cfi_m = _load_m1_cfi(outputs, strict=strict)
-    # M3 CFF and Interest Paid
-    cff_df, interest_df, cff_m = _load_m3_revolver(outputs, strict=strict)
-    # M4 Tax Paid
-    tax_df, tax_m = _load_m4_tax(outputs, strict=strict)
-
-    # 2. Assemble the base dataframe using Month_Index from M2 P&L as the spine
-    if base.empty:
-        _fail("M2 P&L schedule is empty. Cannot establish master timeline.")
-
-    months = base["Month_Index"].copy()
-    months = months.sort_values().unique() # Ensure unique months
+    # Independent files, so the reads run concurrently; results are collected in the original order.
+    # The P&L horizon comes from its footer, so month pruning does not serialize the reads.
+    # M1 CAPEX is read in full: its sign check looks at the whole schedule.
+    horizon = _m2_pl_horizon(outputs)
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        # M2 P&L (NPAT, DA)
+        f_pl = ex.submit(_load_m2_pl, outputs)
+        # M2 WC (NWC_CF)
+        f_wc = ex.submit(_load_m2_wc, outputs, months=horizon)
+        # M1 CFI (CAPEX)
+        f_cfi = ex.submit(_load_m1_cfi, outputs, strict=strict)
+        # M3 CFF and Interest Paid
+        f_cff = ex.submit(_load_m3_revolver, outputs, strict=strict, months=horizon)
+        # M4 Tax Paid
+        f_tax = ex.submit(_load_m4_tax, outputs, strict=strict, months=horizon)
+
+        base, pl_m = f_pl.result()
+
+        # 2. Assemble the base dataframe using Month_Index from M2 P&L as the spine
+        if base.empty:
+            _fail("M2 P&L schedule is empty. Cannot establish master timeline.")
+
+        # M0 opening cash only needs the spine's first month, so it overlaps the other reads too
+        f_open = ex.submit(_load_opening_cash, outputs, base["Month_Index"], strict=strict)
+
+        wc_df, wc_m = f_wc.result()
+        cfi_df, cfi_m = f_cfi.result()
+        cff_df, interest_df, cff_m = f_cff.result()
+        tax_df, tax_m = f_tax.result()
+
+    months = base["Month_Index"].sort_values().unique() # Ensure unique months
     df = pd.DataFrame({"Month_Index": months})
-
-    # Helper to ensure inputs are grouped by month before merging (prevents duplicate rows)
-    def prep_merge(component_df):
-        if 'Month_Index' not in component_df.columns or component_df.empty:
-            return component_df
+    spine = pd.Index(months)
+
+    # Helper: group each input by month (prevents duplicate rows), then align the sums onto the
+    # P&L timeline with one reindex instead of a left merge; months a component lacks become 0.0.
+    def assign_component(component_df):
+        if 'Month_Index' not in component_df.columns:
+            return
+        if component_df.empty:
+            # placeholder frame from a missing optional artifact
+            for col in component_df.columns.drop('Month_Index'):
+                df[col] = np.zeros(len(df))
+            return
         # Ensure numeric columns only before sum
         numeric_cols = component_df.select_dtypes(include=np.number).columns.tolist()
         # Keep Month_Index for grouping, but don't sum it if it's numeric
@@ -465,19 +606,42 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
              numeric_cols.remove('Month_Index')
         
         if not numeric_cols:
-            return component_df[['Month_Index']]
-
-        return component_df.groupby('Month_Index', as_index=False)[numeric_cols].sum()
-
-    # Merge all components onto the spine (using 'left' merge based on the P&L timeline)
-    df = df.merge(prep_merge(base), on="Month_Index", how="left")
-    df = df.merge(prep_merge(wc_df), on="Month_Index", how="left")
-    df = df.merge(prep_merge(tax_df), on="Month_Index", how="left")
-    df = df.merge(prep_merge(interest_df), on="Month_Index", how="left")
-    df = df.merge(prep_merge(cfi_df), on="Month_Index", how="left")
-    df = df.merge(prep_merge(cff_df), on="Month_Index", how="left")
-
-    # 3. Ensure numeric types and fill NaNs (if any component missed months or was empty)
+            return
+
+        keys = component_df['Month_Index']
+        if keys.is_unique and all(isinstance(component_df[c].dtype, np.dtype) for c in numeric_cols):
+            # One row per month (the usual case): the groupby is a no-op, so gather straight onto
+            # the spine and skip the key factorization. NaN cells -> 0, as the groupby sum would.
+            kv = keys.to_numpy()
+            if keys.is_monotonic_increasing and spine.is_monotonic_increasing:
+                # sorted keys (M0 contract) against the sorted spine: binary search, no hash table
+                take = np.minimum(np.searchsorted(kv, spine.to_numpy()), len(kv) - 1)
+                hit = kv[take] == spine.to_numpy()
+            else:
+                locs = pd.Index(kv).get_indexer(spine)
+                hit = locs >= 0
+                take = np.maximum(locs, 0)
+            dst = np.flatnonzero(hit)
+            src = take[dst]
+            for col in numeric_cols:
+                vals = component_df[col].to_numpy()
+                # zero-filled float64 spine column, overwritten where the month exists; float32 or
+                # integer sources are widened so the statement columns are float64 throughout
+                out = np.zeros(len(spine), dtype=np.float64)
+                out[dst] = vals[src]
+                np.copyto(out, 0.0, where=np.isnan(out))
+                df[col] = out
+            return
+
+        sums = component_df.groupby('Month_Index')[numeric_cols].sum().reindex(spine, fill_value=0.0)
+        for col in numeric_cols:
+            df[col] = sums[col].to_numpy()
+
+    for component_df in (base, wc_df, tax_df, interest_df, cfi_df, cff_df):
+        assign_component(component_df)
+
+    # 3. Ensure every component column exists. assign_component only emits numeric per-month
+    # sums (NaN cells sum as 0, absent months reindex to 0.0), so no coercion pass is needed.
     component_cols = [
         "NPAT_NAD_000", "DA_NAD_000", "NWC_CF_NAD_000", 
         "Tax_Paid_NAD_000", "Interest_Paid_NAD_000",
@@ -485,24 +649,20 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
     ]
     for col in component_cols:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
-        elif strict:
+            continue
+        if strict:
              # This should not happen if loaders correctly return DFs with columns even when data is missing
             _fail(f"Missing expected column '{col}' after assembly.")
-        else:
-            # Ensure column exists if strict=False (e.g. if M4 was missing)
-            df[col] = 0.0
+        # Ensure column exists if strict=False (e.g. if M4 was missing)
+        df[col] = np.zeros(len(df))
 
     # 4. Calculate CFO using the stabilized formula required by the validator
     # CFO = NPAT + DA + NWC_CF - Tax_Paid - Interest_Paid
     # Assumption: Tax_Paid and Interest_Paid are positive numbers representing outflows.
-    df["CFO_NAD_000"] = (
-        df["NPAT_NAD_000"] + 
-        df["DA_NAD_000"] + 
-        df["NWC_CF_NAD_000"] - 
-        df["Tax_Paid_NAD_000"] - 
-        df["Interest_Paid_NAD_000"]
-    )
+    # Computed on the raw arrays: no intermediate Series / index handling per operator.
+    npat, da, nwc, tax, intp = (df[c].to_numpy() for c in (
+        "NPAT_NAD_000", "DA_NAD_000", "NWC_CF_NAD_000", "Tax_Paid_NAD_000", "Interest_Paid_NAD_000"))
+    df["CFO_NAD_000"] = npat + da + nwc - tax - intp
     _ok("CFO calculated using stabilized formula: NPAT + DA + NWC_CF - Tax_Paid - Interest_Paid.")
 
     # 5. Rename columns to the specific names required by the validator
@@ -534,8 +694,8 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
     df = df[final_order]
 
 
-    # 6. Opening cash (policy default 0 if absent)
-    opening_cash, open_m = _load_opening_cash(outputs, df["Month_Index"], strict=strict)
+    # 6. Opening cash (policy default 0 if absent; loaded concurrently in step 1)
+    opening_cash, open_m = f_open.result()
 
     # 7. Finalizing Metadata and Smoke
     # simple smoke meta (using renamed columns)
@@ -29,12 +29,17 @@ Outputs
 All amounts in NAD '000.
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any, Optional
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from pathlib import Path
 
+from terra_nova.modules.common import file_version, float64_or_zero
+
 # ---------- utilities ----------
 
 def _print(msg: str) -> None:
@@ -52,28 +57,80 @@ def _ok(msg: str) -> None:
 def _info(msg: str) -> None:
     _print(f"[M5][INFO] {msg}")
 
-def _read_parquet(path: Path) -> pd.DataFrame:
+@lru_cache(maxsize=32)
+def _pf(path_str: str, version: Tuple[int, int, int]) -> pq.ParquetFile:
+    # one footer parse per file_version; repeated builds (sweeps, re-runs) only decode column data
+    return pq.ParquetFile(path_str)
+
+def _open_pf(path: Path) -> pq.ParquetFile:
     if not path.exists():
         _fail(f"Required artifact not found: {path}")
+    return _pf(str(path), file_version(path))
+
+def _schema_names(path: Path) -> List[str]:
+    """Column names from the parquet footer; no column data is decoded."""
+    # a pandas index written to parquet is restored as index, never as a column
+    return [n for n in _open_pf(path).schema_arrow.names if not str(n).startswith("__index_level_")]
+
+def _read_parquet(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read `path`; with `columns` (resolved via `_schema_names`) only those columns are decoded."""
+    pf = _open_pf(path)
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
     try:
-        return pd.read_parquet(path)
+        return pf.read(columns=columns, use_pandas_metadata=True).to_pandas()
     except Exception:
         # engine auto fallback
-        return pd.read_parquet(path, engine="pyarrow")
-
-def _syn(df: pd.DataFrame, candidates: List[str], role: str) -> str:
-    cols = list(df.columns)
-    for c in candidates:
-        if c in cols:
-            return c
-    preview = cols[:35]
-    _fail(f"Cannot resolve role '{role}'. Tried {list(candidates)}. Available (first 35): {preview}")
-    return ""  # unreachable
-
-def _zero_series(months: pd.Series) -> pd.Series:
-    s = pd.Series(0.0, index=months.index)
-    s.name = "zero"
-    return s
+        return pd.read_parquet(path, engine="pyarrow", columns=columns)
+
+# ASCII punctuation/whitespace, deleted by str.translate in C instead of a per-character generator
+_NON_ALNUM_TABLE = str.maketrans("", "", "".join(ch for ch in map(chr, range(128)) if not ch.isalnum()))
+
+def _alnum_upper(s: str) -> str:
+    """Upper-cased `s` with only its alphanumeric characters kept."""
+    u = s.upper()
+    if u.isascii():
+        return u.translate(_NON_ALNUM_TABLE)
+    return "".join(ch for ch in u if ch.isalnum())  # Unicode letters/digits survive, as before
+
+def _month_stats(pf: pq.ParquetFile, mcol: str) -> Optional[List[Tuple[Any, Any]]]:
+    """Per-row-group (min, max) of `mcol` from the footer; None when any group lacks statistics."""
+    md = pf.metadata
+    idx = next((j for j in range(md.num_columns) if md.schema.column(j).path == mcol), None)
+    if idx is None or md.num_row_groups == 0:
+        return None
+    out = []
+    for i in range(md.num_row_groups):
+        st = md.row_group(i).column(idx).statistics
+        if st is None or not st.has_min_max:
+            return None
+        out.append((st.min, st.max))
+    return out
+
+def _read_row_group(pf: pq.ParquetFile, i: int, columns: List[str]) -> pd.DataFrame:
+    return pf.read_row_group(i, columns=list(dict.fromkeys(columns)), use_pandas_metadata=True).to_pandas()
+
+def _require(found: Dict[str, Optional[str]], names: List[str], role: str, label: str) -> str:
+    """Column resolved for `role` by `_resolve_all`; fails with the tried synonyms otherwise."""
+    col = found[role]
+    if col is None:
+        preview = names[:35]
+        _fail(f"Cannot resolve role '{label}'. Tried {list(_ROLE_SYNS[role])}. Available (first 35): {preview}")
+    return col
+
+def _gather(months: np.ndarray, comp: pd.DataFrame, col: str) -> np.ndarray:
+    """`comp[col]` (coerced, NaN -> 0) aligned onto `months`; months absent from `comp` -> 0.0."""
+    vals = float64_or_zero(comp[col])
+    keys = comp["Month_Index"].to_numpy()
+    if not comp["Month_Index"].is_unique:
+        # several rows for one month: one value per month (instead of fanning the spine out)
+        per_month = pd.Series(vals).groupby(keys).sum()
+        keys, vals = per_month.index.to_numpy(), per_month.to_numpy()
+    locs = pd.Index(keys).get_indexer(months)
+    hit = locs >= 0
+    out = np.zeros(len(months))
+    out[hit] = vals[locs[hit]]
+    return out
 
 # ---------- synonym dictionaries ----------
 
@@ -122,43 +179,66 @@ CASH_OPEN_SYNS = [
     "Opening_Cash_NAD_000","Cash_and_Cash_Equivalents","Cash"
 ]
 M0_WIDE_VALUE_SYNS = ["Value_NAD_000","Value_NAD","Value"]
+M0_LINE_SYNS = ["Line_Item","Item","Line","Account","LineItem"]
+M0_LONG_VALUE_SYNS = ["Value_NAD_000","Value_NAD","Value","Amount_NAD_000","Amount_NAD","Amount"]
+
+_ROLE_SYNS: Dict[str, List[str]] = {
+    "month": MONTH_SYNS, "npat": NPAT_SYNS, "da": DA_SYNS, "nwc_cf": NWC_CF_SYNS, "cfi": CFI_SYNS,
+    "rev_draw": REV_DRAW_SYNS, "rev_repay": REV_REPAY_SYNS, "rev_fees": REV_FEES_SYNS, "rev_int": REV_INT_SYNS,
+    "cash_open": CASH_OPEN_SYNS, "m0_line": M0_LINE_SYNS, "m0_value": M0_LONG_VALUE_SYNS,
+}
+
+# synonym -> [(role, rank)], built once at import: a loader resolves all of its roles in one pass
+# over its column names instead of scanning every synonym list against them
+_ROLE_INDEX: Dict[str, List[Tuple[str, int]]] = {}
+for _role, _syns in _ROLE_SYNS.items():
+    for _rank, _name in enumerate(_syns):
+        _ROLE_INDEX.setdefault(_name, []).append((_role, _rank))
+
+def _resolve_all(names: List[str], roles: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+    """role -> column for each of `roles` (None when absent); earlier synonyms win, as in the lists."""
+    best: Dict[str, Tuple[int, Optional[str]]] = {r: (len(_ROLE_SYNS[r]), None) for r in roles}
+    for c in names:
+        for role, rank in _ROLE_INDEX.get(c, ()):
+            if role in best and rank < best[role][0]:
+                best[role] = (rank, c)
+    return {r: c for r, (_, c) in best.items()}
 
 # ---------- loaders ----------
 
 def _load_m2_pl(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m2_pl_schedule.parquet"
-    df = _read_parquet(path)
-    mcol = _syn(df, MONTH_SYNS, "Month_Index")
-    npat = _syn(df, NPAT_SYNS, "NPAT")
-    da   = _syn(df, DA_SYNS,   "DA/Depreciation")
-    base = df[[mcol, npat, da]].copy()
+    names = _schema_names(path)
+    found = _resolve_all(names, ("month", "npat", "da"))
+    mcol = _require(found, names, "month", "Month_Index")
+    npat = _require(found, names, "npat", "NPAT")
+    da   = _require(found, names, "da",   "DA/Depreciation")
+    base = _read_parquet(path, [mcol, npat, da])[[mcol, npat, da]]
     base.rename(columns={mcol:"Month_Index", npat:"NPAT_NAD_000", da:"DA_NAD_000"}, inplace=True)
     _ok(f"M2 P&L columns -> month='Month_Index', NPAT='{npat}', DA='{da}'")
     return base, {"pl_path": str(path), "npat_col": npat, "da_col": da}
 
 def _load_m2_wc(outputs: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m2_working_capital_schedule.parquet"
-    df = _read_parquet(path)
-    mcol = _syn(df, MONTH_SYNS, "Month_Index")
-    ncc  = _syn(df, NWC_CF_SYNS, "NWC_CF_NAD_000")
-    wc = df[[mcol, ncc]].copy()
+    names = _schema_names(path)
+    found = _resolve_all(names, ("month", "nwc_cf"))
+    mcol = _require(found, names, "month", "Month_Index")
+    ncc  = _require(found, names, "nwc_cf", "NWC_CF_NAD_000")
+    wc = _read_parquet(path, [mcol, ncc])[[mcol, ncc]]
     wc.rename(columns={mcol:"Month_Index", ncc:"NWC_CF_NAD_000"}, inplace=True)
     _ok(f"M2 WC columns -> month='Month_Index', NWC_CF='{ncc}'")
     return wc, {"wc_path": str(path), "nwc_cf_col": ncc}
 
 def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m1_capex_schedule.parquet"
-    df = _read_parquet(path)
-    mcol = _syn(df, MONTH_SYNS, "Month_Index")
+    names = _schema_names(path)
+    found = _resolve_all(names, ("month", "cfi"))
+    mcol = _require(found, names, "month", "Month_Index")
     # Heuristic: prefer explicit CFI column; otherwise a CAPEX cash sign column
-    cfi_col = None
-    for c in CFI_SYNS:
-        if c in df.columns:
-            cfi_col = c
-            break
+    cfi_col = found["cfi"]
     if cfi_col is None:
         # try to guess: any column with 'CAPEX' and 'NAD' or 'Cash'
-        for c in df.columns:
+        for c in names:
             lc = c.lower()
             if ("capex" in lc or "capex" in c) and ("nad" in lc or "cash" in lc or "outflow" in lc):
                 cfi_col = c
@@ -169,8 +249,8 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
             _fail("Could not find CAPEX/CFI cash column in m1_capex_schedule.parquet.")
         else:
             _warn("CFI not found; defaulting to zeros.")
-            return pd.DataFrame({"Month_Index": df[mcol], "CFI_NAD_000": 0.0}), {"cfi_col": None, "sign_flipped": False, "path": str(path)}
-    cfi = df[[mcol, cfi_col]].copy()
+            return pd.DataFrame({"Month_Index": _read_parquet(path, [mcol])[mcol], "CFI_NAD_000": 0.0}), {"cfi_col": None, "sign_flipped": False, "path": str(path)}
+    cfi = _read_parquet(path, [mcol, cfi_col])[[mcol, cfi_col]]
     cfi.rename(columns={mcol:"Month_Index", cfi_col:"CFI_NAD_000"}, inplace=True)
     # Ensure outflow negative
     # If the median is positive, flip sign.
@@ -185,53 +265,59 @@ def _load_m1_cfi(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, A
 
 def _load_m3_revolver(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     path = outputs / "m3_revolver_schedule.parquet"
-    df = _read_parquet(path)
+    names = _schema_names(path)
     # Some repos store a single schedule per 'Case_Name'/'Line_ID' – keep only month and numeric legs
-    mcol = None
-    for c in REV_MONTH_SYNS:
-        if c in df.columns:
-            mcol = c
-            break
+    found = _resolve_all(names, ("month", "rev_draw", "rev_repay", "rev_fees", "rev_int"))
+    mcol = found["month"]
     if mcol is None:
         _fail("Could not resolve Month_Index in m3_revolver_schedule.parquet.")
-    # pick helpers
-    def pick(cands: List[str], role: str) -> Optional[str]:
-        for c in cands:
-            if c in df.columns:
-                return c
-        return None
-    dcol = pick(REV_DRAW_SYNS,  "Revolver draw column")
-    rcol = pick(REV_REPAY_SYNS, "Revolver repayment column")
-    fcol = pick(REV_FEES_SYNS,  "Revolver fee column")
-    icol = pick(REV_INT_SYNS,   "Revolver interest column")  # not used in CFF
+    dcol = found["rev_draw"]
+    rcol = found["rev_repay"]
+    fcol = found["rev_fees"]
+    icol = found["rev_int"]  # not used in CFF
 
     if dcol is None or rcol is None:
         # Print available columns to aid debugging
-        preview = list(df.columns)[:35]
+        preview = names[:35]
         _fail(f"Cannot resolve revolver draw/repay columns. Tried draws={REV_DRAW_SYNS}, repay={REV_REPAY_SYNS}. Available (first 35): {preview}")
 
-    cff = df[[mcol]].copy()
-    cff.rename(columns={mcol:"Month_Index"}, inplace=True)
-    cff["CFF_NAD_000"] = 0.0
-    cff["CFF_NAD_000"] = cff["CFF_NAD_000"].astype(float)
+    # decode only the CFF legs (interest is reported in meta, never read); one projected
+    # read, then the legs are plain float64 arrays from the same rows
+    df = _read_parquet(path, [c for c in (mcol, dcol, rcol, fcol) if c is not None])
+
     # Draws are inflows (+), repayments are outflows (−)
-    cff = cff.join(df[[dcol]].rename(columns={dcol:"_draw"})).join(df[[rcol]].rename(columns={rcol:"_repay"}))
-    cff["_draw"]  = pd.to_numeric(cff["_draw"], errors="coerce").fillna(0.0)
-    cff["_repay"] = pd.to_numeric(cff["_repay"], errors="coerce").fillna(0.0)
-    cff["CFF_NAD_000"] = cff["_draw"] - cff["_repay"]
+    cff_vals = float64_or_zero(df[dcol]) - float64_or_zero(df[rcol])
     # fees often outflows; can be included in CFF or CFO – we include in CFF (project policy)
     fee_used = False
     if fcol is not None:
-        cff = cff.join(df[[fcol]].rename(columns={fcol:"_fees"}))
-        cff["_fees"] = pd.to_numeric(cff["_fees"], errors="coerce").fillna(0.0)
-        cff["CFF_NAD_000"] = cff["CFF_NAD_000"] - cff["_fees"]
+        cff_vals -= float64_or_zero(df[fcol])
         fee_used = True
     # Do not include interest (handled via P&L/CFO). If present we show in meta only.
     meta = {"rev_path": str(path), "month_col": mcol, "draw_col": dcol, "repay_col": rcol, "fee_col": fcol, "interest_col_present": icol is not None, "fees_included_in_cff": fee_used}
     _ok("CFF derived from M3 revolver schedule (draws − repayments − fees). Interest excluded by design.")
-    cff = cff[["Month_Index","CFF_NAD_000"]]
+    cff = pd.DataFrame({"Month_Index": df[mcol].to_numpy(), "CFF_NAD_000": cff_vals})
     return cff, meta
 
+def _wide_opening_cash(path: Path, c: str, mcol: str, base_months: pd.Series) -> Optional[float]:
+    """
+    Wide-form opening cash from only the row group that can hold the opening month,
+    located via Month_Index min/max statistics. None when the footer cannot answer it.
+    """
+    pf = _open_pf(path)
+    stats = _month_stats(pf, mcol)
+    if stats is None:
+        return None
+    m0 = int(min(base_months.min(), min(lo for lo, _ in stats)))
+    for i, (lo, hi) in enumerate(stats):
+        if lo <= m0 <= hi:
+            df = _read_row_group(pf, i, [c, mcol])
+            row = df[df[mcol] == m0]
+            if not row.empty:
+                return float(float64_or_zero(row[c])[0])
+    # opening month not in the file: first value, as the full read did
+    df = _read_row_group(pf, 0, [c])
+    return float(float64_or_zero(df[c])[0]) if len(df) else None
+
 def _load_opening_cash(outputs: Path, base_months: pd.Series, strict: bool) -> Tuple[float, Dict[str, Any]]:
     """
     Read opening cash from M0 if available.
@@ -254,53 +340,48 @@ def _load_opening_cash(outputs: Path, base_months: pd.Series, strict: bool) -> T
             _warn("m0_opening_bs.parquet not found; defaulting opening cash to 0.0 per policy.")
             return 0.0, {"source": None, "policy_default_zero": True}
 
-    df = _read_parquet(path)
-    cols = list(df.columns)
+    cols = _schema_names(path)
+    found = _resolve_all(cols, ("cash_open", "month", "m0_line", "m0_value"))
 
     # Case A: wide form with direct cash column
-    for c in CASH_OPEN_SYNS:
-        if c in cols:
-            # If there's a Month_Index, use first month; else take first row
-            mcol = None
-            for m in MONTH_SYNS:
-                if m in cols:
-                    mcol = m
-                    break
-            if mcol:
+    c = found["cash_open"]
+    if c is not None:
+        # If there's a Month_Index, use first month; else take first row
+        mcol = found["month"]
+        if mcol:
+            val = _wide_opening_cash(path, c, mcol, base_months)
+            if val is None:
+                df = _read_parquet(path, [c, mcol])
                 # align to min month present in base
                 m0 = int(min(base_months.min(), df[mcol].min()))
                 # fetch row with that month
                 row = df[df[mcol] == m0]
                 if not row.empty:
-                    val = float(pd.to_numeric(row[c], errors="coerce").fillna(0.0).iloc[0])
+                    val = float(float64_or_zero(row[c])[0])
                 else:
                     # pick first value
-                    val = float(pd.to_numeric(df[c], errors="coerce").fillna(0.0).iloc[0])
-            else:
-                val = float(pd.to_numeric(df[c], errors="coerce").fillna(0.0).iloc[0])
-            _ok(f"Opening cash source: M0:{c}@{str(path.name)} -> {val:,.2f} (NAD '000)")
-            return val, {"source": f"M0:{c}", "path": str(path), "policy_default_zero": False}
+                    val = float(float64_or_zero(df[c])[0])
+        else:
+            val = float(float64_or_zero(_read_parquet(path, [c])[c])[0])
+        _ok(f"Opening cash source: M0:{c}@{str(path.name)} -> {val:,.2f} (NAD '000)")
+        return val, {"source": f"M0:{c}", "path": str(path), "policy_default_zero": False}
 
     # Case B: long form with line items
-    line_col = None
-    for cand in ["Line_Item","Item","Line","Account","LineItem"]:
-        if cand in cols:
-            line_col = cand
-            break
-    val_col = None
-    for cand in ["Value_NAD_000","Value_NAD","Value","Amount_NAD_000","Amount_NAD","Amount"]:
-        if cand in cols:
-            val_col = cand
-            break
+    line_col = found["m0_line"]
+    val_col = found["m0_value"]
     if line_col and val_col:
         # normalize names
-        def norm(s: str) -> str:
-            return "".join(ch for ch in s.upper() if ch.isalnum())
-        targets = [norm(c) for c in CASH_OPEN_SYNS]
-        df["_key"] = df[line_col].astype(str).map(norm)
-        row = df[df["_key"].isin(targets)]
+        targets = [_alnum_upper(c) for c in CASH_OPEN_SYNS]
+        # long form: scan row groups in file order and stop at the first one holding a cash line
+        pf = _open_pf(path)
+        row = pd.DataFrame()
+        for i in range(pf.num_row_groups):
+            df = _read_row_group(pf, i, [line_col, val_col])
+            row = df[df[line_col].astype(str).map(_alnum_upper).isin(targets)]
+            if not row.empty:
+                break
         if not row.empty:
-            val = float(pd.to_numeric(row[val_col], errors="coerce").fillna(0.0).iloc[0])
+            val = float(float64_or_zero(row[val_col])[0])
             _ok(f"Opening cash source: M0:{line_col}='{row[line_col].iloc[0]}' -> {val:,.2f} (NAD '000)")
             return val, {"source": f"M0:{line_col} match", "path": str(path), "policy_default_zero": False}
 
@@ -315,39 +396,40 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
     Public entrypoint used by runner.py
     """
     outputs = Path(outputs_dir)
-    # M2 basis
-    base, pl_m = _load_m2_pl(outputs)
-    wc,   wc_m = _load_m2_wc(outputs)
-
-    # base months
-    months = base["Month_Index"].copy()
-    months = months.sort_values().reset_index(drop=True)
+    # Independent files, read concurrently; results are collected in the serial order, so the
+    # first failing loader is still the one that raises.
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        # M2 basis
+        f_pl = ex.submit(_load_m2_pl, outputs)
+        f_wc = ex.submit(_load_m2_wc, outputs)
+        # CFI from M1
+        f_cfi = ex.submit(_load_m1_cfi, outputs, strict=strict)
+        # CFF from M3 revolver (draws − repayments − fees; interest excluded)
+        f_cff = ex.submit(_load_m3_revolver, outputs, strict=strict)
+
+        base, pl_m = f_pl.result()
+        # base months (P&L rows in month order form the spine; every leg is an array aligned to it)
+        base = base.sort_values("Month_Index", kind="stable")
+        months = base["Month_Index"].to_numpy()
+
+        # Opening cash (policy default 0 if absent) only needs the spine, so it joins the reads in flight
+        f_open = ex.submit(_load_opening_cash, outputs, pd.Series(months), strict=strict)
+
+        wc,   wc_m = f_wc.result()
+        cfi, cfi_m = f_cfi.result()
+        cff, cff_m = f_cff.result()
+        opening_cash, open_m = f_open.result()
 
     # CFO = NPAT + DA + NWC_CF (note: NWC_CF already has CF sign)
-    cfo = pd.DataFrame({"Month_Index": months})
-    # Join P&L
-    tmp = base.merge(wc, on="Month_Index", how="left")
-    tmp["DA_NAD_000"] = pd.to_numeric(tmp["DA_NAD_000"], errors="coerce").fillna(0.0)
-    tmp["NPAT_NAD_000"] = pd.to_numeric(tmp["NPAT_NAD_000"], errors="coerce").fillna(0.0)
-    tmp["NWC_CF_NAD_000"] = pd.to_numeric(tmp["NWC_CF_NAD_000"], errors="coerce").fillna(0.0)
-    cfo["CFO_NAD_000"] = tmp["NPAT_NAD_000"] + tmp["DA_NAD_000"] + tmp["NWC_CF_NAD_000"]
-
-    # CFI from M1
-    cfi, cfi_m = _load_m1_cfi(outputs, strict=strict)
-    cfi = cfi.merge(cfo[["Month_Index"]], on="Month_Index", how="right")
-    cfi["CFI_NAD_000"] = pd.to_numeric(cfi["CFI_NAD_000"], errors="coerce").fillna(0.0)
-
-    # CFF from M3 revolver (draws − repayments − fees; interest excluded)
-    cff, cff_m = _load_m3_revolver(outputs, strict=strict)
-    cff = cff.merge(cfo[["Month_Index"]], on="Month_Index", how="right")
-    cff["CFF_NAD_000"] = pd.to_numeric(cff["CFF_NAD_000"], errors="coerce").fillna(0.0)
-
-    # Opening cash (policy default 0 if absent)
-    opening_cash, open_m = _load_opening_cash(outputs, cfo["Month_Index"], strict=strict)
-
-    # Assemble final DF
-    df = cfo.merge(cfi, on="Month_Index", how="left").merge(cff, on="Month_Index", how="left")
-    df[["CFI_NAD_000","CFF_NAD_000"]] = df[["CFI_NAD_000","CFF_NAD_000"]].fillna(0.0)
+    npat = float64_or_zero(base["NPAT_NAD_000"])
+    da = float64_or_zero(base["DA_NAD_000"])
+    cfo_arr = npat + da + _gather(months, wc, "NWC_CF_NAD_000")
+    cfi_arr = _gather(months, cfi, "CFI_NAD_000")
+    cff_arr = _gather(months, cff, "CFF_NAD_000")
+
+    # Assemble final DF (built once; no merges)
+    df = pd.DataFrame({"Month_Index": months, "CFO_NAD_000": cfo_arr,
+                       "CFI_NAD_000": cfi_arr, "CFF_NAD_000": cff_arr})
 
     # simple smoke meta
     smoke = {
@@ -2,8 +2,16 @@
 from __future__ import annotations
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict
 
+from terra_nova.modules.common import float64_or_zero
+
+try:
+    from numba import njit  # optional accelerator for the balance-sheet roll-forward
+except Exception:
+    njit = None
+
 # ---- Role synonyms used by runner normalization ----
 ROLE = {
     "MONTH_INDEX": ["Month_Index", "MONTH_INDEX", "month_index"],
@@ -36,40 +44,102 @@ ROLE = {
     "TAX_PAID": ["Tax_Paid_NAD_000", "Tax_Paid", "Taxes_Paid_NAD_000"],
 }
 
-def _pick(df: pd.DataFrame, candidates: list[str]) -> str | None:
-    # Enhanced _pick to prioritize exact case-insensitive matches
-    cols_lower_map = {c.lower(): c for c in df.columns}
-    
+@lru_cache(maxsize=256)
+def _pick_cached(cols: tuple, candidates: tuple) -> tuple[str | None, str | None]:
+    """(column, fuzzy candidate or None) for a column set; the same frames/roles repeat across calls."""
+    cols_lower_map = {c.lower(): c for c in cols}
+    cands_lower = [name.lower() for name in candidates]
+
     # 1. Exact match (case-insensitive) - Prioritized
-    for name in candidates:
-        key = name.lower()
+    for key in cands_lower:
         if key in cols_lower_map:
-            return cols_lower_map[key]
-        
+            return cols_lower_map[key], None
+
     # 2. Fuzzy contains match (less ideal but kept for M6 beta compatibility if exact fails)
     for key_lower, original_name in cols_lower_map.items():
-        for candidate in candidates:
-            if candidate.lower() in key_lower:
-                # Log a warning if we fall back to fuzzy matching
-                print(f"[M6][WARN] Using fuzzy match for {candidate} -> {original_name}")
-                return original_name
-    return None
+        for candidate, cand_lower in zip(candidates, cands_lower):
+            if cand_lower in key_lower:
+                return original_name, candidate
+    return None, None
 
-def derive_tax_payable(tax_df: pd.DataFrame) -> pd.Series:
-    """Prefer explicit payable; else derive as cum(expense - paid); else zeros."""
+def _pick(df: pd.DataFrame, candidates: list[str]) -> str | None:
+    # Enhanced _pick to prioritize exact case-insensitive matches
+    col, fuzzy = _pick_cached(tuple(df.columns), tuple(candidates))
+    if fuzzy is not None:
+        # Log a warning if we fall back to fuzzy matching
+        print(f"[M6][WARN] Using fuzzy match for {fuzzy} -> {col}")
+    return col
+
+def _align(src_df: pd.DataFrame, src_month_col: str, target_months: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positional map of `target_months` onto the rows of `src_df`: (rows, hit).
+    Gather with `np.where(hit, vals[rows], 0.0)`; months absent from the source read as 0.
+    """
+    src = src_df[src_month_col].astype(int).to_numpy()
+    order = None if (np.diff(src) > 0).all() else np.argsort(src, kind="stable")
+    keys = src if order is None else src[order]
+    if len(keys) > 1 and not (np.diff(keys) > 0).all():
+        # same contract as the old set_index(...).reindex(...)
+        raise ValueError(f"cannot reindex on an axis with duplicate labels ({src_month_col})")
+    pos = np.searchsorted(keys, target_months)
+    pos_c = np.minimum(pos, max(len(keys) - 1, 0))
+    hit = (pos < len(keys)) & (keys[pos_c] == target_months) if len(keys) else np.zeros(len(target_months), dtype=bool)
+    rows = pos_c if order is None else order[pos_c]
+    return rows, hit
+
+def _gather(vals: np.ndarray, rows: np.ndarray, hit: np.ndarray) -> np.ndarray:
+    if not len(vals):
+        return np.zeros(len(hit), dtype=np.float64)
+    return np.where(hit, vals[rows], 0.0)
+
+def _tax_payable_inputs(tax_df: pd.DataFrame) -> tuple[np.ndarray, bool]:
+    """(values, cumulate): explicit payable levels, or per-month (expense - paid) to cumulate, or zeros."""
     col_pay = _pick(tax_df, ROLE["TAX_PAYABLE"])
     if col_pay:
-        s = pd.to_numeric(tax_df[col_pay], errors="coerce").fillna(0.0)
-        return s
+        return float64_or_zero(tax_df[col_pay]), False
     col_exp = _pick(tax_df, ROLE["TAX_EXPENSE"])
     col_paid = _pick(tax_df, ROLE["TAX_PAID"])
     if col_exp and col_paid:
-        exp = pd.to_numeric(tax_df[col_exp], errors="coerce").fillna(0.0)
-        paid = pd.to_numeric(tax_df[col_paid], errors="coerce").fillna(0.0)
         # Assuming opening payable is 0 if derived this way
-        return (exp - paid).cumsum()
+        return float64_or_zero(tax_df[col_exp]) - float64_or_zero(tax_df[col_paid]), True
+    return np.zeros(len(tax_df), dtype=np.float64), False
+
+def derive_tax_payable(tax_df: pd.DataFrame) -> pd.Series:
+    """Prefer explicit payable; else derive as cum(expense - paid); else zeros."""
+    vals, cumulate = _tax_payable_inputs(tax_df)
+    if cumulate:
+        vals = np.cumsum(vals)
     # Ensure the series has the same index as the input dataframe
-    return pd.Series(np.zeros(len(tax_df), dtype=float), index=tax_df.index)
+    return pd.Series(vals, index=tax_df.index)
+
+def _bs_kernel_py(npat: np.ndarray, nwc_cf: np.ndarray, tax_vals: np.ndarray, tax_cumulate: bool):
+    """
+    One pass over the months for every running balance:
+      retained earnings = cum(NPAT); NWC level = cum(-NWC_CF) split into asset / liability sides;
+      tax payable = cum(tax_vals) when derived from expense - paid, else tax_vals as given.
+    """
+    n = npat.shape[0]
+    re_out = np.empty(n)
+    nwc_asset = np.empty(n)
+    nwc_liab = np.empty(n)
+    tax_out = np.empty(n)
+    re_acc = 0.0
+    nwc_level = 0.0
+    tax_acc = 0.0
+    for i in range(n):
+        re_acc += npat[i]
+        re_out[i] = re_acc
+        nwc_level -= nwc_cf[i]  # level grows when CF negative (investment)
+        nwc_asset[i] = nwc_level if nwc_level > 0.0 else 0.0
+        nwc_liab[i] = -nwc_level if nwc_level < 0.0 else 0.0
+        if tax_cumulate:
+            tax_acc += tax_vals[i]
+            tax_out[i] = tax_acc
+        else:
+            tax_out[i] = tax_vals[i]
+    return re_out, nwc_asset, nwc_liab, tax_out
+
+_bs_kernel = njit(cache=True)(_bs_kernel_py) if njit is not None else _bs_kernel_py
 
 def compute_balance_sheet(
     m2_pl: pd.DataFrame,
@@ -95,84 +165,82 @@ def compute_balance_sheet(
         if not col:
             raise AssertionError(f"[M6] Missing Month_Index in {label}. Columns: {list(df_ref.columns)[:10]}")
 
-    # Use M2 P&L timeline as the master timeline
-    df = pd.DataFrame({"Month_Index": m2_pl[mn_m].astype(int)})
-    # UPDATE: Ensure timeline is sorted and index is reset for alignment
-    df = df.sort_values("Month_Index").reset_index(drop=True)
+    # Use M2 P&L timeline as the master timeline (sorted); every line below is a plain array on it,
+    # and the frame is built once at the end
+    months = np.sort(m2_pl[mn_m].astype(int).to_numpy())
 
     # Retained earnings
     col_npat = _pick(m2_pl, ROLE["NPAT"])
     if not col_npat:
         raise AssertionError(f"[M6] NPAT column not found in M2 P&L. Columns: {list(m2_pl.columns)[:10]}")
     
-    # UPDATE: Ensure alignment before calculation using reindex
-    aligned_pl = m2_pl.set_index(m2_pl[mn_m].astype(int)).reindex(df["Month_Index"])
-    # Calculate cumsum on aligned data, then reset index to match df
-    df["Equity_Retained_Earnings_NAD_000"] = pd.to_numeric(aligned_pl[col_npat], errors="coerce").fillna(0.0).cumsum().reset_index(drop=True)
+    # Alignment is a positional gather onto the master timeline (missing months -> 0)
+    pl_rows, pl_hit = _align(m2_pl, mn_m, months)
 
     # Reconstruct NWC level from NWC CF (positive CF = release => NWC decreases)
     col_nwc_cf = _pick(m2_wc, ROLE["NWC_CF"])
     if not col_nwc_cf:
         raise AssertionError(f"[M6] NWC cash-flow column not found in M2 WC schedule. Columns: {list(m2_wc.columns)[:10]}")
     
-    # UPDATE: Ensure alignment before calculation
-    aligned_wc = m2_wc.set_index(m2_wc[mw_m].astype(int)).reindex(df["Month_Index"])
-    nwc_cf = pd.to_numeric(aligned_wc[col_nwc_cf], errors="coerce").fillna(0.0)
-    
-    # Calculate cumsum on aligned data, then reset index
-    nwc_level = (-nwc_cf).cumsum().reset_index(drop=True)  # level grows when CF negative (investment)
-    nwc_asset = nwc_level.clip(lower=0.0)
-    nwc_liab = (-nwc_level).clip(lower=0.0)
-    df["NWC_Asset_NAD_000"] = nwc_asset
-    df["NWC_Liability_NAD_000"] = nwc_liab
+    wc_rows, wc_hit = _align(m2_wc, mw_m, months)
+
+    # Tax payable inputs (aligned the same way); the running balances below are one fused pass
+    tax_rows, tax_hit = _align(m4_tax, mt_m, months)
+    tax_vals, tax_cumulate = _tax_payable_inputs(m4_tax)
+
+    re_arr, nwc_asset, nwc_liab, tax_payable = _bs_kernel(
+        _gather(float64_or_zero(m2_pl[col_npat]), pl_rows, pl_hit),
+        _gather(float64_or_zero(m2_wc[col_nwc_cf]), wc_rows, wc_hit),
+        _gather(tax_vals, tax_rows, tax_hit),
+        bool(tax_cumulate),
+    )
 
     # Debt outstanding
     col_debt = _pick(m3_debt, ROLE["DEBT_OUT"])
     
-    # UPDATE: Ensure alignment before assignment
-    aligned_debt = m3_debt.set_index(m3_debt[md_m].astype(int)).reindex(df["Month_Index"]).reset_index(drop=True)
+    debt_rows, debt_hit = _align(m3_debt, md_m, months)
 
     if not col_debt:
         # degrade gracefully to zeros if schedule present but no recognizable column
         print("[M6][WARN] Debt outstanding column not resolved in M3 schedule. Defaulting to 0.0.")
-        # Ensure series index matches df index
-        debt_out = pd.Series(np.zeros(len(df), dtype=float), index=df.index)
+        debt_out = np.zeros(len(months), dtype=float)
     else:
-        debt_out = pd.to_numeric(aligned_debt[col_debt], errors="coerce").fillna(0.0)
-        
-    df["Debt_Outstanding_NAD_000"] = debt_out
+        debt_out = _gather(float64_or_zero(m3_debt[col_debt]), debt_rows, debt_hit)
 
-    # Tax payable
-    # UPDATE: Ensure alignment before derivation. Preserve index for derive_tax_payable.
-    aligned_tax = m4_tax.set_index(m4_tax[mt_m].astype(int)).reindex(df["Month_Index"])
-    tax_payable = derive_tax_payable(aligned_tax)
-    # Reset index after derivation to align with df
-    df["Tax_Payable_NAD_000"] = pd.to_numeric(tax_payable, errors="coerce").fillna(0.0).reset_index(drop=True)
+    # Tax payable comes from the fused pass above
 
     # Equity - share capital (0 in v1; to be wired in v7.5)
-    df["Equity_Share_Capital_NAD_000"] = float(start_share_capital)
+    share_capital = np.full(len(months), float(start_share_capital))
 
     # Totals and balancing cash
-    equity_total = df["Equity_Share_Capital_NAD_000"] + df["Equity_Retained_Earnings_NAD_000"]
-    liab_total = df["Debt_Outstanding_NAD_000"] + df["Tax_Payable_NAD_000"] + df["NWC_Liability_NAD_000"]
+    equity_total = share_capital + re_arr
+    liab_total = debt_out + tax_payable + nwc_liab
     liab_eq_total = liab_total + equity_total
 
     # Calculate the balancing cash required to make Assets = L+E
-    cash_balancing = liab_eq_total - df["NWC_Asset_NAD_000"]
-    assets_total = cash_balancing + df["NWC_Asset_NAD_000"]
-
-    # CRITICAL FIX: Use the canonical name required by M7.5B and downstream modules.
-    # Replaces 'Cash_Balancing_Item_NAD_000'.
-    df["Cash_and_Cash_Equivalents_NAD_000"] = cash_balancing
-    
-    df["Assets_Total_NAD_000"] = assets_total
-    df["Liabilities_Total_NAD_000"] = liab_total
-    df["Equity_Total_NAD_000"] = equity_total
-    df["Liabilities_And_Equity_Total_NAD_000"] = liab_eq_total
-    df["Currency"] = currency
-
-    # Identity check
-    diff = (df["Assets_Total_NAD_000"] - df["Liabilities_And_Equity_Total_NAD_000"]).abs().max()
+    cash_balancing = liab_eq_total - nwc_asset
+    assets_total = cash_balancing + nwc_asset
+
+    df = pd.DataFrame({
+        "Month_Index": months,
+        "Equity_Retained_Earnings_NAD_000": re_arr,
+        "NWC_Asset_NAD_000": nwc_asset,
+        "NWC_Liability_NAD_000": nwc_liab,
+        "Debt_Outstanding_NAD_000": debt_out,
+        "Tax_Payable_NAD_000": tax_payable,
+        "Equity_Share_Capital_NAD_000": share_capital,
+        # CRITICAL FIX: Use the canonical name required by M7.5B and downstream modules.
+        # Replaces 'Cash_Balancing_Item_NAD_000'.
+        "Cash_and_Cash_Equivalents_NAD_000": cash_balancing,
+        "Assets_Total_NAD_000": assets_total,
+        "Liabilities_Total_NAD_000": liab_total,
+        "Equity_Total_NAD_000": equity_total,
+        "Liabilities_And_Equity_Total_NAD_000": liab_eq_total,
+        "Currency": currency,
+    })
+
+    # Identity check (fmax skips NaN, as Series.max did)
+    diff = np.fmax.reduce(np.abs(assets_total - liab_eq_total), initial=0.0)
     if diff > 1e-6:
         raise AssertionError(f"[M6] Balance sheet identity failed. Max abs diff={diff}")
 
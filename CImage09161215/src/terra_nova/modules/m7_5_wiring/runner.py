@@ -1,9 +1,8 @@
+import csv
 import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-import pandas as pd
-
 
 def _pretty(val) -> str:
     if isinstance(val, float):
@@ -30,6 +29,11 @@ def run_m7_5(
           It does NOT alter M6 in-place. “7.5B” will consume this schedule to
           post PPE/cash/equity deltas in the formal BS pipeline.
     """
+    # pyarrow is only needed for the one parquet write; importing it here keeps module import cheap
+    # for callers (batch sweeps, CLIs) that load this runner without running it
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
 
@@ -60,27 +64,38 @@ def run_m7_5(
         ticket_nad_000 = round(ticket_usd / 1_000.0, 3)
         fx_note = "Currency USD: no FX applied"
 
-    # Build schedule (single-row injection)
-    df = pd.DataFrame(
-        [
-            dict(
-                Month_Index=int(injection_month),
-                Option=str(option),
-                Instrument=str(instrument),
-                FX_USD_to_NAD=float(fx),
-                Junior_Equity_In_NAD_000=float(ticket_nad_000),
-            )
-        ]
+    # Build schedule (single-row injection); a one-row Arrow table skips the pandas adapter
+    row = dict(
+        Month_Index=int(injection_month),
+        Option=str(option),
+        Instrument=str(instrument),
+        FX_USD_to_NAD=float(fx),
+        Junior_Equity_In_NAD_000=float(ticket_nad_000),
+    )
+    tbl = pa.table(
+        {
+            "Month_Index": pa.array([row["Month_Index"]], pa.int64()),
+            "Option": pa.array([row["Option"]], pa.string()),
+            "Instrument": pa.array([row["Instrument"]], pa.string()),
+            "FX_USD_to_NAD": pa.array([row["FX_USD_to_NAD"]], pa.float64()),
+            "Junior_Equity_In_NAD_000": pa.array([row["Junior_Equity_In_NAD_000"]], pa.float64()),
+        }
     )
 
     # Write artifacts
     fin_parquet = out / "m7_5_junior_financing.parquet"
-    df.to_parquet(fin_parquet, index=False)
+    # one row: min/max statistics and dictionary pages would outweigh the payload in the footer
+    pq.write_table(tbl, fin_parquet, compression="snappy", write_statistics=False,
+                   use_dictionary=False, data_page_version="2.0")
 
     fin_csv = None
     if write_csv:
         fin_csv = out / "m7_5_junior_financing.csv"
-        df.to_csv(fin_csv, index=False)
+        # csv module keeps pandas' quoting for names with commas/quotes
+        with open(fin_csv, "w", encoding="utf-8", newline="") as fh:
+            w = csv.writer(fh, lineterminator="\n")
+            w.writerow(row.keys())
+            w.writerow(row.values())
 
     debug = {
         "status": "ok",
@@ -95,24 +110,25 @@ def run_m7_5(
             "financing_schedule_parquet": str(fin_parquet),
             "financing_schedule_csv": str(fin_csv) if fin_csv else None,
         },
-        "preview": df.head(10).to_dict(orient="records"),
+        "preview": tbl.to_pylist(),
     }
     (out / "m7_5_debug.json").write_text(json.dumps(debug, indent=2), encoding="utf-8")
 
     # Simple smoke report
-    md = []
-    md.append("# M7.5 (A) — Junior financing schedule")
-    md.append("")
-    md.append(f"- Selected: **{option}** / **{instrument}**")
-    md.append(f"- Ticket: **USD {_pretty(ticket_usd)}** → **NAD ‘000 {_pretty(ticket_nad_000)}** ({fx_note})")
-    md.append(f"- Injection @ Month_Index **{injection_month}**")
-    md.append("")
-    md.append("## Artifacts")
-    md.append(f"- Schedule (parquet): `{fin_parquet}`")
-    if fin_csv:
-        md.append(f"- Schedule (csv): `{fin_csv}`")
-    md.append(f"- Debug JSON: `{out / 'm7_5_debug.json'}`")
-    (out / "m7_5_smoke_report.md").write_text("\n".join(md), encoding="utf-8")
+    csv_line = f"- Schedule (csv): `{fin_csv}`\n" if fin_csv else ""
+    report = (
+        "# M7.5 (A) — Junior financing schedule\n"
+        "\n"
+        f"- Selected: **{option}** / **{instrument}**\n"
+        f"- Ticket: **USD {_pretty(ticket_usd)}** → **NAD ‘000 {_pretty(ticket_nad_000)}** ({fx_note})\n"
+        f"- Injection @ Month_Index **{injection_month}**\n"
+        "\n"
+        "## Artifacts\n"
+        f"- Schedule (parquet): `{fin_parquet}`\n"
+        f"{csv_line}"
+        f"- Debug JSON: `{out / 'm7_5_debug.json'}`"
+    )
+    (out / "m7_5_smoke_report.md").write_text(report, encoding="utf-8")
 
     print(
         f"[OK] M7.5 wiring emitted -> {fin_parquet}. "
@@ -8,12 +8,17 @@ Role: Consolidate M2 P&L, M5 CF, and M6 BS into standardized formats,
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 import re
 
+from terra_nova.modules.common import numeric_or_zero
+
 # -------------------------
 # Configuration and Synonyms
 # -------------------------
@@ -63,26 +68,57 @@ def _fail(msg: str) -> None:
     print(f"[M7.5B][FAIL] {msg}")
     raise RuntimeError(msg)
 
+_NORM_RE = re.compile(r'[^a-z0-9]')
+
+@lru_cache(maxsize=512)
 def _norm_key(s: str) -> str:
-    return re.sub(r'[^a-z0-9]', '', str(s).lower())
+    return _NORM_RE.sub('', str(s).lower())
+
+def _norm_columns(df: pd.DataFrame) -> Dict[str, str]:
+    """Normalized key -> column name; build once per frame and pass to `_resolve_col`."""
+    return {_norm_key(c): c for c in df.columns}
 
-def _resolve_col(df: pd.DataFrame, candidates: List[str], required=True, ctx="") -> Optional[str]:
-    """Robust column resolver."""
+def _resolve_col(df: pd.DataFrame, candidates: List[str], required=True, ctx="",
+                 norm: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Robust column resolver. `norm` is `_norm_columns(df)`, when the caller already has it."""
     if df is None or df.empty:
         if required: _fail(f"Cannot resolve {ctx}: DataFrame is empty.")
         return None
 
-    cols = list(df.columns)
-    norm = {_norm_key(c): c for c in cols}
+    cols = df.columns
+    if norm is None:
+        norm = _norm_columns(df)
 
     for c in candidates:
         if c in cols: return c
-        if _norm_key(c) in norm: return norm[_norm_key(c)]
+        key = _norm_key(c)
+        if key in norm: return norm[key]
             
     if required:
-        _fail(f"Missing any of {candidates} (ctx={ctx}). Available={cols[:30]}")
+        _fail(f"Missing any of {candidates} (ctx={ctx}). Available={list(cols)[:30]}")
     return None
 
+def _projection(path: Path, *synonym_lists: List[str]) -> Optional[List[str]]:
+    """
+    File columns (footer only, in file order) that `_resolve_col` could match for any of the
+    synonyms; None (read everything) when no month column is among them, so the resolver still
+    reports the full column list.
+    """
+    names = [n for n in pq.ParquetFile(path).schema_arrow.names if not str(n).startswith("__index_level_")]
+    wanted = {_norm_key(s) for syns in synonym_lists for s in syns}
+    cols = [n for n in names if _norm_key(n) in wanted]
+    month_keys = {_norm_key(m) for m in MONTH_SYNS}
+    if not any(_norm_key(n) in month_keys for n in cols):
+        return None
+    return cols
+
+def _read_parquet_arrow(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Projected, multi-threaded pyarrow read."""
+    return pq.ParquetFile(path).read(columns=columns, use_threads=True, use_pandas_metadata=True).to_pandas(self_destruct=True)
+
+def _statement_columns(path: Path, synonym_map: Dict[str, List[str]]) -> Optional[List[str]]:
+    return _projection(path, MONTH_SYNS, *synonym_map.values())
+
 def _to_native(x):
     """Convert numpy types to native Python types for JSON serialization."""
     if pd.isna(x): return None
@@ -100,24 +136,26 @@ def standardize_statement(df: pd.DataFrame, synonym_map: Dict[str, List[str]], c
     resolved_cols = {}
     
     # Resolve Month Index
-    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx=f"Month Index ({ctx})")
+    norm = _norm_columns(df)  # shared by every lookup below
+    mcol = _resolve_col(df, MONTH_SYNS, required=True, ctx=f"Month Index ({ctx})", norm=norm)
     rename_dict[mcol] = "Month_Index"
 
     for canonical_name, synonyms in synonym_map.items():
         # required=False because a statement might not have every possible line item.
-        resolved_name = _resolve_col(df, synonyms, required=False)
+        resolved_name = _resolve_col(df, synonyms, required=False, norm=norm)
         if resolved_name:
             rename_dict[resolved_name] = canonical_name
             resolved_cols[canonical_name] = resolved_name
     
     keep_cols = list(rename_dict.keys())
-    df_out = df[keep_cols].copy()
-    df_out.rename(columns=rename_dict, inplace=True)
+    # df[keep_cols] already returns a new frame, and the groupby below builds the one we return,
+    # so neither the rename nor the numeric pass needs a copy of its own.
+    df_out = df[keep_cols].rename(columns=rename_dict, copy=False)
     
     # Ensure numeric types and aggregate
     for col in df_out.columns:
         if col != "Month_Index":
-            df_out[col] = pd.to_numeric(df_out[col], errors="coerce").fillna(0.0)
+            df_out[col] = numeric_or_zero(df_out[col])
 
     # Group by Month_Index to handle potential duplicates in inputs
     df_out = df_out.groupby("Month_Index", as_index=False).sum()
@@ -138,12 +176,13 @@ def load_fx(outputs: Path, dbg: Dict) -> pd.DataFrame:
         _fail("FX_Path.parquet not found in m0_inputs/ or outputs/.")
 
     try:
-        fx_df = pd.read_parquet(fx_path)
+        fx_df = _read_parquet_arrow(fx_path, _projection(fx_path, MONTH_SYNS, FX_COL_SYNS))
     except Exception as e:
         _fail(f"Failed to read FX file {fx_path}: {e}")
 
-    mcol = _resolve_col(fx_df, MONTH_SYNS, required=True, ctx="FX Month Index")
-    fx_col = _resolve_col(fx_df, FX_COL_SYNS, required=True, ctx="FX Rate")
+    norm = _norm_columns(fx_df)
+    mcol = _resolve_col(fx_df, MONTH_SYNS, required=True, ctx="FX Month Index", norm=norm)
+    fx_col = _resolve_col(fx_df, FX_COL_SYNS, required=True, ctx="FX Rate", norm=norm)
     
     # Log metadata (Fix for Failure 2: FX Metadata)
     dbg["fx_source_path"] = str(fx_path.relative_to(outputs))
@@ -169,14 +208,14 @@ def load_pl(outputs: Path, dbg: Dict, strict: bool) -> pd.DataFrame:
     path = p1 if p1.exists() else (p2 if p2.exists() else None)
     
     if path:
-        pl = pd.read_parquet(path)
+        pl = _read_parquet_arrow(path, _statement_columns(path, PL_MAP))
         source = str(path.relative_to(outputs))
     else:
         # Fallback to M1 Revenue
         p_m1 = outputs / "m1_revenue_schedule.parquet"
         if p_m1.exists():
             print("[M7.5B][INFO] M2 P&L not found. Falling back to M1 Revenue schedule.")
-            pl = pd.read_parquet(p_m1)
+            pl = _read_parquet_arrow(p_m1, _statement_columns(p_m1, PL_MAP))
             source = str(p_m1.relative_to(outputs))
         elif strict:
             _fail("Neither M2 P&L nor M1 Revenue schedule found.")
@@ -195,7 +234,7 @@ def load_cf(outputs: Path, dbg: Dict) -> pd.DataFrame:
     if not path.exists():
         _fail(f"M5 Cash Flow statement not found: {path}")
         
-    cf = pd.read_parquet(path)
+    cf = _read_parquet_arrow(path, _statement_columns(path, CF_MAP))
     cf_std, resolved = standardize_statement(cf, CF_MAP, "CF")
     dbg["cf_source"] = str(path.relative_to(outputs))
     dbg["cf_mapping"] = resolved
@@ -208,7 +247,7 @@ def load_bs(outputs: Path, dbg: Dict, strict: bool) -> pd.DataFrame:
         # If M6 is missing, the pipeline is broken according to the dependency map.
         _fail(f"M6 Balance Sheet not found: {path}")
 
-    bs = pd.read_parquet(path)
+    bs = _read_parquet_arrow(path, _statement_columns(path, BS_MAP))
     bs_std, resolved = standardize_statement(bs, BS_MAP, "BS")
     dbg["bs_source"] = str(path.relative_to(outputs))
     dbg["bs_mapping"] = resolved
@@ -232,13 +271,18 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
 
     dbg: Dict[str, object] = {"strict": strict, "currency": currency, "notes": []}
 
-    # 1. Load FX
-    fx_rate = load_fx(outputs, dbg)
-    
-    # 2. Load and Standardize Statements
-    pl = load_pl(outputs, dbg, strict)
-    cf = load_cf(outputs, dbg)
-    bs = load_bs(outputs, dbg, strict)
+    # 1. Load FX, 2. Load and Standardize Statements
+    # The four loaders touch disjoint files, so their reads overlap on a thread pool. Each gets its
+    # own debug dict, merged back in the serial order, so the debug JSON stays deterministic and
+    # the first failing loader (in that order) is still the one that raises.
+    jobs = [(load_fx, ()), (load_pl, (strict,)), (load_cf, ()), (load_bs, (strict,))]
+    parts = [{"notes": []} for _ in jobs]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futs = [ex.submit(fn, outputs, part, *args) for (fn, args), part in zip(jobs, parts)]
+        fx_rate, pl, cf, bs = [f.result() for f in futs]
+    for part in parts:
+        dbg["notes"].extend(part.pop("notes"))
+        dbg.update(part)
     
     # 3. Align Timelines
     # Create a master timeline encompassing all statements
@@ -249,13 +293,15 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
         print("[M7.5B][WARN] Inputs empty. Emitting empty outputs.")
         return
 
-    timeline = pd.DataFrame({"Month_Index": all_months})
+    timeline = pd.Index(all_months, name="Month_Index")
     
-    # Merge onto timeline and fill monetary NaNs with 0.0 (safe assumption for missing months)
-    # Note: standardize_statement already handles numeric conversion and aggregation.
-    pl = timeline.merge(pl, on="Month_Index", how="left").fillna(0.0)
-    cf = timeline.merge(cf, on="Month_Index", how="left").fillna(0.0)
-    bs = timeline.merge(bs, on="Month_Index", how="left").fillna(0.0)
+    # Reindex onto timeline and fill missing months with 0.0 (safe assumption for missing months)
+    # Note: standardize_statement already handles numeric conversion and aggregation, so each
+    # statement is unique and sorted by month; a reindex is a plain positional gather, no hash join.
+    # The statements stay indexed by Month_Index until the FX rates are joined on.
+    pl = pl.set_index("Month_Index").reindex(timeline, fill_value=0.0)
+    cf = cf.set_index("Month_Index").reindex(timeline, fill_value=0.0)
+    bs = bs.set_index("Month_Index").reindex(timeline, fill_value=0.0)
 
     # 4. Consistency Checks and Reconciliation
     
@@ -272,12 +318,9 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
     if "Cash_and_Cash_Equivalents_NAD_000" in bs.columns:
         # Check if M5 provided Closing Cash and compare it
         if "Closing_Cash_NAD_000" in cf.columns:
-            merged_cash = cf[["Month_Index", "Closing_Cash_NAD_000"]].merge(
-                bs[["Month_Index", "Cash_and_Cash_Equivalents_NAD_000"]],
-                on="Month_Index", how="inner"
-            )
-            if not merged_cash.empty:
-                diff_cash = (merged_cash["Closing_Cash_NAD_000"] - merged_cash["Cash_and_Cash_Equivalents_NAD_000"]).abs().max()
+            # both statements sit on the same timeline, so the months already line up
+            if len(cf):
+                diff_cash = (cf["Closing_Cash_NAD_000"] - bs["Cash_and_Cash_Equivalents_NAD_000"]).abs().max()
                 if diff_cash > 1e-6:
                     msg = f"M5 Closing Cash mismatches M6 BS Cash (Max diff: {diff_cash:.6f}). Overriding M5 with M6 value."
                     print(f"[M7.5B][WARN] {msg}")
@@ -286,13 +329,8 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
             # Drop M5's closing cash
             cf = cf.drop(columns=["Closing_Cash_NAD_000"])
 
-        # Merge the authoritative cash balance from BS into the CF statement
-        cf = cf.merge(
-            bs[["Month_Index", "Cash_and_Cash_Equivalents_NAD_000"]].rename(
-                columns={"Cash_and_Cash_Equivalents_NAD_000": "Closing_Cash_NAD_000"}
-            ), 
-            on="Month_Index", how="left"
-        )
+        # Carry the authoritative cash balance from BS into the CF statement
+        cf["Closing_Cash_NAD_000"] = bs["Cash_and_Cash_Equivalents_NAD_000"]
         dbg["cash_reconciliation"] = "M6_BS_Cash_Authoritative"
         dbg["cf_bs_cash_link_ok"] = True
     elif strict:
@@ -300,23 +338,25 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
 
     # 5. Apply FX Translation (Fix for Failure 3: USD Columns)
     
-    # Merge FX rates
-    pl = pl.merge(fx_rate, on="Month_Index", how="left")
-    cf = cf.merge(fx_rate, on="Month_Index", how="left")
-    bs = bs.merge(fx_rate, on="Month_Index", how="left")
+    # Join FX rates on the month index, then restore Month_Index as the leading column
+    fx_by_month = fx_rate.set_index("Month_Index")
+    pl = pl.join(fx_by_month).reset_index()
+    cf = cf.join(fx_by_month).reset_index()
+    bs = bs.join(fx_by_month).reset_index()
 
     def translate_to_usd(df):
         if "FX_NAD_per_USD" not in df.columns:
             return df
         
         # Use the robustly handled rates (which might contain NaNs if filling failed)
-        rates = df["FX_NAD_per_USD"]
+        rates = df["FX_NAD_per_USD"].to_numpy(dtype=np.float64)
         nad_cols = [c for c in df.columns if c.endswith("_NAD_000")]
-        
-        for nad_col in nad_cols:
-            usd_col = nad_col.replace("_NAD_000", "_USD_000")
-            # USD = NAD / Rate. Division by NaN results in NaN.
-            df[usd_col] = df[nad_col] / rates
+        if not nad_cols:
+            return df
+
+        # USD = NAD / Rate for every NAD column in one broadcast divide. Division by NaN results in NaN.
+        usd_mat = df[nad_cols].to_numpy(dtype=np.float64) / rates[:, None]
+        df[[c.replace("_NAD_000", "_USD_000") for c in nad_cols]] = usd_mat
         return df
 
     pl = translate_to_usd(pl)
@@ -325,9 +365,12 @@ def run_m7_5b(outputs: str, currency: str = "NAD", strict: bool = True, diagnost
     dbg["fx_translation_applied"] = True
 
     # 6. Emit
-    (outputs / "m7_5b_profit_and_loss.parquet").write_bytes(pl.to_parquet(index=False))
-    (outputs / "m7_5b_cash_flow.parquet").write_bytes(cf.to_parquet(index=False))
-    (outputs / "m7_5b_balance_sheet.parquet").write_bytes(bs.to_parquet(index=False))
+    # Written straight to disk (no in-memory bytes copy); monthly statements are small, so each
+    # is a single row group, and zstd keeps the files compact for the M8/M9 readers.
+    for name, frame in (("m7_5b_profit_and_loss.parquet", pl), ("m7_5b_cash_flow.parquet", cf),
+                        ("m7_5b_balance_sheet.parquet", bs)):
+        frame.to_parquet(outputs / name, index=False, engine="pyarrow", compression="zstd",
+                         row_group_size=max(len(frame), 1))
 
     # 7. Debug/Smoke
     if "Total_Revenue_NAD_000" in pl.columns and (pl["Total_Revenue_NAD_000"] > 0).any():
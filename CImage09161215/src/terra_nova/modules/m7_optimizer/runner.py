@@ -4,8 +4,8 @@ Terra Nova — Module 7 (R1): Coarse ranking of investor offers.
 
 Reads the Input Pack sheet `Investor_500k_Offer_Grid`, normalizes sponsor-
 friendly metrics, computes a weighted score for each row, chooses exactly
-one offer (via OR-Tools CP-SAT if available, otherwise pure-Python argmax),
-and persists:
+one offer (argmax of the score; `solver_adapter.M7Model` stays available for
+constrained selections), and persists:
 
   - outputs/m7_r1_scores.csv
   - outputs/m7_r1_scores.parquet
@@ -29,13 +29,8 @@ from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
-
-# Optional: use our thin CP-SAT adapter if present (preferred path).
-try:
-    # Must live alongside this runner: src/terra_nova/modules/m7_optimizer/solver_adapter.py
-    from .solver_adapter import M7Model  # type: ignore
-except Exception:  # pragma: no cover - fallback only
-    M7Model = None  # sentinel -> fallback to argmax
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 # ------------------------
@@ -55,6 +50,20 @@ DEFAULT_WEIGHTS: Dict[str, float] = {
     "Exit_Refi_Multiple": 0.5,
 }
 
+# (input column, score column, smaller-is-better) in weighted-sum order
+SCORE_COMPONENTS = [
+    ("Valuation_Cap_NAD", "Score_Cap", True),
+    ("Discount_pct", "Score_Discount", False),
+    ("RevShare_preRefi_pct", "Score_RevShare", True),
+    ("Min_IRR_Floor_pct", "Score_IRRFloor", True),
+    ("Exit_Refi_Multiple", "Score_ExitMult", True),
+]
+
+OFFER_GRID_SHEET = "Investor_500k_Offer_Grid"
+# Parsed sheet kept next to the other outputs; reused while the workbook's path/mtime/size match
+OFFER_GRID_CACHE = "m7_r1_offer_grid.cache.parquet"
+_CACHE_KEY = b"terra_nova_source"
+
 REQUIRED_COLS = [
     "Option",
     "Instrument",
@@ -76,35 +85,60 @@ def _as_num(s: pd.Series) -> pd.Series:
     return pd.to_numeric(s, errors="coerce")
 
 
-def _minmax01(x: pd.Series) -> pd.Series:
-    """Safe min-max normalization to [0,1]; constant series -> 0."""
-    x = _as_num(x)
-    mn = x.min(skipna=True)
-    mx = x.max(skipna=True)
-    denom = (mx - mn)
-    if pd.isna(mn) or pd.isna(mx) or float(denom) == 0.0:
-        return pd.Series(np.zeros(len(x), dtype=float), index=x.index)
-    return (x - mn) / denom
-
-
-def _normalize_better_low(x: pd.Series) -> pd.Series:
+def _normalize_components(df: pd.DataFrame) -> np.ndarray:
     """
-    Normalize where SMALLER is better: score = 1 - minmax(x_worstfill)
-    Missing values are pessimistically filled with the column max (worst).
+    All SCORE_COMPONENTS normalized to [0,1] in one (n, k) float64 pass.
+    Missing values are pessimistically filled with the column's worst value (max where
+    SMALLER is better, min where LARGER is better), then min-max scaled; a constant or
+    all-NaN column scales to 0. SMALLER-is-better columns are inverted: 1 - minmax.
     """
-    x = _as_num(x)
-    x_filled = x.fillna(x.max(skipna=True))
-    return 1.0 - _minmax01(x_filled)
-
-
-def _normalize_better_high(x: pd.Series) -> pd.Series:
+    x = np.column_stack([_as_num(df[c]).to_numpy(dtype=np.float64) for c, _, _ in SCORE_COMPONENTS])
+    low = np.array([lower for _, _, lower in SCORE_COMPONENTS])
+    if not len(x):
+        return x
+    # the worst-fill never moves a column's extremes, so one min/max per column serves both steps
+    mn = np.fmin.reduce(x, axis=0)
+    mx = np.fmax.reduce(x, axis=0)
+    x = np.where(np.isnan(x), np.where(low, mx, mn), x)
+    denom = mx - mn
+    ok = ~np.isnan(mn) & ~np.isnan(mx) & (denom != 0.0)
+    scaled = np.where(ok, (x - mn) / np.where(ok, denom, 1.0), 0.0)
+    return np.where(low, 1.0 - scaled, scaled)
+
+
+def _load_offer_grid(input_pack_xlsx: str, out: Path) -> pd.DataFrame:
     """
-    Normalize where LARGER is better: score = minmax(x_bestfill)
-    Missing values are pessimistically filled with the column min (worst).
+    `Investor_500k_Offer_Grid` as pd.read_excel returns it. The parsed sheet is cached as parquet
+    in `out`, keyed by the workbook's path + mtime + size, so re-runs skip the openpyxl parse.
+    The cache is best-effort: any problem reading or writing it falls back to the workbook.
     """
-    x = _as_num(x)
-    x_filled = x.fillna(x.min(skipna=True))
-    return _minmax01(x_filled)
+    src = Path(input_pack_xlsx)
+    st = src.stat()
+    key = f"{src.resolve()}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8")
+    cache = out / OFFER_GRID_CACHE
+
+    if cache.exists():
+        try:
+            tbl = pq.read_table(cache)
+            if (tbl.schema.metadata or {}).get(_CACHE_KEY) == key:
+                df = tbl.to_pandas()
+                # parquet nulls come back as None in object columns; read_excel gives NaN
+                for c in df.columns:
+                    if df[c].dtype == object and df[c].hasnans:
+                        df[c] = df[c].where(df[c].notna(), np.nan)
+                return df
+        except Exception:
+            pass
+
+    df = pd.read_excel(src, sheet_name=OFFER_GRID_SHEET)
+    if all(isinstance(c, str) for c in df.columns):  # parquet would stringify other headers
+        try:
+            tbl = pa.Table.from_pandas(df, preserve_index=False)
+            tbl = tbl.replace_schema_metadata({**(tbl.schema.metadata or {}), _CACHE_KEY: key})
+            pq.write_table(tbl, cache)
+        except Exception:
+            pass
+    return df
 
 
 def _df_to_markdown(df: pd.DataFrame) -> str:
@@ -143,12 +177,8 @@ def _build_scores(df: pd.DataFrame, weights: Dict[str, float]) -> pd.DataFrame:
         if c not in df.columns:
             df[c] = np.nan
 
-    # Normalize components
-    cap = _normalize_better_low(df["Valuation_Cap_NAD"])
-    disc = _normalize_better_high(df["Discount_pct"])
-    rs = _normalize_better_low(df["RevShare_preRefi_pct"])
-    irr = _normalize_better_low(df["Min_IRR_Floor_pct"])
-    exitm = _normalize_better_low(df["Exit_Refi_Multiple"])
+    # Normalize components (columns follow SCORE_COMPONENTS)
+    norm = _normalize_components(df)
 
     # Weights (rescaled defensively to sum to 1.0 if they don't already)
     w = {k: float(weights.get(k, 0.0)) for k in DEFAULT_WEIGHTS.keys()}
@@ -156,23 +186,16 @@ def _build_scores(df: pd.DataFrame, weights: Dict[str, float]) -> pd.DataFrame:
     w = {k: v / w_sum for k, v in w.items()}
 
     # Weighted total in [0,1], then scale to 0..100
-    total01 = (
-        w["Valuation_Cap_NAD"] * cap
-        + w["Discount_pct"] * disc
-        + w["RevShare_preRefi_pct"] * rs
-        + w["Min_IRR_Floor_pct"] * irr
-        + w["Exit_Refi_Multiple"] * exitm
-    )
-    total = (total01 * 100.0).astype(float)
+    # (summed left to right so totals round exactly as before)
+    total01 = np.zeros(len(norm))
+    for j, (col, _, _) in enumerate(SCORE_COMPONENTS):
+        total01 = total01 + w[col] * norm[:, j]
+    total = total01 * 100.0
 
     # Keep original fields + component columns
     out = df[REQUIRED_COLS].copy()
-    out["Score_Cap"] = (cap * 100).round(2)
-    out["Score_Discount"] = (disc * 100).round(2)
-    out["Score_RevShare"] = (rs * 100).round(2)
-    out["Score_IRRFloor"] = (irr * 100).round(2)
-    out["Score_ExitMult"] = (exitm * 100).round(2)
-    out["Total_Score_0_100"] = total.round(2)
+    out[[score for _, score, _ in SCORE_COMPONENTS]] = np.round(norm * 100, 2)
+    out["Total_Score_0_100"] = np.round(total, 2)
 
     # Make sure Option/Instrument are strings (avoid NaN in MD)
     out["Option"] = out["Option"].fillna("").astype(str)
@@ -186,35 +209,11 @@ def _solve_choose_one(scores: pd.DataFrame) -> int:
     Choose exactly one row maximizing Total_Score_0_100.
     Returns a *positional* index (0..n-1).
     """
-    # Fallback if adapter is missing
-    if M7Model is None:
-        # pick argmax safely
-        pos = int(scores["Total_Score_0_100"].fillna(-1e9).to_numpy().argmax())
-        return pos
-
-    # CP-SAT model (tiny)
-    model = M7Model()
-    n = len(scores)
-    x = [model.bool_var(f"x_{i}") for i in range(n)]
-    # exactly one
-    model.add(sum(x) == 1)
-
-    # integerized objective
-    ints = (scores["Total_Score_0_100"].fillna(0.0) * 1000).round().astype(int).tolist()
-    model.maximize(sum(x[i] * ints[i] for i in range(n)))
-
-    solver, status, _vals = model.solve(seconds=5)
-
-    chosen = None
-    for i in range(n):
-        if solver.Value(x[i]) == 1:
-            chosen = i
-            break
-
-    if chosen is None:
-        # Fallback to Python argmax if solver didn’t decide
-        chosen = int(scores["Total_Score_0_100"].fillna(-1e9).to_numpy().argmax())
-    return chosen
+    # "Exactly one" with a linear objective and no other constraints is an argmax: no CP-SAT
+    # model is needed (ties go to the first row). Missing scores never win.
+    if not len(scores):
+        return -1
+    return int(np.asarray(scores["Total_Score_0_100"].fillna(-1e9), dtype=np.float64).argmax())
 
 
 # ------------------------
@@ -234,7 +233,7 @@ def run_m7_r1(
     out.mkdir(parents=True, exist_ok=True)
 
     # 1) Ingest the grid (drop fully empty rows)
-    df = pd.read_excel(input_pack_xlsx, sheet_name="Investor_500k_Offer_Grid")
+    df = _load_offer_grid(input_pack_xlsx, out)
     df = df.dropna(how="all").copy()
 
     # 2) Score & select
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory M2 → M3 → M4 pipeline
+-------------------------------
+Runs the three stages back to back, handing the M2 frames straight to M3/M4 instead of
+re-reading m2_*.parquet from disk. Every artifact of the standalone runners is still
+written (M5+ read them), but on a background thread so each stage's parquet writes
+overlap the next stage's compute.
+
+Equivalent to:
+    run_m2(out, currency, input_pack=input_xlsx)
+    run_m3(input_xlsx, out, currency)
+    run_m4(input_xlsx, out, currency)
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+from terra_nova.modules.m2_working_capital_pl.runner import compute_m2, load_m2_inputs, write_m2
+from terra_nova.modules.m3_financing.runner import compute_m3, load_m3_inputs, write_m3
+from terra_nova.modules.m4_tax.runner import compute_m4, load_m4_inputs, write_m4
+
+
+def run_pipeline(input_xlsx: str | Path | None,
+                 out_dir: str | Path,
+                 currency: str = "NAD",
+                 *,
+                 diagnostic: bool = False) -> Dict[str, object]:
+    """
+    M2 → M4 with in-memory hand-off. Returns {"m3": <run_m3 result>, "m4": <run_m4 result>}.
+    Raises whatever the underlying stage raises; a failed background write re-raises here.
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    # M2 (also materialises m0_inputs/Working_Capital_Tax.parquet for M4 if needed)
+    rev, dep, policies = load_m2_inputs(out, input_xlsx)
+    wc, pl_stub = compute_m2(rev, dep, policies[:4])
+
+    with ThreadPoolExecutor(max_workers=1) as ex:  # one writer keeps artifact order deterministic
+        w2 = ex.submit(write_m2, out, wc, pl_stub, policies, diagnostic=diagnostic)
+
+        # M3: M0/M1 inputs from disk, M2 frames from memory
+        cal, m1_capex, _, _, fin_stack = load_m3_inputs(out, with_m2=False)
+        rev3, fin_index, ins, monthly_rate = compute_m3(cal, m1_capex, wc, pl_stub, fin_stack)
+        w3 = ex.submit(write_m3, out, rev3, fin_index, ins, monthly_rate)
+
+        # M4 (calendar from the M3 load above)
+        _, _, wct = load_m4_inputs(out, with_m2=False)
+        tax, summ, rate = compute_m4(cal, pl_stub, wct)
+        w4 = ex.submit(write_m4, out, tax, summ, rate)
+
+        w2.result()
+        return {"m3": w3.result(), "m4": w4.result()}
@@ -0,0 +1,73 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+import pandas as pd
+
+# Ensure src/ is on sys.path for direct test runs
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from terra_nova.modules.m0_setup.runner import run_m0
+from terra_nova.modules.m1_operational_engines.runner import run_m1
+from terra_nova.modules.m2_working_capital_pl.runner import run_m2
+from terra_nova.modules.m3_financing.runner import run_m3
+from terra_nova.modules.m4_tax.runner import run_m4
+from terra_nova.modules.pipeline import run_pipeline
+
+INPUT_PACK = ROOT / "InputPack" / "TerraNova_Input_Pack_v10_0.xlsx"
+
+@unittest.skipUnless(INPUT_PACK.exists(), f"sample Input Pack missing: {INPUT_PACK}")
+class TestPipelineFull(unittest.TestCase):
+    """run_pipeline must emit exactly what run_m2 -> run_m3 -> run_m4 emit on the sample pack."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(cls._tmp.name)
+        base = tmp / "base"
+        run_m0(str(INPUT_PACK), str(base))
+        run_m1(INPUT_PACK, base)
+        cls.before = {p.relative_to(base) for p in base.rglob("*") if p.is_file()}
+
+        cls.seq = tmp / "sequential"
+        cls.pipe = tmp / "pipeline"
+        shutil.copytree(base, cls.seq)
+        shutil.copytree(base, cls.pipe)
+        run_m2(cls.seq, "NAD", input_pack=INPUT_PACK)
+        cls.seq_res = {"m3": run_m3(str(INPUT_PACK), str(cls.seq), "NAD"),
+                       "m4": run_m4(str(INPUT_PACK), str(cls.seq), "NAD")}
+        cls.pipe_res = run_pipeline(INPUT_PACK, cls.pipe, "NAD")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _artifacts(self, out: Path):
+        return {p.relative_to(out) for p in out.rglob("*") if p.is_file()} - self.before
+
+    def test_same_artifacts(self):
+        emitted = self._artifacts(self.seq)
+        self.assertTrue({Path("m2_working_capital_schedule.parquet"), Path("m3_revolver_schedule.parquet"),
+                         Path("m4_tax_schedule.parquet")} <= emitted)
+        self.assertSetEqual(emitted, self._artifacts(self.pipe))
+
+    def test_same_results(self):
+        self.assertDictEqual(self.seq_res, self.pipe_res)
+
+    def test_same_contents(self):
+        for rel in sorted(self._artifacts(self.seq)):
+            a, b = self.seq / rel, self.pipe / rel
+            with self.subTest(artifact=str(rel)):
+                if rel.suffix == ".parquet":
+                    pd.testing.assert_frame_equal(pd.read_parquet(a), pd.read_parquet(b), check_exact=True)
+                else:
+                    # text artifacts may name their own output folder
+                    self.assertEqual(a.read_text(encoding="utf-8").replace(str(self.seq), "<out>"),
+                                     b.read_text(encoding="utf-8").replace(str(self.pipe), "<out>"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from terra_nova.modules.common import file_version, float64_or_zero, numeric_or_zero
+
+class TestFileVersion(unittest.TestCase):
+    def test_rewrite_with_same_mtime_changes_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.parquet"
+            path.write_bytes(b"x" * 10)
+            before = file_version(path)
+            # in place, then via replace(), both stamped back to the original mtime
+            path.write_bytes(b"y" * 11)
+            os.utime(path, ns=(before[0], before[0]))
+            in_place = file_version(path)
+            tmp_path = Path(tmp) / "a.tmp"
+            tmp_path.write_bytes(b"z" * 11)
+            os.utime(tmp_path, ns=(before[0], before[0]))
+            tmp_path.replace(path)
+            replaced = file_version(path)
+        self.assertEqual(len({before, in_place, replaced}), 3)
+        self.assertEqual(before[0], replaced[0])
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            file_version(Path(tempfile.gettempdir()) / "definitely-missing.parquet")
+
+def _samples():
+    return [
+        pd.Series([1, 2, 3]),
+        pd.Series([1.5, np.nan, np.inf]),
+        pd.Series(np.array([1.5, np.nan], dtype=np.float32)),
+        pd.Series([True, False]),
+        pd.Series(["1.5", "x", None, 4]),
+        pd.Series([1, None], dtype="Int64"),
+        pd.Series([], dtype=float),
+    ]
+
+class TestNumericCoercion(unittest.TestCase):
+    def test_numeric_or_zero_matches_to_numeric_fillna(self):
+        for s in _samples():
+            with self.subTest(dtype=str(s.dtype)):
+                ref = pd.to_numeric(s, errors="coerce").fillna(0.0)
+                pd.testing.assert_series_equal(numeric_or_zero(s), ref, check_exact=True)
+
+    def test_numeric_or_zero_clean_column_is_not_copied(self):
+        s = pd.Series([1.0, 2.0])
+        self.assertIs(numeric_or_zero(s), s)
+
+    def test_float64_or_zero_matches_to_numeric_fillna(self):
+        for s in _samples():
+            with self.subTest(dtype=str(s.dtype)):
+                ref = pd.to_numeric(s, errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+                got = float64_or_zero(s)
+                self.assertEqual(got.dtype, np.float64)
+                np.testing.assert_array_equal(got, ref)
+
+    def test_float64_or_zero_returns_a_copy(self):
+        s = pd.Series([1.0, np.nan])
+        got = float64_or_zero(s)
+        got[0] = 99.0
+        self.assertEqual(s.iloc[0], 1.0)
+        self.assertTrue(np.isnan(s.iloc[1]))
+
+if __name__ == "__main__":
+    unittest.main()
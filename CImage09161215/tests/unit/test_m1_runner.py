@@ -0,0 +1,29 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from terra_nova.modules.m1_operational_engines.runner import _write
+
+class TestWrite(unittest.TestCase):
+    def test_nad_columns_round_trip_exactly(self):
+        # 12349 / 12 is not representable in float32; the stored schedule must still sum back to target
+        df = pd.DataFrame({"Month_Index": np.arange(1, 13), "Monthly_OPEX_NAD_000": np.full(12, 12349 / 12)})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "m1_opex_schedule.parquet"
+            _write(df, path)
+            got = pd.read_parquet(path)
+        self.assertEqual(got["Monthly_OPEX_NAD_000"].dtype, np.float64)
+        pd.testing.assert_frame_equal(got, df, check_exact=True)
+        self.assertAlmostEqual(got["Monthly_OPEX_NAD_000"].sum(), 12349.0, places=9)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import tempfile
+import unittest
+import numpy as np
+import openpyxl
+import pandas as pd
+from terra_nova.modules.common import dedup_headers
+from terra_nova.modules.m2_working_capital_pl.runner import _materialize_wct_parquet, _sum_by_month
+
+def _groupby_ref(df, value_col="V"):
+    return df.groupby("Month_Index")[value_col].sum()
+
+class TestSumByMonth(unittest.TestCase):
+    def test_gapped_months_keep_only_present_months(self):
+        df = pd.DataFrame({"Month_Index": [5, 1, 5, 3, 1], "V": [1.0, 2.0, 3.0, 4.0, 0.5]})
+        got = _sum_by_month(df, "Month_Index", "V")
+        pd.testing.assert_series_equal(got, _groupby_ref(df), check_exact=True)
+        self.assertListEqual(got.index.tolist(), [1, 3, 5])
+
+    def test_negative_keys_use_groupby(self):
+        df = pd.DataFrame({"Month_Index": [-1, 0, -1, 2], "V": [1.0, 2.0, 3.0, 4.0]})
+        got = _sum_by_month(df, "Month_Index", "V")
+        pd.testing.assert_series_equal(got, _groupby_ref(df), check_exact=True)
+        self.assertListEqual(got.tolist(), [4.0, 2.0, 4.0])
+
+    def test_missing_keys_and_values_use_groupby(self):
+        df = pd.DataFrame({"Month_Index": [1.0, np.nan, 1.0, 2.0], "V": [1.0, 9.0, np.nan, 4.0]})
+        got = _sum_by_month(df, "Month_Index", "V")
+        pd.testing.assert_series_equal(got, _groupby_ref(df), check_exact=True)
+        self.assertListEqual(got.tolist(), [1.0, 4.0])  # NaN month dropped, NaN value skipped
+
+    def test_bincount_agrees_with_groupby_to_rounding(self):
+        # bincount adds in row order; groupby uses compensated summation, so the last bits may differ
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"Month_Index": rng.integers(1, 61, 3000), "V": rng.normal(size=3000) * 1e5})
+        got = _sum_by_month(df, "Month_Index", "V")
+        ref = _groupby_ref(df)
+        self.assertListEqual(got.index.tolist(), ref.index.tolist())
+        np.testing.assert_allclose(got.to_numpy(), ref.to_numpy(), rtol=0, atol=1e-6)
+
+    def test_float32_values_sum_as_float64(self):
+        vals = np.array([0.1, 0.2, 0.3, 1e6, 1e-3], dtype=np.float32)
+        df = pd.DataFrame({"Month_Index": [1, 1, 1, 2, 2], "V": vals})
+        got = _sum_by_month(df, "Month_Index", "V")
+        self.assertEqual(got.dtype, np.float64)
+        ref = _groupby_ref(df.astype({"V": np.float64}))
+        pd.testing.assert_series_equal(got, ref, check_exact=True)
+        # the groupby fallback widens too
+        df.loc[4, "V"] = np.nan
+        self.assertEqual(_sum_by_month(df, "Month_Index", "V").dtype, np.float64)
+
+class TestDedupHeaders(unittest.TestCase):
+    def test_matches_read_excel_mangling(self):
+        self.assertListEqual(dedup_headers(["A", "A", "B", "A"]), ["A", "A.1", "B", "A.2"])
+        # a generated name that is already taken gets its own suffix, as pandas does
+        self.assertListEqual(dedup_headers(["A", "A.1", "A"]), ["A", "A.1", "A.1.1"])
+        self.assertListEqual(dedup_headers(["A", "A", "A.1"]), ["A", "A.1", "A.1.1"])
+
+class TestMaterializeWct(unittest.TestCase):
+    def test_repeated_header_matches_read_excel(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            xlsx = tmp / "pack.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Working_Capital_Tax"
+            ws.append(["Parameter", "Value", "Value", None])
+            ws.append(["Tax_Rate", 28, 30, "note"])
+            ws.append(["AR_Days", 21, 25, None])
+            wb.save(xlsx)
+
+            out = tmp / "outputs"
+            self.assertTrue(_materialize_wct_parquet(xlsx, out))
+            got = pd.read_parquet(out / "m0_inputs" / "Working_Capital_Tax.parquet")
+            ref = pd.read_excel(xlsx, sheet_name="Working_Capital_Tax")
+
+        self.assertListEqual(list(got.columns), list(ref.columns))
+        self.assertListEqual(list(got.columns), ["Parameter", "Value", "Value.1", "Unnamed: 3"])
+        self.assertListEqual(got["Value.1"].tolist(), [30, 25])
+
+if __name__ == "__main__":
+    unittest.main()
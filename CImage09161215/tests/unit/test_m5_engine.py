@@ -0,0 +1,73 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from terra_nova.modules.m5_cash_flow.engine import _cached_read_parquet, _median_is_positive, _read_parquet
+
+class TestReadParquetCache(unittest.TestCase):
+    def setUp(self):
+        _cached_read_parquet.cache_clear()
+
+    def test_rewrite_with_same_mtime_is_not_served_stale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "m2_pl_schedule.parquet"
+            pd.DataFrame({"Month_Index": [1, 2], "V": [1.0, 2.0]}).to_parquet(path, index=False)
+            st = os.stat(path)
+            self.assertListEqual(_read_parquet(path)["V"].tolist(), [1.0, 2.0])
+
+            # rewritten within the filesystem's mtime granularity
+            pd.DataFrame({"Month_Index": [1, 2, 3], "V": [5.0, 6.0, 7.0]}).to_parquet(path, index=False)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.assertEqual(os.stat(path).st_mtime_ns, st.st_mtime_ns)
+            self.assertListEqual(_read_parquet(path)["V"].tolist(), [5.0, 6.0, 7.0])
+
+    def test_unchanged_file_is_decoded_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "m2_pl_schedule.parquet"
+            pd.DataFrame({"Month_Index": [1], "V": [1.0]}).to_parquet(path, index=False)
+            _read_parquet(path)
+            _read_parquet(path)
+        info = _cached_read_parquet.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+class TestMedianIsPositive(unittest.TestCase):
+    def test_edge_cases(self):
+        cases = {
+            "empty": ([], False),
+            "single positive": ([2.0], True),
+            "single zero": ([0.0], False),
+            "mostly zero capex": ([0.0, 0.0, 0.0, 5.0, 7.0], False),
+            "odd, middle positive": ([-1.0, 3.0, 4.0], True),
+            "even, straddles zero, positive mean": ([-1.0, -1.0, 3.0, 4.0], True),
+            "even, straddles zero, negative mean": ([-5.0, -3.0, 1.0, 4.0], False),
+            "even, straddles zero, exact zero": ([-3.0, -1.0, 1.0, 5.0], False),
+            "even, middle is zero and positive": ([0.0, 0.0, 1e-9, 2.0], True),
+            "all negative": ([-3.0, -2.0], False),
+        }
+        for name, (vals, want) in cases.items():
+            a = np.array(vals, dtype=np.float64)
+            with self.subTest(case=name):
+                self.assertIs(_median_is_positive(a), want)
+                if a.size:
+                    self.assertEqual(want, bool(np.median(a) > 0))
+
+    def test_matches_np_median_on_random_arrays(self):
+        rng = np.random.default_rng(7)
+        for _ in range(500):
+            n = int(rng.integers(1, 40))
+            # integer-valued draws with many zeros hit every branch, including exact ties
+            a = rng.integers(-3, 4, n).astype(np.float64) * rng.choice([0.0, 1.0], n, p=[0.4, 0.6])
+            self.assertEqual(_median_is_positive(a), bool(np.median(a) > 0), msg=str(a.tolist()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import unittest
+import numpy as np
+import pandas as pd
+from terra_nova.modules.m5_cash_flow.engine0915 import _ROLE_SYNS, _gather, _resolve_all
+
+def _reindex_ref(months, comp, col):
+    vals = pd.to_numeric(comp[col], errors="coerce").fillna(0.0)
+    return vals.groupby(comp["Month_Index"]).sum().reindex(months, fill_value=0.0).to_numpy(dtype=np.float64)
+
+class TestGather(unittest.TestCase):
+    def test_unique_months_with_gaps_and_extras(self):
+        months = np.array([1, 2, 3, 4, 5])
+        # month 2 and 5 missing, month 9 outside the spine, unsorted rows
+        comp = pd.DataFrame({"Month_Index": [4, 1, 9, 3], "V": [4.0, 1.0, 9.0, 3.0]})
+        got = _gather(months, comp, "V")
+        self.assertEqual(got.dtype, np.float64)
+        self.assertListEqual(got.tolist(), [1.0, 0.0, 3.0, 4.0, 0.0])
+        np.testing.assert_array_equal(got, _reindex_ref(months, comp, "V"))
+
+    def test_duplicate_months_are_summed(self):
+        months = np.array([1, 2, 3])
+        comp = pd.DataFrame({"Month_Index": [1, 1, 3, 3, 3], "V": [1.0, 2.0, 0.5, 0.25, 0.25]})
+        got = _gather(months, comp, "V")
+        self.assertListEqual(got.tolist(), [3.0, 0.0, 1.0])
+        np.testing.assert_array_equal(got, _reindex_ref(months, comp, "V"))
+
+    def test_non_numeric_and_missing_cells_are_zero(self):
+        months = np.array([1, 2, 3])
+        comp = pd.DataFrame({"Month_Index": [1, 2, 3], "V": ["1.5", "n/a", None]})
+        np.testing.assert_array_equal(_gather(months, comp, "V"), [1.5, 0.0, 0.0])
+
+    def test_float32_is_widened(self):
+        months = np.array([1, 2])
+        comp = pd.DataFrame({"Month_Index": [1, 2], "V": np.array([0.1, np.nan], dtype=np.float32)})
+        got = _gather(months, comp, "V")
+        self.assertEqual(got.dtype, np.float64)
+        np.testing.assert_array_equal(got, [np.float64(np.float32(0.1)), 0.0])
+
+    def test_empty_component_gives_zeros(self):
+        months = np.array([1, 2, 3])
+        comp = pd.DataFrame({"Month_Index": pd.Series([], dtype=np.int64), "V": pd.Series([], dtype=float)})
+        np.testing.assert_array_equal(_gather(months, comp, "V"), np.zeros(3))
+
+def _first_present(names, syns):
+    # the per-role scan _resolve_all replaced: first synonym in list order that is a column
+    present = set(names)
+    return next((c for c in syns if c in present), None)
+
+class TestResolveAll(unittest.TestCase):
+    def test_earlier_synonym_wins_regardless_of_column_order(self):
+        names = ["month", "NPAT", "Month_Index", "Net_Profit_After_Tax_NAD_000"]
+        found = _resolve_all(names, ("month", "npat"))
+        self.assertDictEqual(found, {"month": "Month_Index", "npat": "Net_Profit_After_Tax_NAD_000"})
+
+    def test_absent_role_is_none_and_unrequested_roles_are_ignored(self):
+        found = _resolve_all(["Month_Index", "NPAT_NAD_000", "Other"], ("month", "da"))
+        self.assertDictEqual(found, {"month": "Month_Index", "da": None})
+        self.assertDictEqual(_resolve_all([], ("npat",)), {"npat": None})
+
+    def test_matching_is_exact(self):
+        # case/spacing variants are not synonyms unless listed
+        self.assertIsNone(_resolve_all(["npat_nad_000", " NPAT"], ("npat",))["npat"])
+
+    def test_matches_first_present_scan(self):
+        roles = tuple(_ROLE_SYNS)
+        pool = sorted({c for syns in _ROLE_SYNS.values() for c in syns} | {"Currency", "Case_Name", "X"})
+        rng = np.random.default_rng(3)
+        for _ in range(300):
+            names = list(rng.choice(pool, size=int(rng.integers(0, len(pool))), replace=False))
+            found = _resolve_all(names, roles)
+            for role in roles:
+                self.assertEqual(found[role], _first_present(names, _ROLE_SYNS[role]), msg=f"{role}: {names}")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,16 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
 import unittest
+import numpy as np
 import pandas as pd
-from terra_nova.modules.m6_balance_sheet.engine import compute_balance_sheet
+from terra_nova.modules.m6_balance_sheet.engine import _align, _gather, compute_balance_sheet, derive_tax_payable
 
 class TestM6Engine(unittest.TestCase):
     def test_compute_balance_sheet_minimal(self):
@@ -32,5 +42,76 @@ class TestM6Engine(unittest.TestCase):
         diff = (bs["Assets_Total_NAD_000"] - bs["Liabilities_And_Equity_Total_NAD_000"]).abs().max()
         self.assertLessEqual(diff, 1e-6)
 
+class TestDeriveTaxPayable(unittest.TestCase):
+    def _bs_tax(self, m4_tax):
+        months = m4_tax["Month_Index"]
+        m2_pl = pd.DataFrame({"Month_Index": months, "NPAT_NAD_000": 0.0})
+        m2_wc = pd.DataFrame({"Month_Index": months, "Cash_Flow_from_NWC_Change_NAD_000": 0.0})
+        m3_debt = pd.DataFrame({"Month_Index": months, "Outstanding_Balance_NAD_000": 0.0})
+        bs = compute_balance_sheet(m2_pl, m2_wc, m3_debt, m4_tax, "NAD")
+        return bs["Tax_Payable_NAD_000"].to_numpy()
+
+    def test_explicit_payable_wins(self):
+        tax = pd.DataFrame({"Month_Index": [1, 2], "Tax_Payable_NAD_000": [1.0, None],
+                            "Tax_Expense_NAD_000": [5.0, 5.0], "Tax_Paid_NAD_000": [0.0, 0.0]})
+        got = derive_tax_payable(tax)
+        self.assertListEqual(got.tolist(), [1.0, 0.0])
+        np.testing.assert_array_equal(got.to_numpy(), self._bs_tax(tax))
+
+    def test_cumulates_expense_minus_paid(self):
+        tax = pd.DataFrame({"Month_Index": [1, 2, 3], "Tax_Expense_NAD_000": [3.0, 1.0, 0.0],
+                            "Tax_Paid_NAD_000": [0.0, 2.0, "x"]}, index=[10, 11, 12])
+        got = derive_tax_payable(tax)
+        self.assertListEqual(got.index.tolist(), [10, 11, 12])
+        self.assertListEqual(got.tolist(), [3.0, 2.0, 2.0])
+        np.testing.assert_array_equal(got.to_numpy(), self._bs_tax(tax))
+
+    def test_no_tax_columns_gives_zeros(self):
+        tax = pd.DataFrame({"Month_Index": [1, 2], "Other": [1.0, 2.0]})
+        self.assertListEqual(derive_tax_payable(tax).tolist(), [0.0, 0.0])
+
+class TestAlignGather(unittest.TestCase):
+    def _aligned(self, src, target):
+        rows, hit = _align(src, "Month_Index", target)
+        return _gather(src["V"].to_numpy(dtype=float), rows, hit)
+
+    def _reindex_ref(self, src, target):
+        # the set_index/reindex alignment _align replaced
+        return src.set_index(src["Month_Index"].astype(int)).reindex(target)["V"].fillna(0.0).to_numpy()
+
+    def test_sorted_with_gaps_and_extras(self):
+        src = pd.DataFrame({"Month_Index": [1, 3, 4, 9], "V": [1.0, 3.0, 4.0, 9.0]})
+        target = np.array([1, 2, 3, 4, 5])
+        got = self._aligned(src, target)
+        self.assertListEqual(got.tolist(), [1.0, 0.0, 3.0, 4.0, 0.0])
+        np.testing.assert_array_equal(got, self._reindex_ref(src, target))
+
+    def test_unsorted_source(self):
+        src = pd.DataFrame({"Month_Index": [4, 1, 3, 0], "V": [4.0, 1.0, 3.0, 0.5]}, index=[7, 8, 9, 10])
+        target = np.array([0, 1, 2, 3, 4, 5])
+        np.testing.assert_array_equal(self._aligned(src, target), self._reindex_ref(src, target))
+
+    def test_target_beyond_last_source_month(self):
+        src = pd.DataFrame({"Month_Index": [1, 2], "V": [1.0, 2.0]})
+        target = np.array([2, 3, 100])
+        self.assertListEqual(self._aligned(src, target).tolist(), [2.0, 0.0, 0.0])
+
+    def test_float_month_column(self):
+        src = pd.DataFrame({"Month_Index": [2.0, 1.0], "V": [2.0, 1.0]})
+        self.assertListEqual(self._aligned(src, np.array([1, 2])).tolist(), [1.0, 2.0])
+
+    def test_empty_source_gives_zeros(self):
+        src = pd.DataFrame({"Month_Index": pd.Series([], dtype=int), "V": pd.Series([], dtype=float)})
+        rows, hit = _align(src, "Month_Index", np.array([1, 2]))
+        self.assertFalse(hit.any())
+        np.testing.assert_array_equal(_gather(src["V"].to_numpy(), rows, hit), [0.0, 0.0])
+
+    def test_duplicate_source_months_raise_like_reindex(self):
+        src = pd.DataFrame({"Month_Index": [1, 2, 2], "V": [1.0, 2.0, 3.0]})
+        with self.assertRaises(ValueError):
+            _align(src, "Month_Index", np.array([1, 2]))
+        with self.assertRaises(ValueError):
+            self._reindex_ref(src, np.array([1, 2]))
+
 if __name__ == "__main__":
     unittest.main()
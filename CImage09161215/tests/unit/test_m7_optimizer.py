@@ -0,0 +1,83 @@
+# --- path bootstrap (must stay at the top) ---
+from pathlib import Path
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+# ---------------------------------------------
+
+import unittest
+import numpy as np
+import pandas as pd
+from terra_nova.modules.m7_optimizer.runner import SCORE_COMPONENTS, _normalize_components
+
+# the per-column pandas normalizers _normalize_components replaced
+def _minmax01(x):
+    x = pd.to_numeric(x, errors="coerce")
+    mn, mx = x.min(skipna=True), x.max(skipna=True)
+    if pd.isna(mn) or pd.isna(mx) or float(mx - mn) == 0.0:
+        return pd.Series(np.zeros(len(x)), index=x.index)
+    return (x - mn) / (mx - mn)
+
+def _series_ref(df):
+    cols = []
+    for c, _, lower in SCORE_COMPONENTS:
+        x = pd.to_numeric(df[c], errors="coerce")
+        cols.append(1.0 - _minmax01(x.fillna(x.max())) if lower else _minmax01(x.fillna(x.min())))
+    return np.column_stack([s.to_numpy(dtype=np.float64) for s in cols])
+
+def _grid(**overrides):
+    df = pd.DataFrame({
+        "Valuation_Cap_NAD": [1e6, 2e6, 3e6, 2.5e6],
+        "Discount_pct": [0.10, 0.20, 0.15, 0.05],
+        "RevShare_preRefi_pct": [0.02, 0.04, 0.03, 0.01],
+        "Min_IRR_Floor_pct": [0.12, 0.15, 0.18, 0.20],
+        "Exit_Refi_Multiple": [1.5, 2.0, 1.2, 1.8],
+    })
+    for c, v in overrides.items():
+        df[c] = v
+    return df
+
+class TestNormalizeComponents(unittest.TestCase):
+    def test_direction_and_range(self):
+        got = _normalize_components(_grid())
+        self.assertEqual(got.shape, (4, len(SCORE_COMPONENTS)))
+        self.assertTrue(((got >= 0.0) & (got <= 1.0)).all())
+        # smaller-is-better: lowest cap scores 1, highest 0; larger-is-better discount: the reverse
+        self.assertListEqual(got[:, 0].tolist(), [1.0, 0.5, 0.0, 0.25])
+        self.assertEqual(got[1, 1], 1.0)
+        self.assertEqual(got[3, 1], 0.0)
+
+    def test_missing_values_get_the_worst_score(self):
+        df = _grid(Valuation_Cap_NAD=[1e6, None, 3e6, "n/a"], Discount_pct=[0.10, np.nan, 0.15, 0.05])
+        got = _normalize_components(df)
+        self.assertListEqual(got[:, 0].tolist(), [1.0, 0.0, 0.0, 0.0])
+        self.assertEqual(got[1, 1], 0.0)
+        np.testing.assert_allclose(got, _series_ref(df), rtol=0, atol=1e-15)
+
+    def test_constant_and_all_missing_columns(self):
+        df = _grid(Valuation_Cap_NAD=5e6, Discount_pct=0.1, RevShare_preRefi_pct=np.nan,
+                   Exit_Refi_Multiple=[None] * 4)
+        got = _normalize_components(df)
+        # minmax of a degenerate column is 0: 1 where smaller is better, 0 where larger is better
+        self.assertListEqual(got[:, 0].tolist(), [1.0] * 4)
+        self.assertListEqual(got[:, 1].tolist(), [0.0] * 4)
+        self.assertListEqual(got[:, 2].tolist(), [1.0] * 4)
+        self.assertListEqual(got[:, 4].tolist(), [1.0] * 4)
+        np.testing.assert_array_equal(got, _series_ref(df))
+
+    def test_matches_series_normalizers_on_random_grids(self):
+        rng = np.random.default_rng(11)
+        for _ in range(50):
+            n = int(rng.integers(1, 30))
+            df = pd.DataFrame({c: rng.normal(size=n) * 10 for c, _, _ in SCORE_COMPONENTS})
+            df = df.mask(rng.random(df.shape) < 0.2)
+            np.testing.assert_allclose(_normalize_components(df), _series_ref(df), rtol=0, atol=1e-12)
+
+    def test_empty_grid(self):
+        got = _normalize_components(_grid().iloc[:0])
+        self.assertEqual(got.shape, (0, len(SCORE_COMPONENTS)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -210,26 +210,21 @@ def _load_m3_revolver(outputs: Path, strict: bool) -> Tuple[pd.DataFrame, Dict[s
         preview = list(df.columns)[:35]
         _fail(f"Cannot resolve revolver draw/repay columns. Tried draws={REV_DRAW_SYNS}, repay={REV_REPAY_SYNS}. Available (first 35): {preview}")
 
-    cff = df[[mcol]].copy()
-    cff.rename(columns={mcol:"Month_Index"}, inplace=True)
-    cff["CFF_NAD_000"] = 0.0
-    cff["CFF_NAD_000"] = cff["CFF_NAD_000"].astype(float)
+    # All legs come from the same rows, so CFF is plain array arithmetic built in one shot
+    def leg(col: str) -> np.ndarray:
+        return pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy()
+
     # Draws are inflows (+), repayments are outflows (−)
-    cff = cff.join(df[[dcol]].rename(columns={dcol:"_draw"})).join(df[[rcol]].rename(columns={rcol:"_repay"}))
-    cff["_draw"]  = pd.to_numeric(cff["_draw"], errors="coerce").fillna(0.0)
-    cff["_repay"] = pd.to_numeric(cff["_repay"], errors="coerce").fillna(0.0)
-    cff["CFF_NAD_000"] = cff["_draw"] - cff["_repay"]
+    cff_vals = leg(dcol) - leg(rcol)
     # fees often outflows; can be included in CFF or CFO – we include in CFF (project policy)
     fee_used = False
     if fcol is not None:
-        cff = cff.join(df[[fcol]].rename(columns={fcol:"_fees"}))
-        cff["_fees"] = pd.to_numeric(cff["_fees"], errors="coerce").fillna(0.0)
-        cff["CFF_NAD_000"] = cff["CFF_NAD_000"] - cff["_fees"]
+        cff_vals = cff_vals - leg(fcol)
         fee_used = True
     # Do not include interest (handled via P&L/CFO). If present we show in meta only.
     meta = {"rev_path": str(path), "month_col": mcol, "draw_col": dcol, "repay_col": rcol, "fee_col": fcol, "interest_col_present": icol is not None, "fees_included_in_cff": fee_used}
     _ok("CFF derived from M3 revolver schedule (draws − repayments − fees). Interest excluded by design.")
-    cff = cff[["Month_Index","CFF_NAD_000"]]
+    cff = pd.DataFrame({"Month_Index": df[mcol].to_numpy(), "CFF_NAD_000": cff_vals}, index=df.index)
     return cff, meta
 
 def _load_opening_cash(outputs: Path, base_months: pd.Series, strict: bool) -> Tuple[float, Dict[str, Any]]:
@@ -334,20 +329,18 @@ def build_cash_flow_statement(outputs_dir: str, currency: str, input_pack_path:
 
     # CFI from M1
     cfi, cfi_m = _load_m1_cfi(outputs, strict=strict)
-    cfi = cfi.merge(cfo[["Month_Index"]], on="Month_Index", how="right")
-    cfi["CFI_NAD_000"] = pd.to_numeric(cfi["CFI_NAD_000"], errors="coerce").fillna(0.0)
+    cfi["CFI_NAD_000"] = pd.to_numeric(cfi["CFI_NAD_000"], errors="coerce")
 
     # CFF from M3 revolver (draws − repayments − fees; interest excluded)
     cff, cff_m = _load_m3_revolver(outputs, strict=strict)
-    cff = cff.merge(cfo[["Month_Index"]], on="Month_Index", how="right")
-    cff["CFF_NAD_000"] = pd.to_numeric(cff["CFF_NAD_000"], errors="coerce").fillna(0.0)
+    cff["CFF_NAD_000"] = pd.to_numeric(cff["CFF_NAD_000"], errors="coerce")
 
     # Opening cash (policy default 0 if absent)
     opening_cash, open_m = _load_opening_cash(outputs, cfo["Month_Index"], strict=strict)
 
-    # Assemble final DF
+    # Assemble final DF: the one merge onto the timeline; months a leg lacks (or non-numeric cells) -> 0
     df = cfo.merge(cfi, on="Month_Index", how="left").merge(cff, on="Month_Index", how="left")
-    df[["CFI_NAD_000","CFF_NAD_000"]] = df[["CFI_NAD_000","CFF_NAD_000"]].fillna(0.0)
+    df = df.fillna({"CFI_NAD_000": 0.0, "CFF_NAD_000": 0.0})
 
     # simple smoke meta
     smoke = {
@@ -137,8 +137,8 @@ def compute_balance_sheet(
     df["Liabilities_And_Equity_Total_NAD_000"] = liab_eq_total
     df["Currency"] = currency
 
-    # Identity check
-    diff = (df["Assets_Total_NAD_000"] - df["Liabilities_And_Equity_Total_NAD_000"]).abs().max()
+    # Identity check on the raw arrays (fmax skips NaN, as Series.max did)
+    diff = np.fmax.reduce(np.abs(assets_total.to_numpy() - liab_eq_total.to_numpy()), initial=0.0)
     if diff > 1e-6:
         raise AssertionError(f"[M6] Balance sheet identity failed. Max abs diff={diff}")
 